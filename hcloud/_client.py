@@ -16,6 +16,7 @@ from .datacenters import DatacentersClient
 from .firewalls import FirewallsClient
 from .floating_ips import FloatingIPsClient
 from .images import ImagesClient
+from .inventory import Inventory, take_snapshot
 from .isos import IsosClient
 from .load_balancer_types import LoadBalancerTypesClient
 from .load_balancers import LoadBalancersClient
@@ -303,6 +304,18 @@ class Client:
         """
         return self._client.request(method, url, **kwargs)
 
+    def snapshot(self, *, concurrency: int = 10) -> Inventory:
+        """Fetch all the resources of the project concurrently, and return them as an
+        immutable inventory, indexed by ID and by name.
+
+        The collections and their pages are fetched in parallel, a snapshot takes
+        about as long as fetching the largest collection.
+
+        :param concurrency: Maximum number of requests sent concurrently.
+        :return: :class:`Inventory <hcloud.inventory.domain.Inventory>`
+        """
+        return take_snapshot(self, concurrency=concurrency)
+
     @property
     def datacenters(self) -> DatacentersClient:
         """DatacentersClient Instance
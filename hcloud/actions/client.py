@@ -2,10 +2,17 @@ from __future__ import annotations
 
 import time
 import warnings
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, Literal, NamedTuple
 
 from ..core import BoundModelBase, Meta, ResourceClientBase
-from .domain import Action, ActionFailedException, ActionStatus, ActionTimeoutException
+from .domain import (
+    Action,
+    ActionException,
+    ActionFailedException,
+    ActionStatus,
+    ActionTimeoutException,
+)
 
 if TYPE_CHECKING:
     from .._client import Client
@@ -184,6 +191,137 @@ class ResourceActionsClient(
         """
         return self._iter_pages(self.get_list, status=status, sort=sort)
 
+    def _poll_running(self, running: dict[int, BoundAction]) -> list[BoundAction]:
+        """
+        Updates the running Actions in place, with a single request per page of
+        Actions, and removes the finished Actions from ``running``.
+
+        :param running: Running Actions, indexed by ID.
+        :return: The Actions finished since the last update.
+        """
+        finished: list[BoundAction] = []
+        ids = list(running)
+        for start in range(0, len(ids), self.max_per_page):
+            chunk = ids[start : start + self.max_per_page]
+            response = self._client.request(
+                method="GET",
+                url=f"{self._resource}/actions",
+                params={"id": chunk, "per_page": len(chunk)},
+            )
+            for data in response["actions"]:
+                action = running.get(data["id"])
+                if action is None:
+                    continue
+
+                action.data_model = Action.from_dict(data)
+                action.complete = True
+                if action.status != Action.STATUS_RUNNING:
+                    del running[action.id]
+                    finished.append(action)
+        return finished
+
+    def wait_for_function(
+        self,
+        handle_update: Callable[[BoundAction], None],
+        actions: list[BoundAction],
+        *,
+        max_retries: int | None = None,
+    ) -> None:
+        """
+        Waits until all the given Actions are finished, polling all the running Actions
+        with a single request per page of Actions.
+
+        The ``handle_update`` function is called once for each Action, as soon as it is
+        finished (``status`` is ``success`` or ``error``). Exceptions raised by the
+        function interrupt the wait.
+
+        The Actions are updated in place.
+
+        :param handle_update: Function called with each finished Action.
+        :param actions: Actions to wait for.
+        :param max_retries: Specify how many retries will be performed before an ActionTimeoutException will be raised.
+        :raises: ActionTimeoutException when an Action is still in status==running after max_retries is reached.
+        """
+        if max_retries is None:
+            # pylint: disable=protected-access
+            max_retries = self._client._poll_max_retries
+
+        running = {action.id: action for action in actions}
+
+        retries = 0
+        while True:
+            for action in self._poll_running(running):
+                handle_update(action)
+
+            if not running:
+                return
+
+            retries += 1
+            if retries < max_retries:
+                # pylint: disable=protected-access
+                time.sleep(self._client._poll_interval_func(retries))
+                continue
+
+            raise ActionTimeoutException(action=next(iter(running.values())))
+
+    def wait_for(
+        self,
+        actions: list[BoundAction],
+        *,
+        max_retries: int | None = None,
+    ) -> None:
+        """
+        Waits until all the given Actions are finished, polling all the running Actions
+        with a single request per page of Actions.
+
+        The Actions are updated in place.
+
+        :param actions: Actions to wait for.
+        :param max_retries: Specify how many retries will be performed before an ActionTimeoutException will be raised.
+        :raises: ActionFailedException when an Action is finished with status==error
+        :raises: ActionTimeoutException when an Action is still in status==running after max_retries is reached.
+        """
+
+        def handle_update(action: BoundAction) -> None:
+            if action.status == Action.STATUS_ERROR:
+                raise ActionFailedException(action=action)
+
+        self.wait_for_function(handle_update, actions, max_retries=max_retries)
+
+    def wait_for_all(
+        self,
+        actions: list[BoundAction],
+        *,
+        max_retries: int | None = None,
+    ) -> dict[int, ActionException]:
+        """
+        Waits until all the given Actions are finished, polling all the running Actions
+        with a single request per page of Actions.
+
+        Unlike :meth:`wait_for`, a failed Action does not interrupt the wait for the
+        other Actions.
+
+        The Actions are updated in place.
+
+        :param actions: Actions to wait for.
+        :param max_retries: Specify how many retries will be performed before the running Actions time out.
+        :return: The exceptions of the failed or timed out Actions, indexed by Action ID.
+        """
+        errors: dict[int, ActionException] = {}
+
+        def handle_update(action: BoundAction) -> None:
+            if action.status == Action.STATUS_ERROR:
+                errors[action.id] = ActionFailedException(action=action)
+
+        try:
+            self.wait_for_function(handle_update, actions, max_retries=max_retries)
+        except ActionTimeoutException:
+            for action in actions:
+                if action.status == Action.STATUS_RUNNING:
+                    errors[action.id] = ActionTimeoutException(action=action)
+
+        return errors
+
 
 class ActionsClient(ResourceActionsClient):
     def __init__(self, client: Client):
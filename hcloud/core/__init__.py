@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from .client import BoundModelBase, ClientEntityBase, ResourceClientBase
 from .domain import BaseDomain, DomainIdentityMixin, Meta, Pagination
+from .pool import ResourcePoolBase
 
 __all__ = [
     "BaseDomain",
@@ -11,4 +12,5 @@ __all__ = [
     "Meta",
     "Pagination",
     "ResourceClientBase",
+    "ResourcePoolBase",
 ]
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Hashable, Iterable
+from typing import Any, ClassVar, Generic, TypeVar
+
+from .client import BoundModelBase
+
+__all__ = [
+    "ResourcePoolBase",
+]
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T", bound=BoundModelBase[Any])
+
+
+class ResourcePoolBase(Generic[K, T]):
+    """
+    Base of the pools keeping a number of resources ready for each key, refilled
+    concurrently, on demand or in a background thread.
+
+    The subclasses implement :meth:`_key`, :meth:`_describe` and :meth:`_create_many`.
+
+    :param name: Name of the pool.
+    :param keys: Keys to keep resources for.
+    :param size: Number of resources to keep per key.
+    :param concurrency: Maximum number of resources created concurrently.
+    """
+
+    LABEL: ClassVar[str]
+    """Label identifying the resources of a pool"""
+
+    def __init__(
+        self,
+        name: str,
+        keys: Iterable[K],
+        *,
+        size: int,
+        concurrency: int,
+    ):
+        self._name = name
+        self._size = size
+        self._concurrency = concurrency
+
+        self._lock = threading.Lock()
+        # Held during a whole refill, so that concurrent refills never create the
+        # same missing resources twice.
+        self._refill_lock = threading.Lock()
+        self._available: dict[K, deque[T]] = {key: deque() for key in keys}
+
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self.errors: list[Exception] = []
+        """
+        Errors raised during the last refill.
+        """
+
+    def _key(self, resource: T) -> K | None:
+        """
+        Returns the key of a resource, None when the resource does not belong to the
+        pool.
+        """
+        raise NotImplementedError
+
+    def _describe(self, key: K) -> str:
+        """
+        Returns a description of the resources of a key, used in the error messages.
+        """
+        raise NotImplementedError
+
+    def _create_many(self, keys: list[K]) -> tuple[list[T], list[Exception]]:
+        """
+        Creates a resource for each of the keys, and returns the created resources
+        and the errors of the failed creations.
+        """
+        raise NotImplementedError
+
+    def _get_available(self, key: K) -> deque[T]:
+        available = self._available.get(key)
+        if available is None:
+            raise ValueError(f"pool {self._name!r} has no {self._describe(key)}")
+        return available
+
+    def _count(self, key: K) -> int:
+        with self._lock:
+            return len(self._get_available(key))
+
+    def _put(self, resource: T) -> bool:
+        key = self._key(resource)
+        with self._lock:
+            available = self._available.get(key) if key is not None else None
+            if available is None or any(o.id == resource.id for o in available):
+                return False
+            available.append(resource)
+            return True
+
+    def _take(self, key: K) -> T | None:
+        """
+        Takes a resource out of the pool, and wakes up the background refill.
+        """
+        with self._lock:
+            available = self._get_available(key)
+            resource = available.popleft() if available else None
+        self._wake.set()
+        return resource
+
+    def refill(self) -> list[T]:
+        """
+        Creates the missing resources, concurrently, until every key has ``size``
+        resources ready.
+
+        A failed creation does not interrupt the others, its error is stored in
+        :attr:`errors`. Concurrent refills, e.g. from the background thread and a
+        direct call, run one after the other.
+
+        :return: The created resources.
+        """
+        with self._refill_lock:
+            with self._lock:
+                missing = [
+                    key
+                    for key, available in self._available.items()
+                    for _ in range(self._size - len(available))
+                ]
+
+            created, errors = self._create_many(missing) if missing else ([], [])
+            for resource in created:
+                self._put(resource)
+
+            self.errors = errors
+            return created
+
+    def _run(self, interval: float) -> None:
+        while not self._stop.is_set():
+            try:
+                self.refill()
+            except Exception as exception:  # pylint: disable=broad-exception-caught
+                self.errors = [exception]
+            self._wake.wait(interval)
+            self._wake.clear()
+
+    def start(self, interval: float = 60.0) -> None:
+        """
+        Starts refilling the pool in a background thread, every ``interval`` seconds
+        and after each resource taken out of the pool.
+
+        :param interval: Seconds between two refills.
+        """
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(interval,),
+            name=f"{self.LABEL}-{self._name}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops refilling the pool in the background.
+        """
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        self._thread.join()
+        self._thread = None
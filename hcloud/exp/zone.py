@@ -5,9 +5,22 @@ library, breaking changes may occur within minor releases.
 
 from __future__ import annotations
 
+import re
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from ..zones.domain import ZoneRecord, ZoneRRSet, ZoneRRSetType
+
+if TYPE_CHECKING:
+    from ..zones.client import BoundZone
+
 __all__ = [
     "is_txt_record_quoted",
     "format_txt_record",
+    "are_txt_records_quoted",
+    "format_txt_records",
+    "parse_zonefile",
+    "ZoneIndex",
 ]
 
 
@@ -38,3 +51,499 @@ def format_txt_record(value: str) -> str:
     value = " ".join(parts)
 
     return value
+
+
+# A quoted TXT record: one or more quoted character strings of at most 255
+# characters, an escape sequence (\X or \DDD) counting as a single character.
+_TXT_RECORD_QUOTED_RE = re.compile(
+    r'"(?:[^"\\]|\\(?:\d{3}|.)){0,255}"(?:[ \t]+"(?:[^"\\]|\\(?:\d{3}|.)){0,255}")*',
+    re.DOTALL,
+)
+_TXT_RECORD_ESCAPE_RE = re.compile(r'(\\(?:\d{3}|.))|(["\\])', re.DOTALL)
+_TXT_RECORD_CHUNK_RE = re.compile(r"(?:\\(?:\d{3}|.)|[^\\]){1,255}", re.DOTALL)
+
+
+def _escape_txt_char(match: re.Match[str]) -> str:
+    # Keep existing escape sequences, escape the lone quotes and backslashes.
+    return match.group(1) or "\\" + match.group(2)
+
+
+def are_txt_records_quoted(values: Iterable[str]) -> list[bool]:
+    """
+    Check whether many TXT records are already quoted.
+
+    Unlike :func:`is_txt_record_quoted`, the quoted strings and their escape sequences
+    are validated, as well as the 255 characters limit of each string.
+
+    - hello world		=> false
+    - "hello world"		=> true
+    - "hello" "world"	=> true
+    - "hello \"world\"" => true
+    - "hello "world""	=> false
+    """
+    fullmatch = _TXT_RECORD_QUOTED_RE.fullmatch
+    return [fullmatch(value) is not None for value in values]
+
+
+def format_txt_records(values: Iterable[str]) -> list[str]:
+    """
+    Format many TXT records by splitting them in quoted strings of 255 characters.
+
+    Unlike :func:`format_txt_record`:
+
+    - values that are already quoted (see :func:`are_txt_records_quoted`) are kept as is,
+    - existing escape sequences are kept, only the lone quotes and backslashes are
+      escaped,
+    - escape sequences are never split across two strings.
+
+    - hello world		=> "hello world"
+    - hello "world"		=> "hello \"world\""
+    - "hello" "world"	=> "hello" "world"
+    """
+    fullmatch = _TXT_RECORD_QUOTED_RE.fullmatch
+
+    result = []
+    for value in values:
+        if value[:1] == '"' and fullmatch(value) is not None:
+            result.append(value)
+            continue
+
+        if "\\" not in value:
+            # Fast path, without escape sequences every character of the value is a
+            # single character.
+            if len(value) <= 255:
+                result.append('"' + value.replace('"', '\\"') + '"' if value else "")
+            else:
+                result.append(
+                    " ".join(
+                        '"' + value[start : start + 255].replace('"', '\\"') + '"'
+                        for start in range(0, len(value), 255)
+                    )
+                )
+            continue
+
+        value = _TXT_RECORD_ESCAPE_RE.sub(_escape_txt_char, value)
+        result.append(
+            " ".join('"' + chunk + '"' for chunk in _TXT_RECORD_CHUNK_RE.findall(value))
+        )
+
+    return result
+
+
+class _ZoneIndexNode:
+    __slots__ = ("children", "rrsets")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _ZoneIndexNode] = {}
+        self.rrsets: dict[str, ZoneRRSet] = {}
+
+
+def _split_labels(name: str) -> list[str]:
+    """
+    Split a relative RRSet name in its labels, starting from the zone apex.
+
+    - @		=> []
+    - www	=> ["www"]
+    - a.b	=> ["b", "a"]
+    """
+    name = name.lower()
+    if name in ("@", ""):
+        return []
+    labels = name.split(".")
+    labels.reverse()
+    return labels
+
+
+class ZoneIndex:
+    """
+    In-memory index of the resource record sets (RRSets) of a Zone.
+
+    The index is built from a single listing of the RRSets (or from an exported zone
+    file), and answers lookups by name and type, wildcard and suffix queries without
+    any API call. The RRSets are stored in a trie of reversed labels, so queries only
+    visit the part of the zone they are interested in.
+
+    Names are relative to the zone, the zone apex being ``@``.
+
+    :param rrsets: RRSets to add to the index.
+    :param zone: Zone the RRSets belong to, required to :meth:`refresh` the index.
+    """
+
+    def __init__(
+        self,
+        rrsets: Iterable[ZoneRRSet] = (),
+        *,
+        zone: BoundZone | None = None,
+    ):
+        self.zone = zone
+        self._root = _ZoneIndexNode()
+        self._rrsets: dict[tuple[str, str], ZoneRRSet] = {}
+
+        for rrset in rrsets:
+            self.add(rrset)
+
+    @classmethod
+    def from_zone(cls, zone: BoundZone) -> ZoneIndex:
+        """
+        Build the index from all the RRSets of a Zone.
+
+        :param zone: Zone to fetch the RRSets from.
+        """
+        return cls(zone.get_rrset_all(), zone=zone)
+
+    @classmethod
+    def from_zonefile(
+        cls,
+        zonefile: str,
+        *,
+        zone: BoundZone | None = None,
+    ) -> ZoneIndex:
+        """
+        Build the index from a zone file in BIND (RFC 1034/1035) format, for example
+        the one returned by :meth:`BoundZone.export_zonefile
+        <hcloud.zones.client.BoundZone.export_zonefile>`.
+
+        :param zonefile: Zone file to parse.
+        :param zone: Zone the zone file belongs to.
+        """
+        return cls(parse_zonefile(zonefile), zone=zone)
+
+    def __len__(self) -> int:
+        return len(self._rrsets)
+
+    def __iter__(self) -> Iterator[ZoneRRSet]:
+        return iter(self._rrsets.values())
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, tuple) or len(key) != 2:
+            return False
+        name, type = key
+        return (name.lower(), type) in self._rrsets
+
+    def add(self, rrset: ZoneRRSet) -> None:
+        """
+        Add a RRSet to the index, replacing any RRSet with the same name and type.
+
+        :param rrset: RRSet to add.
+        """
+        assert rrset.name is not None
+        assert rrset.type is not None
+
+        node = self._root
+        for label in _split_labels(rrset.name):
+            child = node.children.get(label)
+            if child is None:
+                child = node.children[label] = _ZoneIndexNode()
+            node = child
+
+        node.rrsets[rrset.type] = rrset
+        self._rrsets[(rrset.name.lower(), rrset.type)] = rrset
+
+    def remove(self, name: str, type: ZoneRRSetType | None = None) -> list[ZoneRRSet]:
+        """
+        Remove the RRSets with the given name (and type) from the index.
+
+        :param name: Name of the RRSets to remove.
+        :param type: Type of the RRSet to remove, all types are removed if omitted.
+        :return: The removed RRSets.
+        """
+        path = [self._root]
+        for label in _split_labels(name):
+            child = path[-1].children.get(label)
+            if child is None:
+                return []
+            path.append(child)
+
+        node = path[-1]
+        if type is None:
+            removed = list(node.rrsets.values())
+            node.rrsets.clear()
+        else:
+            rrset = node.rrsets.pop(type, None)
+            removed = [] if rrset is None else [rrset]
+
+        for rrset in removed:
+            del self._rrsets[(name.lower(), rrset.type)]  # type: ignore[arg-type]
+
+        # Prune the nodes that no longer hold any RRSet
+        labels = _split_labels(name)
+        while len(path) > 1 and not path[-1].rrsets and not path[-1].children:
+            path.pop()
+            del path[-1].children[labels[len(path) - 1]]
+
+        return removed
+
+    def get(self, name: str, type: ZoneRRSetType) -> ZoneRRSet | None:
+        """
+        Return the RRSet matching exactly the given name and type.
+
+        :param name: Name of the RRSet.
+        :param type: Type of the RRSet.
+        """
+        return self._rrsets.get((name.lower(), type))
+
+    def get_by_name(self, name: str) -> list[ZoneRRSet]:
+        """
+        Return all RRSets matching exactly the given name.
+
+        :param name: Name of the RRSets.
+        """
+        node = self._find_node(_split_labels(name))
+        if node is None:
+            return []
+        return list(node.rrsets.values())
+
+    def get_by_suffix(
+        self,
+        suffix: str,
+        type: ZoneRRSetType | None = None,
+    ) -> list[ZoneRRSet]:
+        """
+        Return all RRSets with a name equal to or below the given suffix, e.g. the
+        suffix ``sub`` matches ``sub``, ``www.sub`` and ``*.sub``.
+
+        :param suffix: Suffix of the RRSets names, use ``@`` to match the whole zone.
+        :param type: Only return RRSets of this type.
+        """
+        node = self._find_node(_split_labels(suffix))
+        if node is None:
+            return []
+
+        result: list[ZoneRRSet] = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if type is None:
+                result.extend(node.rrsets.values())
+            elif type in node.rrsets:
+                result.append(node.rrsets[type])
+            stack.extend(node.children.values())
+        return result
+
+    def resolve(self, name: str, type: ZoneRRSetType) -> ZoneRRSet | None:
+        """
+        Return the RRSet answering a query for the given name and type, taking
+        wildcard RRSets into account (RFC 4592).
+
+        An existing name is never answered by a wildcard, even if it holds no RRSet of
+        the requested type.
+
+        :param name: Name to resolve.
+        :param type: Type to resolve.
+        """
+        node = self._root
+        for label in _split_labels(name):
+            child = node.children.get(label)
+            if child is None:
+                # ``node`` is the closest encloser of the name.
+                wildcard = node.children.get("*")
+                if wildcard is None:
+                    return None
+                return wildcard.rrsets.get(type)
+            node = child
+
+        return node.rrsets.get(type)
+
+    def refresh(
+        self,
+        *,
+        name: str | None = None,
+        type: ZoneRRSetType | None = None,
+    ) -> None:
+        """
+        Refresh the index from the API.
+
+        When a name or a type is given, only the matching RRSets are fetched and
+        replaced, the rest of the index is left untouched.
+
+        :param name: Only refresh the RRSets with this name.
+        :param type: Only refresh the RRSets with this type.
+        """
+        if self.zone is None:
+            raise ValueError("zone must be set to refresh the index")
+
+        rrsets = self.zone.get_rrset_all(
+            name=name,
+            type=None if type is None else [type],
+        )
+
+        if name is not None:
+            self.remove(name, type)
+        else:
+            for key in list(self._rrsets):
+                if type is None or key[1] == type:
+                    self.remove(*key)  # type: ignore[arg-type]
+
+        for rrset in rrsets:
+            self.add(rrset)
+
+    def _find_node(self, labels: list[str]) -> _ZoneIndexNode | None:
+        node = self._root
+        for label in labels:
+            child = node.children.get(label)
+            if child is None:
+                return None
+            node = child
+        return node
+
+
+def _tokenize_zonefile_line(line: str) -> Iterator[str]:
+    """
+    Split a zone file line in its tokens, while keeping quoted strings intact and
+    dropping the comments.
+    """
+    i, n = 0, len(line)
+    while i < n:
+        char = line[i]
+        if char in " \t":
+            i += 1
+        elif char == ";":
+            return
+        elif char in "()":
+            yield char
+            i += 1
+        elif char == '"':
+            j = i + 1
+            while j < n and line[j] != '"':
+                j += 2 if line[j] == "\\" else 1
+            yield line[i : j + 1]
+            i = j + 1
+        else:
+            j = i
+            while j < n and line[j] not in ' \t;()"':
+                j += 1
+            yield line[i:j]
+            i = j
+
+
+_TTL_RE = re.compile(r"\d+|(?:\d+[wdhms])+", re.IGNORECASE)
+_TTL_UNITS = {"w": 604800, "d": 86400, "h": 3600, "m": 60, "s": 1}
+
+
+def _parse_ttl(value: str) -> int:
+    """
+    Parse a TTL in seconds, or with BIND time units.
+
+    - 3600	=> 3600
+    - 1h30m	=> 5400
+    - 1d	=> 86400
+    """
+    if _TTL_RE.fullmatch(value) is None:
+        raise ValueError(f"invalid TTL {value!r}")
+    if value.isdigit():
+        return int(value)
+    return sum(
+        int(amount) * _TTL_UNITS[unit.lower()]
+        for amount, unit in re.findall(r"(\d+)([a-z])", value, re.IGNORECASE)
+    )
+
+
+def parse_zonefile(zonefile: str) -> list[ZoneRRSet]:
+    """
+    Parse a zone file in BIND (RFC 1034/1035) format into a list of RRSets.
+
+    The names of the RRSets are relative to the first ``$ORIGIN`` of the zone file,
+    the following ``$ORIGIN`` directives only change how relative names are completed.
+    The TTL of a RRSet is set when it is explicitly defined on its records, or by a
+    previous ``$TTL`` directive. TTLs may use BIND time units, e.g. ``1h30m``.
+
+    :param zonefile: Zone file to parse.
+    :raises: ValueError when a directive or a record of the zone file is malformed
+    """
+    zone_origin: str | None = None
+    origin = ""
+    default_ttl: int | None = None
+    last_name = "@"
+    rrsets: dict[tuple[str, str], ZoneRRSet] = {}
+
+    # Entries of the zone file, with the line number they start on
+    entries: list[tuple[int, bool, list[str]]] = []
+    tokens: list[str] = []
+    depth = 0
+    start = 0
+    starts_with_blank = False
+    for number, line in enumerate(zonefile.splitlines(), start=1):
+        if depth == 0:
+            start = number
+            starts_with_blank = line[:1] in (" ", "\t")
+        for token in _tokenize_zonefile_line(line):
+            if token == "(":
+                depth += 1
+            elif token == ")":
+                depth -= 1
+            else:
+                tokens.append(token)
+        if depth == 0 and tokens:
+            entries.append((start, starts_with_blank, tokens))
+            tokens = []
+
+    for number, starts_with_blank, tokens in entries:
+        directive = tokens[0].upper()
+        if directive in ("$ORIGIN", "$TTL") and len(tokens) < 2:
+            raise ValueError(f"missing value for {directive} on line {number}")
+        if directive == "$ORIGIN":
+            origin = _absolute_name(tokens[1], origin)
+            if zone_origin is None:
+                zone_origin = origin
+            continue
+        if directive == "$TTL":
+            default_ttl = _parse_ttl(tokens[1])
+            continue
+        if directive.startswith("$"):
+            continue
+
+        if starts_with_blank:
+            name = last_name
+        else:
+            name = _relative_name(
+                _absolute_name(tokens.pop(0), origin), zone_origin or ""
+            )
+            last_name = name
+
+        ttl = default_ttl
+        while tokens:
+            if tokens[0][:1].isdigit():
+                ttl = _parse_ttl(tokens.pop(0))
+            elif tokens[0].upper() in ("IN", "CH", "HS", "CS"):
+                tokens.pop(0)
+            else:
+                break
+
+        if len(tokens) < 2:
+            raise ValueError(f"missing record type or data on line {number}")
+        type = tokens.pop(0).upper()
+        key = (name, type)
+        rrset = rrsets.get(key)
+        if rrset is None:
+            rrset = rrsets[key] = ZoneRRSet(
+                name=name,
+                type=type,  # type: ignore[arg-type]
+                records=[],
+            )
+        if ttl is not None:
+            rrset.ttl = ttl
+        assert rrset.records is not None
+        rrset.records.append(ZoneRecord(value=" ".join(tokens)))
+
+    return list(rrsets.values())
+
+
+def _absolute_name(name: str, origin: str) -> str:
+    """
+    Complete a name with the current origin, the returned name has no trailing dot.
+    """
+    if name == "@":
+        return origin
+    if name.endswith("."):
+        return name[:-1].lower()
+    if not origin:
+        return name.lower()
+    return f"{name.lower()}.{origin}"
+
+
+def _relative_name(name: str, origin: str) -> str:
+    if name == origin:
+        return "@"
+    if origin and name.endswith("." + origin):
+        return name[: -len(origin) - 1]
+    return name
@@ -7,17 +7,23 @@ from .domain import (
     FirewallResource,
     FirewallResourceAppliedToResources,
     FirewallResourceLabelSelector,
+    FirewallResourcesChangeResult,
     FirewallRule,
 )
+from .evaluator import FirewallEvaluator
+from .rules import compile_firewall_rules
 
 __all__ = [
     "BoundFirewall",
     "CreateFirewallResponse",
     "Firewall",
+    "FirewallEvaluator",
     "FirewallResource",
     "FirewallResourceAppliedToResources",
     "FirewallResourceLabelSelector",
+    "FirewallResourcesChangeResult",
     "FirewallRule",
     "FirewallsClient",
     "FirewallsPageResult",
+    "compile_firewall_rules",
 ]
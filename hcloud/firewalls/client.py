@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, NamedTuple
 
+from .._exceptions import APIException
 from ..actions import (
     ActionSort,
     ActionsPageResult,
@@ -17,8 +20,10 @@ from .domain import (
     FirewallResource,
     FirewallResourceAppliedToResources,
     FirewallResourceLabelSelector,
+    FirewallResourcesChangeResult,
     FirewallRule,
 )
+from .rules import compile_firewall_rules
 
 if TYPE_CHECKING:
     from .._client import Client
@@ -31,6 +36,14 @@ __all__ = [
 ]
 
 
+def _firewall_resource_key(resource: FirewallResource) -> tuple[str, Any]:
+    if resource.type == FirewallResource.TYPE_SERVER:
+        assert resource.server is not None
+        return (resource.type, resource.server.id)
+    assert resource.label_selector is not None
+    return (resource.type, resource.label_selector.selector)
+
+
 class BoundFirewall(BoundModelBase[Firewall], Firewall):
     _client: FirewallsClient
 
@@ -179,6 +192,13 @@ class BoundFirewall(BoundModelBase[Firewall], Firewall):
 
         return self._client.set_rules(self, rules=rules)
 
+    def sync_rules(self, rules: list[FirewallRule]) -> list[BoundAction]:
+        """Compiles the rules and sets them on the Firewall, only if they differ from the current rules.
+        :param rules: List[:class:`FirewallRule <hcloud.firewalls.domain.FirewallRule>`]
+        :return: List[:class:`BoundAction <hcloud.actions.client.BoundAction>`], empty if the rules are unchanged
+        """
+        return self._client.sync_rules(self, rules=rules)
+
     def apply_to_resources(
         self,
         resources: list[FirewallResource],
@@ -199,6 +219,46 @@ class BoundFirewall(BoundModelBase[Firewall], Firewall):
         """
         return self._client.remove_from_resources(self, resources=resources)
 
+    def apply_to_many_resources(
+        self,
+        resources: list[FirewallResource],
+        *,
+        chunk_size: int = 50,
+        concurrency: int = 5,
+    ) -> list[FirewallResourcesChangeResult]:
+        """Applies the Firewall to many resources, and waits for all the Actions.
+        :param resources: List[:class:`FirewallResource <hcloud.firewalls.domain.FirewallResource>`]
+        :param chunk_size: Maximum number of resources per request.
+        :param concurrency: Maximum number of requests sent concurrently.
+        :return: List[:class:`FirewallResourcesChangeResult <hcloud.firewalls.domain.FirewallResourcesChangeResult>`]
+        """
+        return self._client.apply_to_many_resources(
+            self,
+            resources=resources,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+        )
+
+    def remove_from_many_resources(
+        self,
+        resources: list[FirewallResource],
+        *,
+        chunk_size: int = 50,
+        concurrency: int = 5,
+    ) -> list[FirewallResourcesChangeResult]:
+        """Removes the Firewall from many resources, and waits for all the Actions.
+        :param resources: List[:class:`FirewallResource <hcloud.firewalls.domain.FirewallResource>`]
+        :param chunk_size: Maximum number of resources per request.
+        :param concurrency: Maximum number of requests sent concurrently.
+        :return: List[:class:`FirewallResourcesChangeResult <hcloud.firewalls.domain.FirewallResourcesChangeResult>`]
+        """
+        return self._client.remove_from_many_resources(
+            self,
+            resources=resources,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+        )
+
 
 class FirewallsPageResult(NamedTuple):
     firewalls: list[BoundFirewall]
@@ -458,6 +518,29 @@ class FirewallsClient(
             for action_data in response["actions"]
         ]
 
+    def sync_rules(
+        self,
+        firewall: Firewall | BoundFirewall,
+        rules: list[FirewallRule],
+    ) -> list[BoundAction]:
+        """Compiles the rules and sets them on a Firewall, only if they differ from the current rules.
+
+        See :func:`compile_firewall_rules <hcloud.firewalls.rules.compile_firewall_rules>`.
+
+        :param firewall: :class:`BoundFirewall <hcloud.firewalls.client.BoundFirewall>` or  :class:`Firewall <hcloud.firewalls.domain.Firewall>`
+        :param rules: List[:class:`FirewallRule <hcloud.firewalls.domain.FirewallRule>`]
+        :return: List[:class:`BoundAction <hcloud.actions.client.BoundAction>`], empty if the rules are unchanged
+        """
+        current_rules = firewall.rules
+        if current_rules is None:
+            current_rules = self.get_by_id(firewall.id).rules or []  # type: ignore[arg-type]
+
+        compiled = compile_firewall_rules(rules)
+        if compiled == compile_firewall_rules(current_rules):
+            return []
+
+        return self.set_rules(firewall, compiled)
+
     def apply_to_resources(
         self,
         firewall: Firewall | BoundFirewall,
@@ -505,3 +588,126 @@ class FirewallsClient(
             BoundAction(self._parent.actions, action_data)
             for action_data in response["actions"]
         ]
+
+    def _change_many_resources(
+        self,
+        firewall: Firewall | BoundFirewall,
+        resources: list[FirewallResource],
+        change: Callable[
+            [Firewall | BoundFirewall, list[FirewallResource]], list[BoundAction]
+        ],
+        chunk_size: int,
+        concurrency: int,
+    ) -> list[FirewallResourcesChangeResult]:
+        results = [
+            FirewallResourcesChangeResult(resources[i : i + chunk_size])
+            for i in range(0, len(resources), chunk_size)
+        ]
+
+        def apply(result: FirewallResourcesChangeResult) -> None:
+            try:
+                result.actions = change(firewall, result.resources)
+            except APIException as exception:
+                result.error = exception
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(apply, results))
+
+        errors = self.actions.wait_for_all(
+            [action for result in results for action in result.actions]
+        )
+        for result in results:
+            for action in result.actions:
+                if action.id in errors:
+                    result.error = errors[action.id]
+                    break
+
+        return results
+
+    def apply_to_many_resources(
+        self,
+        firewall: Firewall | BoundFirewall,
+        resources: list[FirewallResource],
+        *,
+        chunk_size: int = 50,
+        concurrency: int = 5,
+    ) -> list[FirewallResourcesChangeResult]:
+        """Applies one Firewall to many resources, and waits for all the Actions.
+
+        Resources the Firewall is already applied to are skipped, including servers
+        already covered by one of the label selectors of the Firewall. The remaining
+        resources are applied in chunks, sent concurrently. A failed chunk does not
+        interrupt the others, its error is reported in the result.
+
+        :param firewall: :class:`BoundFirewall <hcloud.firewalls.client.BoundFirewall>` or  :class:`Firewall <hcloud.firewalls.domain.Firewall>`
+        :param resources: List[:class:`FirewallResource <hcloud.firewalls.domain.FirewallResource>`]
+        :param chunk_size: Maximum number of resources per request.
+        :param concurrency: Maximum number of requests sent concurrently.
+        :return: List[:class:`FirewallResourcesChangeResult <hcloud.firewalls.domain.FirewallResourcesChangeResult>`]
+        """
+        applied_to = firewall.applied_to
+        if applied_to is None:
+            applied_to = self.get_by_id(firewall.id).applied_to or []  # type: ignore[arg-type]
+
+        skipped = {_firewall_resource_key(o) for o in applied_to}
+        for resource in applied_to:
+            for applied in resource.applied_to_resources or []:
+                if applied.server is not None:
+                    skipped.add((FirewallResource.TYPE_SERVER, applied.server.id))
+
+        pending = []
+        for resource in resources:
+            key = _firewall_resource_key(resource)
+            if key not in skipped:
+                skipped.add(key)
+                pending.append(resource)
+
+        return self._change_many_resources(
+            firewall,
+            pending,
+            self.apply_to_resources,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+        )
+
+    def remove_from_many_resources(
+        self,
+        firewall: Firewall | BoundFirewall,
+        resources: list[FirewallResource],
+        *,
+        chunk_size: int = 50,
+        concurrency: int = 5,
+    ) -> list[FirewallResourcesChangeResult]:
+        """Removes one Firewall from many resources, and waits for all the Actions.
+
+        Resources the Firewall is not directly applied to are skipped, this includes
+        servers only covered by one of the label selectors of the Firewall. The
+        remaining resources are removed in chunks, sent concurrently. A failed chunk
+        does not interrupt the others, its error is reported in the result.
+
+        :param firewall: :class:`BoundFirewall <hcloud.firewalls.client.BoundFirewall>` or  :class:`Firewall <hcloud.firewalls.domain.Firewall>`
+        :param resources: List[:class:`FirewallResource <hcloud.firewalls.domain.FirewallResource>`]
+        :param chunk_size: Maximum number of resources per request.
+        :param concurrency: Maximum number of requests sent concurrently.
+        :return: List[:class:`FirewallResourcesChangeResult <hcloud.firewalls.domain.FirewallResourcesChangeResult>`]
+        """
+        applied_to = firewall.applied_to
+        if applied_to is None:
+            applied_to = self.get_by_id(firewall.id).applied_to or []  # type: ignore[arg-type]
+
+        applied = {_firewall_resource_key(o) for o in applied_to}
+
+        pending = []
+        for resource in resources:
+            key = _firewall_resource_key(resource)
+            if key in applied:
+                applied.discard(key)
+                pending.append(resource)
+
+        return self._change_many_resources(
+            firewall,
+            pending,
+            self.remove_from_resources,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+        )
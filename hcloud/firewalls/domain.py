@@ -16,6 +16,7 @@ __all__ = [
     "FirewallResource",
     "FirewallResourceAppliedToResources",
     "FirewallResourceLabelSelector",
+    "FirewallResourcesChangeResult",
     "CreateFirewallResponse",
 ]
 
@@ -214,6 +215,31 @@ class FirewallResourceLabelSelector(BaseDomain):
         self.selector = selector
 
 
+class FirewallResourcesChangeResult(BaseDomain):
+    """Firewall Resources Change Result Domain
+
+    :param resources: List[:class:`FirewallResource <hcloud.firewalls.domain.FirewallResource>`]
+           Resources the Firewall was applied to or removed from, in a single request
+    :param actions: List[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
+           Actions of the request, empty if the request failed
+    :param error: Exception
+           Error raised by the request or by one of its actions
+    """
+
+    __api_properties__ = ("resources", "actions", "error")
+    __slots__ = __api_properties__
+
+    def __init__(
+        self,
+        resources: list[FirewallResource],
+        actions: list[BoundAction] | None = None,
+        error: Exception | None = None,
+    ):
+        self.resources = resources
+        self.actions = actions or []
+        self.error = error
+
+
 class CreateFirewallResponse(BaseDomain):
     """Create Firewall Response Domain
 
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import ipaddress
+from bisect import bisect_right
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from .domain import Firewall, FirewallResource, FirewallRule
+from .rules import _merge_ports, _parse_port
+
+if TYPE_CHECKING:
+    from ..servers import BoundServer, Server
+    from .client import BoundFirewall
+
+__all__ = [
+    "FirewallEvaluator",
+]
+
+_ANY_PORT = (1, 65535)
+# Protocols whose rules and traffic have ports
+_PORT_PROTOCOLS = (FirewallRule.PROTOCOL_TCP, FirewallRule.PROTOCOL_UDP)
+
+
+class _IntervalIndex:
+    """
+    Disjoint and sorted IP intervals, each with the sorted and disjoint port ranges
+    allowed for the IPs of the interval.
+    """
+
+    __slots__ = ("starts", "ends", "port_starts", "port_ends")
+
+    def __init__(self, entries: list[tuple[int, int, tuple[int, int]]]):
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        self.port_starts: list[list[int]] = []
+        self.port_ends: list[list[int]] = []
+
+        events: dict[int, list[tuple[tuple[int, int], int]]] = {}
+        for start, end, port in entries:
+            events.setdefault(start, []).append((port, 1))
+            events.setdefault(end + 1, []).append((port, -1))
+
+        # Sweep the IP boundaries, each segment between two boundaries is allowed
+        # for the port ranges of all the networks covering it.
+        active: Counter[tuple[int, int]] = Counter()
+        boundaries = sorted(events)
+        for boundary, next_boundary in zip(boundaries, boundaries[1:]):
+            for port, delta in events[boundary]:
+                active[port] += delta
+                if active[port] == 0:
+                    del active[port]
+            if not active:
+                continue
+
+            ports = _merge_ports(active)
+            port_starts = [o[0] for o in ports]
+            port_ends = [o[1] for o in ports]
+            if (
+                self.ends
+                and self.ends[-1] == boundary - 1
+                and self.port_starts[-1] == port_starts
+                and self.port_ends[-1] == port_ends
+            ):
+                self.ends[-1] = next_boundary - 1
+                continue
+
+            self.starts.append(boundary)
+            self.ends.append(next_boundary - 1)
+            self.port_starts.append(port_starts)
+            self.port_ends.append(port_ends)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def match(self, ip: int, port: int | None) -> bool:
+        i = bisect_right(self.starts, ip) - 1
+        if i < 0 or ip > self.ends[i]:
+            return False
+        if port is None:
+            return True
+        j = bisect_right(self.port_starts[i], port) - 1
+        return j >= 0 and port <= self.port_ends[i][j]
+
+
+class _FirewallPolicy:
+    """
+    Rules of all the Firewalls applied to a server, indexed by direction, protocol
+    and IP version.
+    """
+
+    __slots__ = ("indexes", "restrict_outbound")
+
+    def __init__(self, firewalls: list[Firewall]):
+        entries: dict[tuple[str, str, int], list[tuple[int, int, tuple[int, int]]]] = {}
+        self.restrict_outbound = False
+
+        for firewall in firewalls:
+            for rule in firewall.rules or []:
+                if rule.direction == FirewallRule.DIRECTION_IN:
+                    ips = rule.source_ips
+                else:
+                    self.restrict_outbound = True
+                    ips = rule.destination_ips
+
+                port = _parse_port(rule.port) or _ANY_PORT
+                for ip in ips:
+                    network = ipaddress.ip_network(ip, strict=False)
+                    entries.setdefault(
+                        (rule.direction, rule.protocol, network.version), []
+                    ).append(
+                        (
+                            int(network.network_address),
+                            int(network.broadcast_address),
+                            port,
+                        )
+                    )
+
+        self.indexes = {key: _IntervalIndex(value) for key, value in entries.items()}
+
+    def is_allowed(
+        self,
+        direction: str,
+        protocol: str,
+        ip: ipaddress.IPv4Address | ipaddress.IPv6Address,
+        port: int | None,
+    ) -> bool:
+        if direction == FirewallRule.DIRECTION_OUT and not self.restrict_outbound:
+            return True
+
+        index = self.indexes.get((direction, protocol, ip.version))
+        if index is None:
+            return False
+        return index.match(int(ip), port)
+
+
+class FirewallEvaluator:
+    """
+    Evaluates locally whether traffic is allowed by the Firewalls applied to servers.
+
+    The Firewalls are usually fetched with a single call to
+    :meth:`FirewallsClient.get_all <hcloud.firewalls.client.FirewallsClient.get_all>`.
+    Label selector resources are resolved using their ``applied_to_resources``.
+
+    The evaluation follows the Firewalls behavior:
+
+    - traffic to and from a server without any Firewall applied is allowed,
+    - inbound traffic is allowed only if a rule of an applied Firewall matches it,
+    - outbound traffic is allowed only if a rule of an applied Firewall matches it,
+      unless none of the applied Firewalls have outbound rules.
+
+    The Firewalls are stateful, only the initial packet of a flow is evaluated.
+
+    :param firewalls: List[:class:`BoundFirewall <hcloud.firewalls.client.BoundFirewall>`]
+           The Firewalls to evaluate, with their rules and resources.
+    """
+
+    def __init__(self, firewalls: list[Firewall | BoundFirewall]):
+        servers: dict[int, dict[int | None, Firewall]] = {}
+        for firewall in firewalls:
+            for resource in firewall.applied_to or []:
+                for server_id in self._resolve(resource):
+                    servers.setdefault(server_id, {})[firewall.id] = firewall
+
+        # Servers using the same Firewalls share the same policy
+        policies: dict[frozenset[int | None], _FirewallPolicy] = {}
+        self._policies: dict[int, _FirewallPolicy] = {}
+        for server_id, applied in servers.items():
+            key = frozenset(applied)
+            if key not in policies:
+                policies[key] = _FirewallPolicy(list(applied.values()))
+            self._policies[server_id] = policies[key]
+
+    @staticmethod
+    def _resolve(resource: FirewallResource) -> list[int]:
+        if resource.type == FirewallResource.TYPE_SERVER:
+            if resource.server is None or resource.server.id is None:
+                return []
+            return [resource.server.id]
+
+        return [
+            o.server.id
+            for o in resource.applied_to_resources or []
+            if o.type == FirewallResource.TYPE_SERVER
+            and o.server is not None
+            and o.server.id is not None
+        ]
+
+    def is_protected(self, server: int | Server | BoundServer) -> bool:
+        """
+        Returns whether at least one Firewall is applied to the server.
+
+        :param server: Server or Server ID.
+        """
+        server_id = server if isinstance(server, int) else server.id
+        return server_id in self._policies
+
+    def is_allowed(
+        self,
+        server: int | Server | BoundServer,
+        direction: str,
+        protocol: str,
+        ip: str | ipaddress.IPv4Address | ipaddress.IPv6Address,
+        port: int | None = None,
+    ) -> bool:
+        """
+        Returns whether the Firewalls applied to the server allow the traffic.
+
+        :param server: Server or Server ID.
+        :param direction: Direction of the traffic, ``in`` or ``out``.
+        :param protocol: Protocol of the traffic, e.g. ``tcp`` or ``icmp``.
+        :param ip: Remote IP address, the source for inbound traffic and the
+               destination for outbound traffic.
+        :param port: Port of the server for inbound traffic, or of the remote for
+               outbound traffic. Required for ``tcp`` and ``udp``, ignored for
+               protocols without ports.
+        :raises: ValueError when no port is given for ``tcp`` or ``udp``
+        """
+        if port is None and protocol in _PORT_PROTOCOLS:
+            raise ValueError(f"port is required for the {protocol} protocol")
+
+        server_id = server if isinstance(server, int) else server.id
+        policy = self._policies.get(server_id)  # type: ignore[arg-type]
+        if policy is None:
+            return True
+
+        if isinstance(ip, str):
+            ip = ipaddress.ip_address(ip)
+
+        return policy.is_allowed(direction, protocol, ip, port)
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import ipaddress
+from collections.abc import Iterable
+
+from .domain import FirewallRule
+
+__all__ = [
+    "compile_firewall_rules",
+]
+
+_Network = ipaddress.IPv4Network | ipaddress.IPv6Network
+_Port = tuple[int, int] | None
+# direction, protocol, port, source networks, destination networks, description
+_Rule = tuple[
+    str,
+    str,
+    _Port,
+    tuple[_Network, ...],
+    tuple[_Network, ...],
+    str | None,
+]
+
+_PORT_MIN = 1
+_PORT_MAX = 65535
+
+# Maximum number of CIDRs in the source or destination IPs of a Firewall Rule
+_MAX_RULE_IPS = 100
+
+
+def _collapse_networks(networks: Iterable[_Network]) -> tuple[_Network, ...]:
+    ipv4: list[ipaddress.IPv4Network] = []
+    ipv6: list[ipaddress.IPv6Network] = []
+    for network in networks:
+        if isinstance(network, ipaddress.IPv4Network):
+            ipv4.append(network)
+        else:
+            ipv6.append(network)
+    return (
+        *ipaddress.collapse_addresses(ipv4),
+        *ipaddress.collapse_addresses(ipv6),
+    )
+
+
+def _parse_networks(ips: list[str]) -> tuple[_Network, ...]:
+    return _collapse_networks(ipaddress.ip_network(ip, strict=False) for ip in ips)
+
+
+def _parse_port(port: str | None) -> _Port:
+    if port is None:
+        return None
+    if port == "any":
+        return (_PORT_MIN, _PORT_MAX)
+
+    start, _, end = port.partition("-")
+    return (int(start), int(end or start))
+
+
+def _format_port(port: _Port) -> str | None:
+    if port is None:
+        return None
+    if port == (_PORT_MIN, _PORT_MAX):
+        return "any"
+    if port[0] == port[1]:
+        return str(port[0])
+    return f"{port[0]}-{port[1]}"
+
+
+def _merge_ports(ports: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    result: list[tuple[int, int]] = []
+    for start, end in sorted(ports):
+        # Merge overlapping and adjacent port ranges
+        if result and start <= result[-1][1] + 1:
+            result[-1] = (result[-1][0], max(end, result[-1][1]))
+        else:
+            result.append((start, end))
+    return result
+
+
+def _merge_by_ips(rules: list[_Rule]) -> list[_Rule]:
+    """
+    Merges the rules that only differ by their source IPs (direction in) or
+    destination IPs (direction out).
+    """
+    groups: dict[
+        tuple[str, str, _Port, tuple[_Network, ...], str | None], list[_Network]
+    ] = {}
+    for direction, protocol, port, sources, destinations, description in rules:
+        if direction == FirewallRule.DIRECTION_IN:
+            key = (direction, protocol, port, destinations, description)
+            groups.setdefault(key, []).extend(sources)
+        else:
+            key = (direction, protocol, port, sources, description)
+            groups.setdefault(key, []).extend(destinations)
+
+    result: list[_Rule] = []
+    for (direction, protocol, port, other, description), networks in groups.items():
+        collapsed = _collapse_networks(networks)
+        if direction == FirewallRule.DIRECTION_IN:
+            result.append((direction, protocol, port, collapsed, other, description))
+        else:
+            result.append((direction, protocol, port, other, collapsed, description))
+    return result
+
+
+def _merge_by_ports(rules: list[_Rule]) -> list[_Rule]:
+    """
+    Merges the rules that only differ by their port.
+    """
+    groups: dict[
+        tuple[str, str, tuple[_Network, ...], tuple[_Network, ...], str | None],
+        list[_Port],
+    ] = {}
+    for direction, protocol, port, sources, destinations, description in rules:
+        key = (direction, protocol, sources, destinations, description)
+        groups.setdefault(key, []).append(port)
+
+    result: list[_Rule] = []
+    for (
+        direction,
+        protocol,
+        sources,
+        destinations,
+        description,
+    ), ports in groups.items():
+        if None in ports:
+            merged: list[_Port] = [None]
+        else:
+            merged = list(_merge_ports(o for o in ports if o is not None))
+        for port in merged:
+            result.append(
+                (direction, protocol, port, sources, destinations, description)
+            )
+    return result
+
+
+def _rule_sort_key(rule: _Rule) -> tuple[object, ...]:
+    direction, protocol, port, sources, destinations, description = rule
+    return (
+        direction,
+        protocol,
+        port or (0, 0),
+        [(o.version, o) for o in sources],
+        [(o.version, o) for o in destinations],
+        description or "",
+    )
+
+
+def _chunks(networks: tuple[_Network, ...]) -> list[list[str]]:
+    if not networks:
+        return [[]]
+    return [
+        [str(o) for o in networks[i : i + _MAX_RULE_IPS]]
+        for i in range(0, len(networks), _MAX_RULE_IPS)
+    ]
+
+
+def compile_firewall_rules(rules: list[FirewallRule]) -> list[FirewallRule]:
+    """
+    Compiles a list of Firewall Rules into an equivalent, smaller and normalized list
+    of Firewall Rules.
+
+    - IPv4 and IPv6 addresses are normalized to networks in CIDR notation, host bits
+      are dropped.
+    - Overlapping and adjacent networks are collapsed.
+    - Rules only differing by their IPs are merged.
+    - Rules only differing by their port are merged when their port ranges overlap or
+      are adjacent.
+    - Rules with more than 100 CIDRs are split.
+
+    Rules with different descriptions are never merged. The compiled rules are sorted,
+    so that compiling the same rules always returns the same result.
+
+    :param rules: List[:class:`FirewallRule <hcloud.firewalls.domain.FirewallRule>`]
+    :return: List[:class:`FirewallRule <hcloud.firewalls.domain.FirewallRule>`]
+    """
+    compiled: list[_Rule] = [
+        (
+            rule.direction,
+            rule.protocol,
+            _parse_port(rule.port),
+            _parse_networks(rule.source_ips),
+            _parse_networks(rule.destination_ips),
+            rule.description,
+        )
+        for rule in rules
+    ]
+
+    # Merging the ports may allow to merge more IPs, and the other way around
+    count = -1
+    while count != len(compiled):
+        count = len(compiled)
+        compiled = _merge_by_ports(_merge_by_ips(compiled))
+
+    result: list[FirewallRule] = []
+    for direction, protocol, port, sources, destinations, description in sorted(
+        compiled, key=_rule_sort_key
+    ):
+        for source_ips in _chunks(sources):
+            for destination_ips in _chunks(destinations):
+                result.append(
+                    FirewallRule(
+                        direction=direction,
+                        protocol=protocol,
+                        source_ips=source_ips,
+                        port=_format_port(port),
+                        destination_ips=destination_ips,
+                        description=description,
+                    )
+                )
+    return result
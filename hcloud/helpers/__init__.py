@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from .label_selector import LabelIndex, LabelRequirement, LabelSelector
 from .labels import LabelValidator
 
 __all__ = [
+    "LabelIndex",
+    "LabelRequirement",
+    "LabelSelector",
     "LabelValidator",
 ]
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable
+from typing import Generic, TypeVar
+
+from ..core import BaseDomain
+from .labels import LabelValidator
+
+__all__ = [
+    "LabelIndex",
+    "LabelRequirement",
+    "LabelSelector",
+]
+
+T = TypeVar("T")
+
+_KEY = r"[^\s=!(),]+"
+_EQUALITY_REGEX = re.compile(rf"^({_KEY})\s*(==|=|!=)\s*([^\s=!(),]*)$")
+_SET_REGEX = re.compile(rf"^({_KEY})\s+(in|notin)\s*\(([^()]*)\)$")
+_EXISTS_REGEX = re.compile(rf"^(!?)\s*({_KEY})$")
+
+
+class LabelRequirement(BaseDomain):
+    """Label Requirement Domain
+
+    Single requirement of a label selector, e.g. ``env in (prod, staging)``.
+
+    :param key: str
+           Label key
+    :param operator: str
+           Choices: =, !=, in, notin, exists, !exists
+    :param values: FrozenSet[str]
+           Label values, empty for the exists and !exists operators
+    """
+
+    OPERATOR_EQUAL = "="
+    """Label Requirement Operator ``key=value`` or ``key==value``"""
+    OPERATOR_NOT_EQUAL = "!="
+    """Label Requirement Operator ``key!=value``"""
+    OPERATOR_IN = "in"
+    """Label Requirement Operator ``key in (value1, value2)``"""
+    OPERATOR_NOT_IN = "notin"
+    """Label Requirement Operator ``key notin (value1, value2)``"""
+    OPERATOR_EXISTS = "exists"
+    """Label Requirement Operator ``key``"""
+    OPERATOR_NOT_EXISTS = "!exists"
+    """Label Requirement Operator ``!key``"""
+
+    __api_properties__ = ("key", "operator", "values")
+    __slots__ = __api_properties__
+
+    def __init__(
+        self,
+        key: str,
+        operator: str,
+        values: frozenset[str] = frozenset(),
+    ):
+        self.key = key
+        self.operator = operator
+        self.values = values
+
+    @property
+    def is_negative(self) -> bool:
+        """
+        Whether the requirement matches the labels without the key.
+        """
+        return self.operator in (
+            self.OPERATOR_NOT_EQUAL,
+            self.OPERATOR_NOT_IN,
+            self.OPERATOR_NOT_EXISTS,
+        )
+
+    def compile(self) -> Callable[[dict[str, str]], bool]:
+        """
+        Returns a function checking whether labels match the requirement.
+        """
+        key, values = self.key, self.values
+        if self.operator == self.OPERATOR_EXISTS:
+            return lambda labels: key in labels
+        if self.operator == self.OPERATOR_NOT_EXISTS:
+            return lambda labels: key not in labels
+        if self.operator in (self.OPERATOR_EQUAL, self.OPERATOR_IN):
+            return lambda labels: labels.get(key) in values
+        return lambda labels: labels.get(key) not in values
+
+
+def _split(selector: str) -> list[str]:
+    """
+    Splits a label selector on the commas outside of parentheses.
+    """
+    expressions = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(selector):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            expressions.append(selector[start:i])
+            start = i + 1
+    expressions.append(selector[start:])
+    return [o.strip() for o in expressions]
+
+
+def _parse_requirement(expression: str) -> LabelRequirement:
+    requirement: LabelRequirement | None = None
+    if match := _SET_REGEX.match(expression):
+        key, operator, values = match.groups()
+        requirement = LabelRequirement(
+            key, operator, frozenset(o.strip() for o in values.split(","))
+        )
+    elif match := _EQUALITY_REGEX.match(expression):
+        key, operator, value = match.groups()
+        if operator == "==":
+            operator = LabelRequirement.OPERATOR_EQUAL
+        requirement = LabelRequirement(key, operator, frozenset([value]))
+    elif match := _EXISTS_REGEX.match(expression):
+        negation, key = match.groups()
+        requirement = LabelRequirement(
+            key,
+            (
+                LabelRequirement.OPERATOR_NOT_EXISTS
+                if negation
+                else LabelRequirement.OPERATOR_EXISTS
+            ),
+        )
+
+    if requirement is None:
+        raise ValueError(f"invalid label selector expression {expression!r}")
+    if LabelValidator.KEY_REGEX.match(requirement.key) is None:
+        raise ValueError(f"invalid label key {requirement.key!r}")
+    for value in requirement.values:
+        if LabelValidator.VALUE_REGEX.match(value) is None:
+            raise ValueError(f"invalid label value {value!r}")
+    return requirement
+
+
+class LabelSelector:
+    """
+    Label selector evaluated locally, using the grammar of the API ``label_selector``
+    parameter: ``key=value``, ``key==value``, ``key!=value``, ``key in (v1, v2)``,
+    ``key notin (v1, v2)``, ``key`` and ``!key``, combined with commas.
+
+    The selector is parsed once, and compiled into a list of checks.
+
+    :param selector: Label selector to parse, an empty selector matches everything.
+    """
+
+    __slots__ = ("selector", "requirements", "_checks")
+
+    def __init__(self, selector: str):
+        self.selector = selector
+        self.requirements: list[LabelRequirement] = []
+        if selector.strip():
+            self.requirements = [_parse_requirement(o) for o in _split(selector)]
+        self._checks = [o.compile() for o in self.requirements]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.selector!r})"
+
+    def matches(self, labels: dict[str, str] | None) -> bool:
+        """
+        Checks whether labels match the selector.
+
+        :param labels: Labels to check.
+        """
+        labels = labels or {}
+        return all(check(labels) for check in self._checks)
+
+    def filter(
+        self,
+        items: Iterable[T],
+        labels: Callable[[T], dict[str, str] | None] = lambda o: o.labels,  # type: ignore[attr-defined]
+    ) -> list[T]:
+        """
+        Returns the items which labels match the selector.
+
+        :param items: Items to filter, e.g. bound models.
+        :param labels: Function returning the labels of an item.
+        """
+        return [o for o in items if self.matches(labels(o))]
+
+
+class LabelIndex(Generic[T]):
+    """
+    Inverted index of the labels of many items, selecting the items matching a label
+    selector with set operations instead of checking every item.
+
+    :param items: Items to index, e.g. bound models.
+    :param labels: Function returning the labels of an item.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[T],
+        labels: Callable[[T], dict[str, str] | None] = lambda o: o.labels,  # type: ignore[attr-defined]
+    ):
+        self._items = list(items)
+        self._all = frozenset(range(len(self._items)))
+        # Positions of the items by label key, and by label key and value
+        self._keys: dict[str, set[int]] = {}
+        self._values: dict[tuple[str, str], set[int]] = {}
+
+        for position, item in enumerate(self._items):
+            for key, value in (labels(item) or {}).items():
+                self._keys.setdefault(key, set()).add(position)
+                self._values.setdefault((key, value), set()).add(position)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _positions(self, requirement: LabelRequirement) -> set[int]:
+        """
+        Returns the positions of the items having the key, and one of the values if
+        any, of the requirement.
+        """
+        if not requirement.values:
+            return self._keys.get(requirement.key, set())
+        if len(requirement.values) == 1:
+            (value,) = requirement.values
+            return self._values.get((requirement.key, value), set())
+        return set().union(
+            *(self._values.get((requirement.key, o), ()) for o in requirement.values)
+        )
+
+    def select(self, selector: str | LabelSelector) -> list[T]:
+        """
+        Returns the items which labels match a label selector, in the indexing order.
+
+        :param selector: Label selector to evaluate.
+        """
+        if isinstance(selector, str):
+            selector = LabelSelector(selector)
+
+        positive = [o for o in selector.requirements if not o.is_negative]
+        negative = [o for o in selector.requirements if o.is_negative]
+
+        # Start from the smallest set of candidates
+        candidates: set[int] | frozenset[int] = self._all
+        for i, positions in enumerate(
+            sorted((self._positions(o) for o in positive), key=len)
+        ):
+            candidates = positions if i == 0 else candidates & positions
+            if not candidates:
+                return []
+        for requirement in negative:
+            candidates = candidates - self._positions(requirement)
+
+        return [self._items[o] for o in sorted(candidates)]
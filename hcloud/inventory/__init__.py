@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from .domain import Inventory, InventoryCollection, ResourceChange
+from .graph import ResourceGraph, ResourceKey, resource_key
+from .snapshot import take_snapshot
+from .watch import ChangeWatcher
+
+__all__ = [
+    "ChangeWatcher",
+    "Inventory",
+    "InventoryCollection",
+    "ResourceChange",
+    "ResourceGraph",
+    "ResourceKey",
+    "resource_key",
+    "take_snapshot",
+]
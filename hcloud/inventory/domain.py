@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Generic, NamedTuple, TypeVar
+
+from ..core import BaseDomain
+from ..helpers import LabelIndex, LabelSelector
+
+if TYPE_CHECKING:
+    from ..certificates import BoundCertificate
+    from ..firewalls import BoundFirewall
+    from ..floating_ips import BoundFloatingIP
+    from ..images import BoundImage
+    from ..load_balancers import BoundLoadBalancer
+    from ..networks import BoundNetwork
+    from ..placement_groups import BoundPlacementGroup
+    from ..primary_ips import BoundPrimaryIP
+    from ..servers import BoundServer
+    from ..ssh_keys import BoundSSHKey
+    from ..storage_boxes import BoundStorageBox
+    from ..volumes import BoundVolume
+    from ..zones import BoundZone
+
+__all__ = [
+    "Inventory",
+    "InventoryCollection",
+    "ResourceChange",
+]
+
+T = TypeVar("T")
+
+
+class InventoryCollection(Generic[T]):
+    """
+    Read-only collection of resources, indexed by ID and by name.
+
+    :param items: Resources of the collection.
+    """
+
+    __slots__ = ("_items", "_by_id", "_by_name", "_label_index")
+
+    def __init__(self, items: Iterable[T] = ()):
+        self._items = tuple(items)
+        self._by_id: dict[int, T] = {}
+        self._by_name: dict[str, T] = {}
+        self._label_index: LabelIndex[T] | None = None
+        for item in self._items:
+            self._by_id[item.id] = item  # type: ignore[attr-defined]
+            name = getattr(item, "name", None)
+            if name is not None:
+                self._by_name.setdefault(name, item)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
+
+    def __contains__(self, id: object) -> bool:
+        return id in self._by_id
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self._items)} items)"
+
+    def get_by_id(self, id: int) -> T | None:
+        """
+        Returns the resource with the given ID, if any.
+
+        :param id: ID of the resource.
+        """
+        return self._by_id.get(id)
+
+    def get_by_name(self, name: str) -> T | None:
+        """
+        Returns the first resource with the given name, if any. Images of different
+        architectures may share a name.
+
+        :param name: Name of the resource.
+        """
+        return self._by_name.get(name)
+
+    def select(self, selector: str | LabelSelector) -> list[T]:
+        """
+        Returns the resources matching a label selector, without any API call. The
+        label index is built on the first selection.
+
+        :param selector: Label selector, using the grammar of the API, see
+            :class:`LabelSelector <hcloud.helpers.label_selector.LabelSelector>`.
+        """
+        if self._label_index is None:
+            self._label_index = LabelIndex(self._items)
+        return self._label_index.select(selector)
+
+
+class Inventory(NamedTuple):
+    """
+    Immutable snapshot of the resources of a project, see :meth:`Client.snapshot
+    <hcloud.Client.snapshot>`.
+
+    The bound models of the snapshot are complete, reading their properties does not
+    send any request.
+    """
+
+    servers: InventoryCollection[BoundServer]
+    volumes: InventoryCollection[BoundVolume]
+    networks: InventoryCollection[BoundNetwork]
+    firewalls: InventoryCollection[BoundFirewall]
+    load_balancers: InventoryCollection[BoundLoadBalancer]
+    floating_ips: InventoryCollection[BoundFloatingIP]
+    primary_ips: InventoryCollection[BoundPrimaryIP]
+    certificates: InventoryCollection[BoundCertificate]
+    placement_groups: InventoryCollection[BoundPlacementGroup]
+    ssh_keys: InventoryCollection[BoundSSHKey]
+    images: InventoryCollection[BoundImage]
+    zones: InventoryCollection[BoundZone]
+    storage_boxes: InventoryCollection[BoundStorageBox]
+
+    def collections(self) -> Iterator[tuple[str, InventoryCollection[Any]]]:
+        """
+        Iterates over the names and the collections of the inventory.
+        """
+        return zip(self._fields, self)
+
+
+class ResourceChange(BaseDomain):
+    """Resource Change Domain
+
+    :param type: str
+           Type of the change. Choices: added, removed, changed
+    :param collection: str
+           Name of the collection of the resource, e.g. ``servers``
+    :param resource: Bound model of the resource, as last seen for a removed resource
+    :param fields: List[str]
+           Top level fields of the API payload that changed, empty unless the resource changed
+    """
+
+    TYPE_ADDED = "added"
+    """Resource Change Type added"""
+    TYPE_REMOVED = "removed"
+    """Resource Change Type removed"""
+    TYPE_CHANGED = "changed"
+    """Resource Change Type changed"""
+
+    __api_properties__ = ("type", "collection", "resource", "fields")
+    __slots__ = __api_properties__
+
+    def __init__(
+        self,
+        type: str,
+        collection: str,
+        resource: Any,
+        fields: list[str] | None = None,
+    ):
+        self.type = type
+        self.collection = collection
+        self.resource = resource
+        self.fields = fields or []
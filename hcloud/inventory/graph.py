@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from ..certificates import Certificate
+from ..firewalls import Firewall
+from ..floating_ips import FloatingIP
+from ..load_balancers import LoadBalancer
+from ..networks import Network
+from ..placement_groups import PlacementGroup
+from ..primary_ips import PrimaryIP
+from ..servers import Server
+from ..volumes import Volume
+
+if TYPE_CHECKING:
+    from .domain import Inventory
+
+__all__ = [
+    "ResourceGraph",
+    "ResourceKey",
+    "resource_key",
+]
+
+ResourceKey = tuple[str, int]
+"""Type and ID of a resource, e.g. ``("server", 42)``"""
+
+# Domain class, resource type and inventory collection of the linked resources
+_RESOURCE_TYPES: list[tuple[type[Any], str, str]] = [
+    (Server, "server", "servers"),
+    (Volume, "volume", "volumes"),
+    (Network, "network", "networks"),
+    (Firewall, "firewall", "firewalls"),
+    (LoadBalancer, "load_balancer", "load_balancers"),
+    (FloatingIP, "floating_ip", "floating_ips"),
+    (PrimaryIP, "primary_ip", "primary_ips"),
+    (Certificate, "certificate", "certificates"),
+    (PlacementGroup, "placement_group", "placement_groups"),
+]
+
+
+def resource_key(resource: Any) -> ResourceKey:
+    """
+    Returns the type and ID of a resource.
+
+    :param resource: Domain or bound model of a resource, or a resource key.
+    """
+    if isinstance(resource, tuple):
+        return resource
+    for cls, type_, _ in _RESOURCE_TYPES:
+        if isinstance(resource, cls):
+            return type_, resource.id
+    raise ValueError(f"unsupported resource {resource!r}")
+
+
+def _server_links(server: Server) -> Iterator[tuple[ResourceKey, ResourceKey]]:
+    key = resource_key(server)
+    for volume in server.volumes or []:
+        yield key, resource_key(volume)
+    for private_net in server.private_net or []:
+        yield key, resource_key(private_net.network)
+    if server.placement_group is not None:
+        yield key, resource_key(server.placement_group)
+
+    public_net = server.public_net
+    if public_net is None:
+        return
+    for firewall in public_net.firewalls or []:
+        yield key, resource_key(firewall.firewall)
+    for floating_ip in public_net.floating_ips or []:
+        yield key, resource_key(floating_ip)
+    for primary_ip in (public_net.primary_ipv4, public_net.primary_ipv6):
+        if primary_ip is not None:
+            yield key, resource_key(primary_ip)
+
+
+def _load_balancer_links(
+    load_balancer: LoadBalancer,
+) -> Iterator[tuple[ResourceKey, ResourceKey]]:
+    key = resource_key(load_balancer)
+    for target in load_balancer.targets or []:
+        for o in [target, *(target.targets or [])]:
+            if o.server is not None:
+                yield key, resource_key(o.server)
+    for private_net in load_balancer.private_net or []:
+        yield key, resource_key(private_net.network)
+    for service in load_balancer.services or []:
+        if service.http is not None:
+            for certificate in service.http.certificates or []:
+                yield key, resource_key(certificate)
+
+
+def _links(resource: Any) -> Iterator[tuple[ResourceKey, ResourceKey]]:
+    """
+    Yields the relationships of a resource, from the dependent resource to the
+    resource it depends on.
+    """
+    key = resource_key(resource)
+    if isinstance(resource, Server):
+        yield from _server_links(resource)
+    elif isinstance(resource, LoadBalancer):
+        yield from _load_balancer_links(resource)
+    elif isinstance(resource, (Volume, FloatingIP)):
+        if resource.server is not None:
+            yield resource_key(resource.server), key
+    elif isinstance(resource, PrimaryIP):
+        if resource.assignee_type == "server" and resource.assignee_id is not None:
+            yield ("server", resource.assignee_id), key
+    elif isinstance(resource, Firewall):
+        for applied_to in resource.applied_to or []:
+            if applied_to.server is not None:
+                yield resource_key(applied_to.server), key
+            for o in applied_to.applied_to_resources or []:
+                if o.server is not None:
+                    yield resource_key(o.server), key
+    elif isinstance(resource, Network):
+        for server in resource.servers or []:
+            yield resource_key(server), key
+    elif isinstance(resource, PlacementGroup):
+        for server_id in resource.servers or []:
+            yield ("server", server_id), key
+
+
+class ResourceGraph:
+    """
+    In-memory graph of the relationships between the resources of a project, built
+    from the list responses of the API, e.g. from an :class:`Inventory
+    <hcloud.inventory.domain.Inventory>`.
+
+    A relationship goes from a dependent resource to the resource it depends on,
+    e.g. from a server to its volumes, networks, firewalls, floating IPs, primary IPs
+    and placement group, or from a load balancer to its target servers, networks and
+    certificates. Both directions are indexed, the neighbours of a resource are found
+    without any API call.
+
+    Resources are identified by their :data:`ResourceKey`, every query also accepts
+    domain and bound models.
+
+    :param resources: Resources to add to the graph.
+    """
+
+    def __init__(self, resources: Iterable[Any] = ()):
+        self._dependencies: dict[ResourceKey, set[ResourceKey]] = {}
+        self._dependents: dict[ResourceKey, set[ResourceKey]] = {}
+
+        for resource in resources:
+            self.add(resource)
+
+    @classmethod
+    def from_inventory(cls, inventory: Inventory) -> ResourceGraph:
+        """
+        Build the graph from all the resources of an inventory.
+
+        :param inventory: Inventory to build the graph from.
+        """
+        return cls(
+            resource
+            for _, _, collection in _RESOURCE_TYPES
+            for resource in getattr(inventory, collection)
+        )
+
+    def _add_node(self, key: ResourceKey) -> None:
+        self._dependencies.setdefault(key, set())
+        self._dependents.setdefault(key, set())
+
+    def add(self, resource: Any) -> None:
+        """
+        Adds a resource and its relationships to the graph.
+
+        :param resource: Domain or bound model of the resource.
+        """
+        self._add_node(resource_key(resource))
+        for source, target in _links(resource):
+            self.add_edge(source, target)
+
+    def add_edge(self, source: Any, target: Any) -> None:
+        """
+        Adds a relationship from a resource to a resource it depends on.
+
+        :param source: Dependent resource.
+        :param target: Resource the source depends on.
+        """
+        source, target = resource_key(source), resource_key(target)
+        self._add_node(source)
+        self._add_node(target)
+        self._dependencies[source].add(target)
+        self._dependents[target].add(source)
+
+    def __len__(self) -> int:
+        return len(self._dependencies)
+
+    def __iter__(self) -> Iterator[ResourceKey]:
+        return iter(self._dependencies)
+
+    def __contains__(self, resource: Any) -> bool:
+        return resource_key(resource) in self._dependencies
+
+    def dependencies(self, resource: Any) -> frozenset[ResourceKey]:
+        """
+        Returns the resources a resource depends on directly.
+
+        :param resource: Domain or bound model of the resource, or its key.
+        """
+        return frozenset(self._dependencies.get(resource_key(resource), ()))
+
+    def dependents(self, resource: Any) -> frozenset[ResourceKey]:
+        """
+        Returns the resources depending directly on a resource.
+
+        :param resource: Domain or bound model of the resource, or its key.
+        """
+        return frozenset(self._dependents.get(resource_key(resource), ()))
+
+    def neighbours(self, resource: Any) -> frozenset[ResourceKey]:
+        """
+        Returns the resources related to a resource, in both directions.
+
+        :param resource: Domain or bound model of the resource, or its key.
+        """
+        return self.dependencies(resource) | self.dependents(resource)
+
+    def blast_radius(self, resource: Any) -> set[ResourceKey]:
+        """
+        Returns the resources depending on a resource, directly or transitively, e.g.
+        the servers of a network and the load balancers targeting those servers.
+
+        :param resource: Domain or bound model of the resource, or its key.
+        """
+        start = resource_key(resource)
+        found: set[ResourceKey] = set()
+        queue: deque[ResourceKey] = deque([start])
+        while queue:
+            for key in self._dependents.get(queue.popleft(), ()):
+                if key not in found and key != start:
+                    found.add(key)
+                    queue.append(key)
+        return found
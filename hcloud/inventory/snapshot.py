@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any
+
+from ..certificates import BoundCertificate
+from ..core import Meta
+from ..firewalls import BoundFirewall
+from ..floating_ips import BoundFloatingIP
+from ..images import BoundImage
+from ..load_balancers import BoundLoadBalancer
+from ..networks import BoundNetwork
+from ..placement_groups import BoundPlacementGroup
+from ..primary_ips import BoundPrimaryIP
+from ..servers import BoundServer
+from ..ssh_keys import BoundSSHKey
+from ..storage_boxes import BoundStorageBox
+from ..volumes import BoundVolume
+from ..zones import BoundZone
+from .domain import Inventory, InventoryCollection
+
+if TYPE_CHECKING:
+    from .._client import Client
+    from ..core import ResourceClientBase
+
+__all__ = [
+    "take_snapshot",
+]
+
+_BOUND_MODELS: dict[str, type[Any]] = {
+    "servers": BoundServer,
+    "volumes": BoundVolume,
+    "networks": BoundNetwork,
+    "firewalls": BoundFirewall,
+    "load_balancers": BoundLoadBalancer,
+    "floating_ips": BoundFloatingIP,
+    "primary_ips": BoundPrimaryIP,
+    "certificates": BoundCertificate,
+    "placement_groups": BoundPlacementGroup,
+    "ssh_keys": BoundSSHKey,
+    "images": BoundImage,
+    "zones": BoundZone,
+    "storage_boxes": BoundStorageBox,
+}
+
+
+def _fetch_page(
+    resource_client: ResourceClientBase,
+    name: str,
+    *,
+    page: int,
+    per_page: int,
+    label_selector: str | None = None,
+) -> tuple[list[dict[str, Any]], Meta]:
+    """
+    Fetches a page of a collection, as the ``get_list`` method of its client, but
+    returns the API payloads of the resources instead of bound models.
+    """
+    params: dict[str, Any] = {"page": page, "per_page": per_page}
+    if label_selector is not None:
+        params["label_selector"] = label_selector
+
+    # pylint: disable=protected-access
+    response = resource_client._client.request(
+        url=resource_client._base_url,
+        method="GET",
+        params=params,
+    )
+    return response[name], Meta.parse_meta(response)
+
+
+def take_snapshot(client: Client, *, concurrency: int = 10) -> Inventory:
+    """
+    Fetches all the resources of a project concurrently, from the Hetzner Cloud and
+    the Hetzner APIs, and returns them as an immutable :class:`Inventory
+    <hcloud.inventory.domain.Inventory>`.
+
+    The first page of every collection is fetched at once, the remaining pages of a
+    collection are fetched concurrently as soon as its number of pages is known.
+
+    :param client: Client used to fetch the resources.
+    :param concurrency: Maximum number of requests sent concurrently.
+    """
+    resource_clients: dict[str, ResourceClientBase] = {
+        name: getattr(client, name) for name in Inventory._fields
+    }
+    pages: dict[str, dict[int, list[dict[str, Any]]]] = {
+        name: {} for name in Inventory._fields
+    }
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pending: dict[Future[tuple[list[dict[str, Any]], Meta]], tuple[str, int]] = {}
+
+        def submit(name: str, page: int) -> None:
+            resource_client = resource_clients[name]
+            future = executor.submit(
+                _fetch_page,
+                resource_client,
+                name,
+                page=page,
+                per_page=resource_client.max_per_page,
+            )
+            pending[future] = (name, page)
+
+        for name in Inventory._fields:
+            submit(name, 1)
+
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, page = pending.pop(future)
+                    result, meta = future.result()
+                    pages[name][page] = result
+
+                    pagination = meta.pagination
+                    if pagination is None:
+                        continue
+                    if pagination.last_page is not None:
+                        if page == 1:
+                            for next_page in range(2, pagination.last_page + 1):
+                                submit(name, next_page)
+                    elif pagination.next_page:
+                        submit(name, pagination.next_page)
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    return Inventory(
+        *(
+            InventoryCollection(
+                _BOUND_MODELS[name](resource_clients[name], o)
+                for page in sorted(p)
+                for o in p[page]
+            )
+            for name, p in pages.items()
+        )
+    )
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .domain import Inventory, ResourceChange
+from .snapshot import _BOUND_MODELS, _fetch_page
+
+if TYPE_CHECKING:
+    from .._client import Client
+    from ..core import ResourceClientBase
+
+__all__ = [
+    "ChangeWatcher",
+]
+
+
+def _digest(value: Any) -> bytes:
+    payload = json.dumps(value, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
+
+class _Seen(NamedTuple):
+    """
+    Resource as seen by the last poll.
+    """
+
+    digest: bytes
+    """Content hash of the API payload"""
+    fields: dict[str, bytes]
+    """Content hashes of the top level fields of the API payload"""
+    resource: Any
+    """Bound model last passed to the callbacks"""
+
+
+class ChangeWatcher:
+    """
+    Polls collections of resources, and calls the subscribed callbacks with the
+    resources added, removed and changed since the previous poll.
+
+    A content hash of the API payload of every resource, and of each of its top
+    level fields, is kept between two polls, with the bound model last passed to the
+    callbacks. Only the field hashes of the resources whose hash differs are
+    compared. The interval of a collection doubles after every poll without change,
+    up to ``max_interval``, and is reset on the first change.
+
+    :param client: Client used to fetch the resources.
+    :param collections: Names of the collections to watch, e.g. ``servers``, defaults
+        to all the collections of an :class:`Inventory
+        <hcloud.inventory.domain.Inventory>`.
+    :param label_selector: Label selector used to filter the resources.
+    :param interval: Seconds between two polls of a collection that changed.
+    :param max_interval: Maximum seconds between two polls of an idle collection.
+    :param concurrency: Maximum number of collections fetched concurrently.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        collections: list[str] | None = None,
+        *,
+        label_selector: str | None = None,
+        interval: float = 10.0,
+        max_interval: float = 300.0,
+        concurrency: int = 5,
+    ):
+        if collections is None:
+            collections = list(Inventory._fields)
+        for name in collections:
+            if name not in _BOUND_MODELS:
+                raise ValueError(f"unsupported collection {name!r}")
+
+        self._client = client
+        self._collections = collections
+        self._label_selector = label_selector
+        self._interval = interval
+        self._max_interval = max_interval
+        self._concurrency = concurrency
+
+        self._callbacks: list[Callable[[ResourceChange], None]] = []
+        self._seen: dict[str, dict[int, _Seen]] = {}
+        self._intervals = {name: interval for name in collections}
+        self._next_polls = {name: 0.0 for name in collections}
+
+        self.errors: dict[str | None, Exception] = {}
+        """
+        Errors raised while fetching the collections, by collection name. In
+        :meth:`run`, an error failing a whole poll, e.g. a subscribed callback, is
+        stored with the ``None`` key.
+        """
+
+    def subscribe(self, callback: Callable[[ResourceChange], None]) -> None:
+        """
+        Subscribes a callback to the resource changes.
+
+        :param callback: Function called with each resource change.
+        """
+        self._callbacks.append(callback)
+
+    def _fetch(self, name: str) -> list[dict[str, Any]]:
+        resource_client: ResourceClientBase = getattr(self._client, name)
+        # pylint: disable=protected-access
+        return resource_client._iter_pages(
+            _fetch_page,
+            resource_client,
+            name,
+            label_selector=self._label_selector,
+        )
+
+    def _diff(self, name: str, items: list[dict[str, Any]]) -> list[ResourceChange]:
+        resource_client = getattr(self._client, name)
+        bound_model = _BOUND_MODELS[name]
+
+        previous = self._seen.get(name, {})
+        current: dict[int, _Seen] = {}
+        changes: list[ResourceChange] = []
+
+        for data in items:
+            digest = _digest(data)
+            known = previous.get(data["id"])
+            if known is not None and known.digest == digest:
+                current[data["id"]] = known
+                continue
+
+            fields = {key: _digest(value) for key, value in data.items()}
+            resource = bound_model(resource_client, data)
+            current[data["id"]] = _Seen(digest, fields, resource)
+
+            if known is None:
+                changes.append(
+                    ResourceChange(ResourceChange.TYPE_ADDED, name, resource)
+                )
+            else:
+                changes.append(
+                    ResourceChange(
+                        ResourceChange.TYPE_CHANGED,
+                        name,
+                        resource,
+                        sorted(
+                            key
+                            for key in known.fields.keys() | fields.keys()
+                            if known.fields.get(key) != fields.get(key)
+                        ),
+                    )
+                )
+
+        for id, seen in previous.items():
+            if id not in current:
+                changes.append(
+                    ResourceChange(ResourceChange.TYPE_REMOVED, name, seen.resource)
+                )
+
+        self._seen[name] = current
+        return changes
+
+    def poll(self) -> list[ResourceChange]:
+        """
+        Fetches the collections due for a poll, and calls the subscribed callbacks
+        with the changes.
+
+        On the first poll, every resource is added. The resources of a collection
+        that failed to be fetched are kept unchanged, see :attr:`errors`.
+
+        :return: The resource changes since the previous poll.
+        """
+        now = time.monotonic()
+        due = [o for o in self._collections if self._next_polls[o] <= now]
+
+        def fetch(name: str) -> list[dict[str, Any]] | Exception:
+            try:
+                return self._fetch(name)
+            except Exception as exception:  # pylint: disable=broad-exception-caught
+                return exception
+
+        with ThreadPoolExecutor(max_workers=self._concurrency) as executor:
+            results = list(executor.map(fetch, due))
+
+        changes: list[ResourceChange] = []
+        for name, result in zip(due, results):
+            if isinstance(result, Exception):
+                self.errors[name] = result
+            else:
+                self.errors.pop(name, None)
+                collection_changes = self._diff(name, result)
+                changes.extend(collection_changes)
+
+                if collection_changes:
+                    self._intervals[name] = self._interval
+                else:
+                    self._intervals[name] = min(
+                        self._intervals[name] * 2, self._max_interval
+                    )
+            self._next_polls[name] = now + self._intervals[name]
+
+        for change in changes:
+            for callback in self._callbacks:
+                callback(change)
+
+        return changes
+
+    def run(self, stop: threading.Event | None = None) -> None:
+        """
+        Polls the collections when they are due, until the ``stop`` event is set.
+
+        A failing poll does not stop the loop, the error is stored in :attr:`errors`
+        and the next poll happens after ``interval``.
+
+        :param stop: Event stopping the loop when set.
+        """
+        if stop is None:
+            stop = threading.Event()
+
+        while not stop.is_set():
+            try:
+                self.poll()
+            except Exception as exception:  # pylint: disable=broad-exception-caught
+                self.errors[None] = exception
+                stop.wait(self._interval)
+                continue
+
+            self.errors.pop(None, None)
+            stop.wait(max(0.0, min(self._next_polls.values()) - time.monotonic()))
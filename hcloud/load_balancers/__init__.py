@@ -15,6 +15,7 @@ from .domain import (
     LoadBalancerHealtCheckHttp,
     LoadBalancerHealthCheck,
     LoadBalancerHealthCheckHttp,
+    LoadBalancerHealthStatusChange,
     LoadBalancerProtection,
     LoadBalancerService,
     LoadBalancerServiceHttp,
@@ -22,10 +23,12 @@ from .domain import (
     LoadBalancerTargetHealthStatus,
     LoadBalancerTargetIP,
     LoadBalancerTargetLabelSelector,
+    LoadBalancerTargetSyncResult,
     MetricsType,
     PrivateNet,
     PublicNetwork,
 )
+from .health import LoadBalancerHealthMonitor
 
 __all__ = [
     "BoundLoadBalancer",
@@ -39,12 +42,15 @@ __all__ = [
     "LoadBalancerHealtCheckHttp",
     "LoadBalancerHealthCheckHttp",
     "LoadBalancerHealthCheck",
+    "LoadBalancerHealthMonitor",
+    "LoadBalancerHealthStatusChange",
     "LoadBalancerService",
     "LoadBalancerServiceHttp",
     "LoadBalancerTarget",
     "LoadBalancerTargetHealthStatus",
     "LoadBalancerTargetIP",
     "LoadBalancerTargetLabelSelector",
+    "LoadBalancerTargetSyncResult",
     "LoadBalancersClient",
     "LoadBalancersPageResult",
     "PrivateNet",
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, NamedTuple
 
 from dateutil.parser import isoparse
 
+from .._exceptions import APIException
 from ..actions import (
     ActionSort,
     ActionsPageResult,
@@ -35,9 +39,11 @@ from .domain import (
     LoadBalancerTargetHealthStatus,
     LoadBalancerTargetIP,
     LoadBalancerTargetLabelSelector,
+    LoadBalancerTargetSyncResult,
     MetricsType,
     PrivateNet,
     PublicNetwork,
+    _load_balancer_target_key,
 )
 
 if TYPE_CHECKING:
@@ -54,12 +60,121 @@ __all__ = [
 ]
 
 
+def _load_balancer_targets(
+    client: LoadBalancersClient,
+    raw_targets: list[dict[str, Any]],
+) -> list[LoadBalancerTarget]:
+    return [_load_balancer_target(client, raw_target) for raw_target in raw_targets]
+
+
+def _load_balancer_target(
+    client: LoadBalancersClient,
+    raw_target: dict[str, Any],
+) -> LoadBalancerTarget:
+    result = LoadBalancerTarget(type=raw_target["type"])
+
+    if raw_target["type"] == "ip":
+        result.ip = LoadBalancerTargetIP(
+            ip=raw_target["ip"]["ip"],
+        )
+
+    elif raw_target["type"] == "server":
+        result.server = BoundServer(
+            client._parent.servers,  # pylint: disable=protected-access
+            data=raw_target["server"],
+            complete=False,
+        )
+        result.use_private_ip = raw_target["use_private_ip"]
+
+    elif raw_target["type"] == "label_selector":
+        result.label_selector = LoadBalancerTargetLabelSelector(
+            selector=raw_target["label_selector"]["selector"]
+        )
+        result.use_private_ip = raw_target["use_private_ip"]
+
+        if (raw_nested_targets := raw_target.get("targets")) is not None:
+            result.targets = _load_balancer_targets(client, raw_nested_targets)
+
+    if (raw_health_status := raw_target.get("health_status")) is not None:
+        result.health_status = [
+            LoadBalancerTargetHealthStatus(
+                listen_port=item["listen_port"],
+                status=item["status"],
+            )
+            for item in raw_health_status
+        ]
+
+    return result
+
+
+def _load_balancer_services(
+    client: LoadBalancersClient,
+    raw_services: list[dict[str, Any]],
+) -> list[LoadBalancerService]:
+    services = []
+    for service in raw_services:
+        tmp_service = LoadBalancerService(
+            protocol=service["protocol"],
+            listen_port=service["listen_port"],
+            destination_port=service["destination_port"],
+            proxyprotocol=service["proxyprotocol"],
+        )
+        if service["protocol"] != "tcp":
+            tmp_service.http = LoadBalancerServiceHttp(
+                sticky_sessions=service["http"]["sticky_sessions"],
+                redirect_http=service["http"]["redirect_http"],
+                cookie_name=service["http"]["cookie_name"],
+                cookie_lifetime=service["http"]["cookie_lifetime"],
+                timeout_idle=service["http"]["timeout_idle"],
+            )
+            tmp_service.http.certificates = [
+                BoundCertificate(
+                    client._parent.certificates,  # pylint: disable=protected-access
+                    {"id": certificate},
+                    complete=False,
+                )
+                for certificate in service["http"]["certificates"]
+            ]
+
+        tmp_service.health_check = LoadBalancerHealthCheck(
+            protocol=service["health_check"]["protocol"],
+            port=service["health_check"]["port"],
+            interval=service["health_check"]["interval"],
+            retries=service["health_check"]["retries"],
+            timeout=service["health_check"]["timeout"],
+        )
+        if tmp_service.health_check.protocol != "tcp":
+            tmp_service.health_check.http = LoadBalancerHealthCheckHttp(
+                domain=service["health_check"]["http"]["domain"],
+                path=service["health_check"]["http"]["path"],
+                response=service["health_check"]["http"]["response"],
+                tls=service["health_check"]["http"]["tls"],
+                status_codes=service["health_check"]["http"]["status_codes"],
+            )
+        services.append(tmp_service)
+    return services
+
+
 class BoundLoadBalancer(BoundModelBase[LoadBalancer], LoadBalancer):
+    """
+    Bound Load Balancer.
+
+    The ``targets`` and ``services`` of the Load Balancer are large for Load Balancers
+    with many targets, they are kept raw and only decoded when first accessed.
+    """
+
     _client: LoadBalancersClient
 
     model = LoadBalancer
 
-    # pylint: disable=too-many-branches,too-many-locals
+    _lazy_decoders: dict[
+        str,
+        Callable[[LoadBalancersClient, list[dict[str, Any]]], list[Any]],
+    ] = {
+        "targets": _load_balancer_targets,
+        "services": _load_balancer_services,
+    }
+
     def __init__(
         self,
         client: LoadBalancersClient,
@@ -93,96 +208,13 @@ class BoundLoadBalancer(BoundModelBase[LoadBalancer], LoadBalancer):
             ]
             data["private_net"] = private_nets
 
-        def _load_balancer_targets(
-            raw_targets: list[dict[str, Any]],
-        ) -> list[LoadBalancerTarget]:
-            return [_load_balancer_target(raw_target) for raw_target in raw_targets]
-
-        def _load_balancer_target(
-            raw_target: dict[str, Any],
-        ) -> LoadBalancerTarget:
-            result = LoadBalancerTarget(type=raw_target["type"])
-
-            if raw_target["type"] == "ip":
-                result.ip = LoadBalancerTargetIP(
-                    ip=raw_target["ip"]["ip"],
-                )
-
-            elif raw_target["type"] == "server":
-                result.server = BoundServer(
-                    client._parent.servers,  # pylint: disable=protected-access
-                    data=raw_target["server"],
-                    complete=False,
-                )
-                result.use_private_ip = raw_target["use_private_ip"]
-
-            elif raw_target["type"] == "label_selector":
-                result.label_selector = LoadBalancerTargetLabelSelector(
-                    selector=raw_target["label_selector"]["selector"]
-                )
-                result.use_private_ip = raw_target["use_private_ip"]
-
-                if (raw_nested_targets := raw_target.get("targets")) is not None:
-                    result.targets = _load_balancer_targets(raw_nested_targets)
-
-            if (raw_health_status := raw_target.get("health_status")) is not None:
-                result.health_status = [
-                    LoadBalancerTargetHealthStatus(
-                        listen_port=item["listen_port"],
-                        status=item["status"],
-                    )
-                    for item in raw_health_status
-                ]
-
-            return result
-
-        if (raw_targets := data.get("targets")) is not None:
-            data["targets"] = _load_balancer_targets(raw_targets)
-
-        services = data.get("services")
-        if services:
-            tmp_services = []
-            for service in services:
-                tmp_service = LoadBalancerService(
-                    protocol=service["protocol"],
-                    listen_port=service["listen_port"],
-                    destination_port=service["destination_port"],
-                    proxyprotocol=service["proxyprotocol"],
-                )
-                if service["protocol"] != "tcp":
-                    tmp_service.http = LoadBalancerServiceHttp(
-                        sticky_sessions=service["http"]["sticky_sessions"],
-                        redirect_http=service["http"]["redirect_http"],
-                        cookie_name=service["http"]["cookie_name"],
-                        cookie_lifetime=service["http"]["cookie_lifetime"],
-                        timeout_idle=service["http"]["timeout_idle"],
-                    )
-                    tmp_service.http.certificates = [
-                        BoundCertificate(
-                            client._parent.certificates,
-                            {"id": certificate},
-                            complete=False,
-                        )
-                        for certificate in service["http"]["certificates"]
-                    ]
-
-                tmp_service.health_check = LoadBalancerHealthCheck(
-                    protocol=service["health_check"]["protocol"],
-                    port=service["health_check"]["port"],
-                    interval=service["health_check"]["interval"],
-                    retries=service["health_check"]["retries"],
-                    timeout=service["health_check"]["timeout"],
-                )
-                if tmp_service.health_check.protocol != "tcp":
-                    tmp_service.health_check.http = LoadBalancerHealthCheckHttp(
-                        domain=service["health_check"]["http"]["domain"],
-                        path=service["health_check"]["http"]["path"],
-                        response=service["health_check"]["http"]["response"],
-                        tls=service["health_check"]["http"]["tls"],
-                        status_codes=service["health_check"]["http"]["status_codes"],
-                    )
-                tmp_services.append(tmp_service)
-            data["services"] = tmp_services
+        # Decoded on first access, see __getattr__.
+        self.__dict__["_lazy_lock"] = threading.Lock()
+        lazy_data: dict[str, list[dict[str, Any]]] = {}
+        for name in self._lazy_decoders:
+            if (raw := data.get(name)) is not None:
+                lazy_data[name] = raw
+                data[name] = None
 
         load_balancer_type = data.get("load_balancer_type")
         if load_balancer_type is not None:
@@ -195,6 +227,44 @@ class BoundLoadBalancer(BoundModelBase[LoadBalancer], LoadBalancer):
             data["location"] = BoundLocation(client._parent.locations, location)
 
         super().__init__(client, data, complete)
+        self._lazy_data = lazy_data
+
+    def _decode_lazy_data(self, name: str) -> None:
+        with self.__dict__["_lazy_lock"]:
+            # Another thread may have decoded the data while waiting for the lock
+            lazy_data = self.__dict__["_lazy_data"]
+            if name not in lazy_data:
+                return
+            setattr(
+                self.__dict__["_data_model"],
+                name,
+                self._lazy_decoders[name](self._client, lazy_data[name]),
+            )
+            # Only removed once decoded, other threads wait for the lock until then
+            del lazy_data[name]
+
+    @property
+    def data_model(self) -> LoadBalancer:
+        for name in list(self.__dict__.get("_lazy_data", ())):
+            self._decode_lazy_data(name)
+        data_model: LoadBalancer = self.__dict__["_data_model"]
+        return data_model
+
+    @data_model.setter
+    def data_model(self, value: LoadBalancer) -> None:
+        with self.__dict__["_lazy_lock"]:
+            self.__dict__["_data_model"] = value
+            self.__dict__["_lazy_data"] = {}
+
+    def __getattr__(self, name: str):  # type: ignore[no-untyped-def]
+        if name in self.__dict__.get("_lazy_data", ()):
+            self._decode_lazy_data(name)
+
+        value = getattr(self.__dict__["_data_model"], name)
+        if not value and not self.complete:
+            self.reload()
+            value = getattr(self.__dict__["_data_model"], name)
+        return value
 
     def update(
         self,
@@ -321,6 +391,21 @@ class BoundLoadBalancer(BoundModelBase[LoadBalancer], LoadBalancer):
         """
         return self._client.remove_target(self, target=target)
 
+    def sync_targets(
+        self,
+        targets: list[LoadBalancerTarget],
+        *,
+        concurrency: int = 5,
+    ) -> list[LoadBalancerTargetSyncResult]:
+        """Adds and removes targets until the Load Balancer targets match the desired targets.
+
+        :param targets: List[:class:`LoadBalancerTarget <hcloud.load_balancers.domain.LoadBalancerTarget>`]
+                       The desired targets of the Load Balancer
+        :param concurrency: Maximum number of operations applied concurrently.
+        :return: List[:class:`LoadBalancerTargetSyncResult <hcloud.load_balancers.domain.LoadBalancerTargetSyncResult>`]
+        """
+        return self._client.sync_targets(self, targets=targets, concurrency=concurrency)
+
     def change_algorithm(self, algorithm: LoadBalancerAlgorithm) -> BoundAction:
         """Changes the algorithm used by the Load Balancer
 
@@ -796,6 +881,95 @@ class LoadBalancersClient(
         )
         return BoundAction(self._parent.actions, response["action"])
 
+    def sync_targets(
+        self,
+        load_balancer: LoadBalancer | BoundLoadBalancer,
+        targets: list[LoadBalancerTarget],
+        *,
+        concurrency: int = 5,
+    ) -> list[LoadBalancerTargetSyncResult]:
+        """Adds and removes targets until the Load Balancer targets match the desired targets.
+
+        Server targets already covered by one of the desired label selector targets are
+        not added individually. Targets only differing by ``use_private_ip`` are
+        replaced.
+
+        The removals are applied first, then the additions, each concurrently and
+        followed by a single wait on all their actions. A failed operation does not
+        interrupt the others, its error is reported in the result.
+
+        :param load_balancer: :class:`BoundLoadBalancer <hcloud.load_balancers.client.BoundLoadBalancer>` or :class:`LoadBalancer <hcloud.load_balancers.domain.LoadBalancer>`
+        :param targets: List[:class:`LoadBalancerTarget <hcloud.load_balancers.domain.LoadBalancerTarget>`]
+                       The desired targets of the Load Balancer
+        :param concurrency: Maximum number of operations applied concurrently.
+        :return: List[:class:`LoadBalancerTargetSyncResult <hcloud.load_balancers.domain.LoadBalancerTargetSyncResult>`]
+        """
+        current_targets = load_balancer.targets
+        if current_targets is None:
+            current_targets = self.get_by_id(load_balancer.id).targets or []  # type: ignore[arg-type]
+
+        current = {_load_balancer_target_key(o): o for o in current_targets}
+        desired = {_load_balancer_target_key(o): o for o in targets}
+
+        # Servers resolved by the label selectors that are kept
+        covered = {
+            _load_balancer_target_key(nested)
+            for key, target in current.items()
+            if key in desired and target.type == "label_selector"
+            for nested in target.targets or []
+        }
+
+        removals: list[LoadBalancerTargetSyncResult] = []
+        additions: list[LoadBalancerTargetSyncResult] = []
+        for key, target in current.items():
+            if key not in desired:
+                removals.append(LoadBalancerTargetSyncResult(target, "remove"))
+        for key, target in desired.items():
+            if key in current:
+                if target.use_private_ip in (None, current[key].use_private_ip):
+                    continue
+                removals.append(LoadBalancerTargetSyncResult(current[key], "remove"))
+            elif key in covered:
+                continue
+            additions.append(LoadBalancerTargetSyncResult(target, "add"))
+
+        def apply(result: LoadBalancerTargetSyncResult) -> None:
+            try:
+                if result.operation == "add":
+                    result.action = self.add_target(load_balancer, result.target)
+                else:
+                    result.action = self.remove_target(load_balancer, result.target)
+            except APIException as exception:
+                result.error = exception
+
+        def apply_all(
+            executor: ThreadPoolExecutor,
+            results: list[LoadBalancerTargetSyncResult],
+        ) -> None:
+            list(executor.map(apply, results))
+
+            actions = [o.action for o in results if o.action is not None]
+            errors = self.actions.wait_for_all(actions)
+            for result in results:
+                if result.action is not None:
+                    result.error = errors.get(result.action.id)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            apply_all(executor, removals)
+
+            # Do not add back a replaced target whose removal failed
+            failed = {
+                _load_balancer_target_key(o.target): o.error
+                for o in removals
+                if o.error is not None
+            }
+            for result in additions:
+                result.error = failed.get(_load_balancer_target_key(result.target))
+
+            apply_all(executor, [o for o in additions if o.error is None])
+
+        return removals + additions
+
     def change_algorithm(
         self,
         load_balancer: LoadBalancer | BoundLoadBalancer,
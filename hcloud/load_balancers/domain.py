@@ -489,6 +489,62 @@ class LoadBalancerTarget(BaseDomain):
         return payload
 
 
+def _load_balancer_target_key(target: LoadBalancerTarget) -> tuple[str, Any]:
+    """
+    Returns the key identifying a target on a Load Balancer.
+    """
+    if target.type == "server":
+        if target.server is None:
+            raise ValueError(f"server is not defined in target {target!r}")
+        return (target.type, target.server.id)
+
+    if target.type == "label_selector":
+        if target.label_selector is None:
+            raise ValueError(f"label_selector is not defined in target {target!r}")
+        return (target.type, target.label_selector.selector)
+
+    if target.type == "ip":
+        if target.ip is None:
+            raise ValueError(f"ip is not defined in target {target!r}")
+        return (target.type, target.ip.ip)
+
+    raise ValueError(f"unsupported type in target {target!r}")
+
+
+class LoadBalancerTargetSyncResult(BaseDomain):
+    """LoadBalancerTargetSyncResult Domain
+
+    :param target: :class:`LoadBalancerTarget <hcloud.load_balancers.domain.LoadBalancerTarget>`
+           Target added to or removed from the Load Balancer
+    :param operation: str
+           Operation applied to the target. Choices: add, remove
+    :param action: :class:`BoundAction <hcloud.actions.client.BoundAction>`
+           Action of the operation, None if the operation failed
+    :param error: Exception
+           Error raised while applying the operation
+    """
+
+    __api_properties__ = (
+        "target",
+        "operation",
+        "action",
+        "error",
+    )
+    __slots__ = __api_properties__
+
+    def __init__(
+        self,
+        target: LoadBalancerTarget,
+        operation: Literal["add", "remove"],
+        action: BoundAction | None = None,
+        error: Exception | None = None,
+    ):
+        self.target = target
+        self.operation = operation
+        self.action = action
+        self.error = error
+
+
 class LoadBalancerTargetHealthStatus(BaseDomain):
     """LoadBalancerTargetHealthStatus Domain
 
@@ -511,6 +567,45 @@ class LoadBalancerTargetHealthStatus(BaseDomain):
         self.status = status
 
 
+class LoadBalancerHealthStatusChange(BaseDomain):
+    """LoadBalancerHealthStatusChange Domain
+
+    :param load_balancer: :class:`BoundLoadBalancer <hcloud.load_balancers.client.BoundLoadBalancer>`
+           Load Balancer of the target
+    :param target: :class:`LoadBalancerTarget <hcloud.load_balancers.domain.LoadBalancerTarget>`
+           Target which health status changed, label selector targets are resolved to their servers
+    :param listen_port: int
+           Listen port of the service
+    :param previous: str
+           Previous health status, None if the target was not known yet
+    :param status: str
+           New health status, None if the target was removed. Choices: healthy, unhealthy, unknown
+    """
+
+    __api_properties__ = (
+        "load_balancer",
+        "target",
+        "listen_port",
+        "previous",
+        "status",
+    )
+    __slots__ = __api_properties__
+
+    def __init__(
+        self,
+        load_balancer: BoundLoadBalancer,
+        target: LoadBalancerTarget,
+        listen_port: int,
+        previous: str | None = None,
+        status: str | None = None,
+    ):
+        self.load_balancer = load_balancer
+        self.target = target
+        self.listen_port = listen_port
+        self.previous = previous
+        self.status = status
+
+
 class LoadBalancerTargetLabelSelector(BaseDomain):
     """LoadBalancerTargetLabelSelector Domain
 
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from .domain import (
+    LoadBalancer,
+    LoadBalancerHealthStatusChange,
+    LoadBalancerTarget,
+    _load_balancer_target_key,
+)
+
+if TYPE_CHECKING:
+    from .client import BoundLoadBalancer, LoadBalancersClient
+
+__all__ = [
+    "LoadBalancerHealthMonitor",
+]
+
+# Load Balancer ID, target key and listen port
+LoadBalancerHealthKey = tuple[int, tuple[str, Any], int]
+
+
+def _iter_health_statuses(
+    targets: list[LoadBalancerTarget],
+) -> Iterator[tuple[LoadBalancerTarget, int, str]]:
+    for target in targets:
+        if target.type == "label_selector":
+            yield from _iter_health_statuses(target.targets or [])
+            continue
+
+        for health_status in target.health_status or []:
+            if health_status.listen_port is None or health_status.status is None:
+                continue
+            yield target, health_status.listen_port, health_status.status
+
+
+class LoadBalancerHealthMonitor:
+    """
+    Polls the health of the targets of many Load Balancers, and calls the subscribed
+    callbacks with the health status transitions.
+
+    The health statuses are kept in a flat table, keyed by Load Balancer ID, target
+    key and listen port. Label selector targets are resolved to their servers.
+
+    :param client: Load Balancers client used to fetch the Load Balancers.
+    :param load_balancers: Load Balancers to monitor. When not set, all the Load
+        Balancers matching the ``label_selector`` are monitored.
+    :param label_selector: Label selector used to find the Load Balancers to monitor.
+    :param interval: Seconds between two polls in :meth:`run`.
+    :param concurrency: Maximum number of Load Balancers fetched concurrently.
+    """
+
+    def __init__(
+        self,
+        client: LoadBalancersClient,
+        load_balancers: list[LoadBalancer | BoundLoadBalancer] | None = None,
+        *,
+        label_selector: str | None = None,
+        interval: float = 10.0,
+        concurrency: int = 5,
+    ):
+        self._client = client
+        self._load_balancers = load_balancers
+        self._label_selector = label_selector
+        self._interval = interval
+        self._concurrency = concurrency
+
+        self._callbacks: list[Callable[[LoadBalancerHealthStatusChange], None]] = []
+        self._statuses: dict[LoadBalancerHealthKey, str] = {}
+        self._targets: dict[
+            LoadBalancerHealthKey, tuple[BoundLoadBalancer, LoadBalancerTarget]
+        ] = {}
+
+        self.errors: dict[int | None, Exception] = {}
+        """
+        Errors raised while fetching the Load Balancers during the last poll, by
+        Load Balancer ID. An error raised by a subscribed callback, or in :meth:`run`
+        an error failing a whole poll, e.g. listing the Load Balancers, is stored with
+        the ``None`` key.
+        """
+
+    @property
+    def statuses(self) -> dict[LoadBalancerHealthKey, str]:
+        """
+        Health statuses of the last poll, by Load Balancer ID, target key and listen port.
+        """
+        return dict(self._statuses)
+
+    def subscribe(
+        self,
+        callback: Callable[[LoadBalancerHealthStatusChange], None],
+    ) -> None:
+        """
+        Subscribes a callback to the health status transitions.
+
+        :param callback: Function called with each health status transition.
+        """
+        self._callbacks.append(callback)
+
+    def _fetch(self) -> list[BoundLoadBalancer]:
+        self.errors = {}
+
+        if self._load_balancers is None:
+            return self._client.get_all(label_selector=self._label_selector)
+
+        def fetch(load_balancer: LoadBalancer) -> BoundLoadBalancer | None:
+            assert load_balancer.id is not None
+            try:
+                return self._client.get_by_id(load_balancer.id)
+            except Exception as exception:  # pylint: disable=broad-exception-caught
+                self.errors[load_balancer.id] = exception
+                return None
+
+        with ThreadPoolExecutor(max_workers=self._concurrency) as executor:
+            results = list(executor.map(fetch, self._load_balancers))
+
+        return [o for o in results if o is not None]
+
+    def poll(self) -> list[LoadBalancerHealthStatusChange]:
+        """
+        Fetches the Load Balancers once, updates the health statuses and calls the
+        subscribed callbacks with the transitions.
+
+        On the first poll, every health status is a transition from None. The
+        health statuses of a Load Balancer that failed to be fetched are kept
+        unchanged, see :attr:`errors`. A failing callback does not prevent the
+        delivery of the other transitions, its error is stored in :attr:`errors`.
+
+        :return: The health status transitions since the previous poll.
+        """
+        load_balancers = self._fetch()
+
+        statuses: dict[LoadBalancerHealthKey, str] = {}
+        targets: dict[
+            LoadBalancerHealthKey, tuple[BoundLoadBalancer, LoadBalancerTarget]
+        ] = {}
+
+        for load_balancer in load_balancers:
+            assert load_balancer.id is not None
+            for target, listen_port, status in _iter_health_statuses(
+                load_balancer.targets or []
+            ):
+                key = (load_balancer.id, _load_balancer_target_key(target), listen_port)
+                statuses[key] = status
+                targets[key] = (load_balancer, target)
+
+        changes: list[LoadBalancerHealthStatusChange] = []
+        for key, status in statuses.items():
+            previous = self._statuses.get(key)
+            if status != previous:
+                changes.append(
+                    LoadBalancerHealthStatusChange(
+                        *targets[key], key[2], previous, status
+                    )
+                )
+        for key, previous in self._statuses.items():
+            if key in statuses:
+                continue
+            if key[0] in self.errors:
+                # Keep the last known health status
+                statuses[key] = previous
+                targets[key] = self._targets[key]
+            else:
+                changes.append(
+                    LoadBalancerHealthStatusChange(
+                        *self._targets[key], key[2], previous
+                    )
+                )
+
+        self._statuses = statuses
+        self._targets = targets
+
+        for change in changes:
+            for callback in self._callbacks:
+                try:
+                    callback(change)
+                except Exception as exception:  # pylint: disable=broad-exception-caught
+                    # Deliver the other transitions, the state is already updated
+                    self.errors[None] = exception
+
+        return changes
+
+    def run(self, stop: threading.Event | None = None) -> None:
+        """
+        Polls the Load Balancers every ``interval`` seconds, until the ``stop`` event
+        is set.
+
+        A failing poll does not stop the loop, the error is stored in :attr:`errors`
+        and the next poll happens after the interval.
+
+        :param stop: Event stopping the loop when set.
+        """
+        if stop is None:
+            stop = threading.Event()
+
+        while not stop.is_set():
+            try:
+                self.poll()
+            except Exception as exception:  # pylint: disable=broad-exception-caught
+                self.errors[None] = exception
+            stop.wait(self._interval)
@@ -6,15 +6,21 @@ from .domain import (
     Network,
     NetworkProtection,
     NetworkRoute,
+    NetworkRouteConflict,
     NetworkSubnet,
 )
+from .ipam import NetworkIPAM
+from .routes import NetworkRouteTable
 
 __all__ = [
     "BoundNetwork",
     "CreateNetworkResponse",
     "Network",
+    "NetworkIPAM",
     "NetworkProtection",
     "NetworkRoute",
+    "NetworkRouteConflict",
+    "NetworkRouteTable",
     "NetworkSubnet",
     "NetworksClient",
     "NetworksPageResult",
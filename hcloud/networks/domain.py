@@ -15,6 +15,7 @@ __all__ = [
     "NetworkProtection",
     "NetworkSubnet",
     "NetworkRoute",
+    "NetworkRouteConflict",
     "CreateNetworkResponse",
 ]
 
@@ -161,6 +162,50 @@ class NetworkRoute(BaseDomain):
         self.gateway = gateway
 
 
+class NetworkRouteConflict(BaseDomain):
+    """Network Route Conflict Domain
+
+    :param route: :class:`NetworkRoute <hcloud.networks.domain.NetworkRoute>`
+           The route being checked.
+    :param existing: :class:`NetworkRoute <hcloud.networks.domain.NetworkRoute>`
+           The existing route conflicting with the route being checked.
+    :param type: str
+           Type of conflict. Choices: duplicate, conflict, shadowed, shadows
+    """
+
+    TYPE_DUPLICATE = "duplicate"
+    """
+    An existing route has the same destination and gateway.
+    """
+    TYPE_CONFLICT = "conflict"
+    """
+    An existing route has the same destination, but a different gateway.
+    """
+    TYPE_SHADOWED = "shadowed"
+    """
+    More specific existing routes cover the whole destination, the route would never
+    be used.
+    """
+    TYPE_SHADOWS = "shadows"
+    """
+    The route is more specific than an existing route with a different gateway, and
+    would override it for part of its destination.
+    """
+
+    __api_properties__ = ("route", "existing", "type")
+    __slots__ = __api_properties__
+
+    def __init__(
+        self,
+        route: NetworkRoute,
+        existing: NetworkRoute,
+        type: str,
+    ):
+        self.route = route
+        self.existing = existing
+        self.type = type
+
+
 class CreateNetworkResponse(BaseDomain):
     """Create Network Response Domain
 
@@ -0,0 +1,375 @@
+from __future__ import annotations
+
+import ipaddress
+import threading
+from bisect import bisect_right
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from .domain import Network, NetworkSubnet
+
+if TYPE_CHECKING:
+    from .._client import Client
+    from ..load_balancers import BoundLoadBalancer, LoadBalancer
+    from ..servers import BoundServer, Server
+    from .client import BoundNetwork
+
+__all__ = [
+    "NetworkIPAM",
+]
+
+
+class _FreeIntervals:
+    """
+    Sorted and disjoint intervals of free integers.
+    """
+
+    __slots__ = ("starts", "ends")
+
+    def __init__(self, start: int, end: int):
+        self.starts: list[int] = [start] if start <= end else []
+        self.ends: list[int] = [end] if start <= end else []
+
+    def _find(self, value: int) -> int:
+        """
+        Returns the index of the interval containing the value, or -1.
+        """
+        i = bisect_right(self.starts, value) - 1
+        if i >= 0 and value <= self.ends[i]:
+            return i
+        return -1
+
+    def contains(self, value: int) -> bool:
+        return self._find(value) >= 0
+
+    def take_first(self) -> int | None:
+        if not self.starts:
+            return None
+        value = self.starts[0]
+        self.take(value)
+        return value
+
+    def take(self, value: int) -> bool:
+        i = self._find(value)
+        if i < 0:
+            return False
+
+        start, end = self.starts[i], self.ends[i]
+        if start == end:
+            del self.starts[i]
+            del self.ends[i]
+        elif value == start:
+            self.starts[i] = value + 1
+        elif value == end:
+            self.ends[i] = value - 1
+        else:
+            self.ends[i] = value - 1
+            self.starts.insert(i + 1, value + 1)
+            self.ends.insert(i + 1, end)
+        return True
+
+    def take_range(self, start: int, end: int) -> None:
+        """
+        Takes all the values between start and end, whether they are free or not.
+        """
+        result_starts: list[int] = []
+        result_ends: list[int] = []
+        for free_start, free_end in zip(self.starts, self.ends):
+            if free_end < start or free_start > end:
+                result_starts.append(free_start)
+                result_ends.append(free_end)
+                continue
+            if free_start < start:
+                result_starts.append(free_start)
+                result_ends.append(start - 1)
+            if free_end > end:
+                result_starts.append(end + 1)
+                result_ends.append(free_end)
+        self.starts = result_starts
+        self.ends = result_ends
+
+    def release(self, value: int) -> bool:
+        i = bisect_right(self.starts, value) - 1
+        if i >= 0 and value <= self.ends[i]:
+            return False
+
+        merge_left = i >= 0 and self.ends[i] == value - 1
+        merge_right = i + 1 < len(self.starts) and self.starts[i + 1] == value + 1
+        if merge_left and merge_right:
+            self.ends[i] = self.ends[i + 1]
+            del self.starts[i + 1]
+            del self.ends[i + 1]
+        elif merge_left:
+            self.ends[i] = value
+        elif merge_right:
+            self.starts[i + 1] = value
+        else:
+            self.starts.insert(i + 1, value)
+            self.ends.insert(i + 1, value)
+        return True
+
+
+class _SubnetIndex:
+    __slots__ = ("ip_range", "free")
+
+    def __init__(self, ip_range: ipaddress.IPv4Network, gateway: str | None):
+        self.ip_range = ip_range
+        # The network, gateway and broadcast addresses are reserved
+        self.free = _FreeIntervals(
+            int(ip_range.network_address) + 2,
+            int(ip_range.broadcast_address) - 1,
+        )
+        if gateway is not None:
+            self.free.take(int(ipaddress.IPv4Address(gateway)))
+
+
+class _NetworkIndex:
+    __slots__ = ("ip_range", "subnets", "free_ranges")
+
+    def __init__(self, network: Network):
+        assert network.ip_range is not None
+        self.ip_range = ipaddress.IPv4Network(network.ip_range)
+        self.subnets: list[_SubnetIndex] = []
+        self.free_ranges = _FreeIntervals(
+            int(self.ip_range.network_address),
+            int(self.ip_range.broadcast_address),
+        )
+
+        for subnet in network.subnets or []:
+            ip_range = ipaddress.IPv4Network(subnet.ip_range)
+            self.free_ranges.take_range(
+                int(ip_range.network_address),
+                int(ip_range.broadcast_address),
+            )
+            if subnet.type == NetworkSubnet.TYPE_VSWITCH:
+                continue
+            self.add_subnet(ip_range, subnet.gateway)
+
+    def add_subnet(self, ip_range: ipaddress.IPv4Network, gateway: str | None) -> None:
+        self.subnets.append(_SubnetIndex(ip_range, gateway))
+        self.subnets.sort(key=lambda o: o.ip_range)
+
+    def find_subnet(self, ip: ipaddress.IPv4Address) -> _SubnetIndex | None:
+        for subnet in self.subnets:
+            if ip in subnet.ip_range:
+                return subnet
+        return None
+
+
+class NetworkIPAM:
+    """
+    Allocates free IPs and subnets in Networks, without colliding with the IPs used
+    by the attached servers and Load Balancers.
+
+    The allocation index is built once, from the Networks, servers and Load Balancers
+    given, and is kept up to date by the allocations and releases. Each subnet keeps
+    its free IPs as sorted intervals, finding, reserving or releasing an IP is a
+    bisection.
+
+    The first two and the last IPs of every subnet are reserved, as well as the
+    gateway of the subnet. vSwitch subnets are never allocated from.
+
+    The allocations are thread safe, so that many servers may be attached
+    concurrently.
+
+    :param networks: Networks to allocate from, with their IP range and subnets.
+    :param servers: Servers attached to the Networks.
+    :param load_balancers: Load Balancers attached to the Networks.
+    """
+
+    def __init__(
+        self,
+        networks: Iterable[Network | BoundNetwork],
+        servers: Iterable[Server | BoundServer] = (),
+        load_balancers: Iterable[LoadBalancer | BoundLoadBalancer] = (),
+    ):
+        self._lock = threading.Lock()
+        self._networks: dict[int, _NetworkIndex] = {}
+        for network in networks:
+            assert network.id is not None
+            self._networks[network.id] = _NetworkIndex(network)
+
+        for server in servers:
+            for server_private_net in server.private_net or []:
+                self._take_ips(
+                    server_private_net.network,
+                    [server_private_net.ip, *(server_private_net.alias_ips or [])],
+                )
+        for load_balancer in load_balancers:
+            for load_balancer_private_net in load_balancer.private_net or []:
+                self._take_ips(
+                    load_balancer_private_net.network,
+                    [load_balancer_private_net.ip],
+                )
+
+    def _take_ips(self, network: Network | BoundNetwork, ips: list[str]) -> None:
+        index = self._networks.get(network.id)  # type: ignore[arg-type]
+        if index is None:
+            return
+        for ip in ips:
+            ip_address = ipaddress.IPv4Address(ip)
+            subnet = index.find_subnet(ip_address)
+            if subnet is not None:
+                subnet.free.take(int(ip_address))
+
+    @classmethod
+    def from_client(cls, client: Client) -> NetworkIPAM:
+        """
+        Builds the allocation index from all the Networks, servers and Load Balancers
+        of the project.
+
+        :param client: Client used to list the Networks, servers and Load Balancers.
+        """
+        return cls(
+            client.networks.get_all(),
+            client.servers.get_all(),
+            client.load_balancers.get_all(),
+        )
+
+    def _get_network(self, network: Network | BoundNetwork) -> _NetworkIndex:
+        index = self._networks.get(network.id)  # type: ignore[arg-type]
+        if index is None:
+            raise ValueError(f"unknown network {network.id}")
+        return index
+
+    def _get_subnets(
+        self,
+        index: _NetworkIndex,
+        subnet: str | None,
+    ) -> list[_SubnetIndex]:
+        if subnet is None:
+            return index.subnets
+        ip_range = ipaddress.IPv4Network(subnet)
+        subnets = [o for o in index.subnets if o.ip_range == ip_range]
+        if not subnets:
+            raise ValueError(f"unknown subnet {subnet}")
+        return subnets
+
+    def is_free(self, network: Network | BoundNetwork, ip: str) -> bool:
+        """
+        Returns whether an IP is free in the subnets of a Network.
+
+        :param network: Network of the IP.
+        :param ip: IP to check.
+        """
+        ip_address = ipaddress.IPv4Address(ip)
+        with self._lock:
+            subnet = self._get_network(network).find_subnet(ip_address)
+            return subnet is not None and subnet.free.contains(int(ip_address))
+
+    def allocate_ip(
+        self,
+        network: Network | BoundNetwork,
+        *,
+        subnet: str | None = None,
+    ) -> str:
+        """
+        Allocates the lowest free IP of a Network.
+
+        :param network: Network to allocate from.
+        :param subnet: IP range of the subnet to allocate from, defaults to any subnet.
+        """
+        return self.allocate_ips(network, 1, subnet=subnet)[0]
+
+    def allocate_ips(
+        self,
+        network: Network | BoundNetwork,
+        count: int,
+        *,
+        subnet: str | None = None,
+    ) -> list[str]:
+        """
+        Allocates the lowest free IPs of a Network. Either all the IPs are allocated,
+        or none of them.
+
+        :param network: Network to allocate from.
+        :param count: Number of IPs to allocate.
+        :param subnet: IP range of the subnet to allocate from, defaults to any subnet.
+        """
+        with self._lock:
+            subnets = self._get_subnets(self._get_network(network), subnet)
+
+            result: list[tuple[_SubnetIndex, int]] = []
+            for subnet_index in subnets:
+                while len(result) < count:
+                    value = subnet_index.free.take_first()
+                    if value is None:
+                        break
+                    result.append((subnet_index, value))
+
+            if len(result) < count:
+                for subnet_index, value in result:
+                    subnet_index.free.release(value)
+                raise ValueError(f"not enough free IPs in network {network.id}")
+
+            return [str(ipaddress.IPv4Address(value)) for _, value in result]
+
+    def reserve_ip(self, network: Network | BoundNetwork, ip: str) -> None:
+        """
+        Reserves a specific IP of a Network.
+
+        :param network: Network of the IP.
+        :param ip: IP to reserve.
+        :raises ValueError: If the IP is not free.
+        """
+        ip_address = ipaddress.IPv4Address(ip)
+        with self._lock:
+            subnet = self._get_network(network).find_subnet(ip_address)
+            if subnet is None or not subnet.free.take(int(ip_address)):
+                raise ValueError(f"ip {ip} is not free in network {network.id}")
+
+    def release_ip(self, network: Network | BoundNetwork, ip: str) -> None:
+        """
+        Releases an IP of a Network, for example after detaching a server.
+
+        :param network: Network of the IP.
+        :param ip: IP to release.
+        """
+        ip_address = ipaddress.IPv4Address(ip)
+        with self._lock:
+            subnet = self._get_network(network).find_subnet(ip_address)
+            if subnet is None:
+                return
+            # Reserved IPs are never released
+            if (
+                int(subnet.ip_range.network_address) + 2
+                <= int(ip_address)
+                < int(subnet.ip_range.broadcast_address)
+            ):
+                subnet.free.release(int(ip_address))
+
+    def allocate_subnet(
+        self,
+        network: Network | BoundNetwork,
+        prefixlen: int,
+    ) -> str:
+        """
+        Allocates the lowest free IP range of a given size in a Network, for a new
+        subnet. The IP range may then be used with
+        :meth:`NetworksClient.add_subnet <hcloud.networks.client.NetworksClient.add_subnet>`,
+        and IPs may be allocated from it right away.
+
+        :param network: Network to allocate from.
+        :param prefixlen: Prefix length of the IP range, e.g. 24.
+        """
+        with self._lock:
+            index = self._get_network(network)
+            if prefixlen < index.ip_range.prefixlen:
+                raise ValueError(
+                    f"prefix length must be at least {index.ip_range.prefixlen}"
+                )
+
+            size = 1 << (32 - prefixlen)
+            free = index.free_ranges
+            for start, end in zip(free.starts, free.ends):
+                # Align the start of the IP range on its size
+                aligned = -(-start // size) * size
+                if aligned + size - 1 <= end:
+                    break
+            else:
+                raise ValueError(f"no free /{prefixlen} range in network {network.id}")
+
+            free.take_range(aligned, aligned + size - 1)
+            ip_range = ipaddress.IPv4Network((aligned, prefixlen))
+            index.add_subnet(ip_range, None)
+            return str(ip_range)
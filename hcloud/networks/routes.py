@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import ipaddress
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from .domain import Network, NetworkRoute, NetworkRouteConflict
+
+if TYPE_CHECKING:
+    from .client import BoundNetwork
+
+__all__ = [
+    "NetworkRouteTable",
+]
+
+
+class _RouteNode:
+    __slots__ = ("children", "route")
+
+    def __init__(self) -> None:
+        self.children: list[_RouteNode | None] = [None, None]
+        self.route: NetworkRoute | None = None
+
+
+def _parse_destination(destination: str) -> tuple[int, int]:
+    network = ipaddress.IPv4Network(destination, strict=False)
+    return int(network.network_address), network.prefixlen
+
+
+def _iter_routes(node: _RouteNode) -> Iterator[NetworkRoute]:
+    if node.route is not None:
+        yield node.route
+    for child in node.children:
+        if child is not None:
+            yield from _iter_routes(child)
+
+
+def _iter_covering_routes(node: _RouteNode) -> Iterator[NetworkRoute]:
+    """
+    Yields the least specific routes below the node.
+    """
+    for child in node.children:
+        if child is None:
+            continue
+        if child.route is not None:
+            yield child.route
+        else:
+            yield from _iter_covering_routes(child)
+
+
+def _is_covered(node: _RouteNode | None) -> bool:
+    """
+    Returns whether the routes below the node cover its whole range.
+    """
+    if node is None:
+        return False
+    return all(
+        child is not None and (child.route is not None or _is_covered(child))
+        for child in node.children
+    )
+
+
+class NetworkRouteTable:
+    """
+    Compiled route tables of one or many Networks, as binary radix tries over the
+    route destinations.
+
+    Resolving the route of a destination is a longest prefix match, walking at most
+    32 nodes whatever the number of routes.
+
+    :param networks: Networks with their routes.
+    """
+
+    def __init__(self, networks: Iterable[Network | BoundNetwork] = ()):
+        self._tables: dict[int, _RouteNode] = {}
+        for network in networks:
+            self.add_network(network)
+
+    def add_network(self, network: Network | BoundNetwork) -> None:
+        """
+        Adds, or replaces, the routes of a Network.
+
+        :param network: Network with its routes.
+        """
+        assert network.id is not None
+        self._tables[network.id] = _RouteNode()
+        for route in network.routes or []:
+            self.add_route(network, route)
+
+    def _get_table(self, network: Network | BoundNetwork) -> _RouteNode:
+        table = self._tables.get(network.id)  # type: ignore[arg-type]
+        if table is None:
+            raise ValueError(f"unknown network {network.id}")
+        return table
+
+    def add_route(self, network: Network | BoundNetwork, route: NetworkRoute) -> None:
+        """
+        Adds a route to the table of a Network, for example after
+        :meth:`NetworksClient.add_route <hcloud.networks.client.NetworksClient.add_route>`.
+        A route with the same destination is replaced.
+
+        :param network: Network of the route.
+        :param route: Route to add.
+        """
+        address, prefixlen = _parse_destination(route.destination)
+        node = self._get_table(network)
+        for i in range(prefixlen):
+            bit = (address >> (31 - i)) & 1
+            child = node.children[bit]
+            if child is None:
+                child = node.children[bit] = _RouteNode()
+            node = child
+        node.route = route
+
+    def delete_route(
+        self,
+        network: Network | BoundNetwork,
+        route: NetworkRoute,
+    ) -> None:
+        """
+        Deletes the route with the same destination from the table of a Network.
+
+        :param network: Network of the route.
+        :param route: Route to delete.
+        """
+        node = self._find_node(network, route.destination)
+        if node is not None:
+            node.route = None
+
+    def _find_node(
+        self,
+        network: Network | BoundNetwork,
+        destination: str,
+    ) -> _RouteNode | None:
+        address, prefixlen = _parse_destination(destination)
+        node: _RouteNode | None = self._get_table(network)
+        for i in range(prefixlen):
+            assert node is not None
+            node = node.children[(address >> (31 - i)) & 1]
+            if node is None:
+                return None
+        return node
+
+    def routes(self, network: Network | BoundNetwork) -> list[NetworkRoute]:
+        """
+        Returns the routes of a Network, ordered by destination.
+
+        :param network: Network of the routes.
+        """
+        return list(_iter_routes(self._get_table(network)))
+
+    def lookup(
+        self,
+        network: Network | BoundNetwork,
+        destination: str,
+    ) -> NetworkRoute | None:
+        """
+        Returns the most specific route of a Network matching a destination IP.
+
+        :param network: Network to lookup.
+        :param destination: Destination IP.
+        :return: :class:`NetworkRoute <hcloud.networks.domain.NetworkRoute>` or None
+        """
+        return self.lookup_many(network, [destination])[0]
+
+    def lookup_many(
+        self,
+        network: Network | BoundNetwork,
+        destinations: Iterable[str],
+    ) -> list[NetworkRoute | None]:
+        """
+        Returns the most specific route of a Network matching each destination IP.
+
+        :param network: Network to lookup.
+        :param destinations: Destination IPs.
+        :return: List[:class:`NetworkRoute <hcloud.networks.domain.NetworkRoute>` or None]
+        """
+        table = self._get_table(network)
+
+        result: list[NetworkRoute | None] = []
+        for destination in destinations:
+            address = int(ipaddress.IPv4Address(destination))
+            node: _RouteNode | None = table
+            match = table.route
+            for i in range(32):
+                assert node is not None
+                node = node.children[(address >> (31 - i)) & 1]
+                if node is None:
+                    break
+                if node.route is not None:
+                    match = node.route
+            result.append(match)
+        return result
+
+    def check_route(
+        self,
+        network: Network | BoundNetwork,
+        route: NetworkRoute,
+    ) -> list[NetworkRouteConflict]:
+        """
+        Returns the conflicts between a route and the existing routes of a Network,
+        before adding the route with
+        :meth:`NetworksClient.add_route <hcloud.networks.client.NetworksClient.add_route>`.
+
+        :param network: Network of the route.
+        :param route: Route to check.
+        :return: List[:class:`NetworkRouteConflict <hcloud.networks.domain.NetworkRouteConflict>`]
+        """
+        address, prefixlen = _parse_destination(route.destination)
+
+        # Walk down to the node of the destination, tracking the closest less
+        # specific route, currently handling the destination
+        enclosing: NetworkRoute | None = None
+        node: _RouteNode | None = self._get_table(network)
+        for i in range(prefixlen):
+            assert node is not None
+            if node.route is not None:
+                enclosing = node.route
+            node = node.children[(address >> (31 - i)) & 1]
+            if node is None:
+                break
+
+        if node is not None and node.route is not None:
+            if node.route.gateway == route.gateway:
+                return [
+                    NetworkRouteConflict(
+                        route, node.route, NetworkRouteConflict.TYPE_DUPLICATE
+                    )
+                ]
+            conflicts = [
+                NetworkRouteConflict(
+                    route, node.route, NetworkRouteConflict.TYPE_CONFLICT
+                )
+            ]
+        else:
+            conflicts = []
+            if enclosing is not None and enclosing.gateway != route.gateway:
+                conflicts.append(
+                    NetworkRouteConflict(
+                        route, enclosing, NetworkRouteConflict.TYPE_SHADOWS
+                    )
+                )
+
+        if _is_covered(node):
+            assert node is not None
+            for existing in _iter_covering_routes(node):
+                conflicts.append(
+                    NetworkRouteConflict(
+                        route, existing, NetworkRouteConflict.TYPE_SHADOWED
+                    )
+                )
+
+        return conflicts
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 from .client import BoundPrimaryIP, PrimaryIPsClient, PrimaryIPsPageResult
 from .domain import CreatePrimaryIPResponse, PrimaryIP, PrimaryIPProtection
+from .pool import PrimaryIPPool
 
 __all__ = [
     "BoundPrimaryIP",
     "CreatePrimaryIPResponse",
     "PrimaryIP",
+    "PrimaryIPPool",
     "PrimaryIPProtection",
     "PrimaryIPsClient",
     "PrimaryIPsPageResult",
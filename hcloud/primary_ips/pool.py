@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from .._exceptions import APIException
+from ..actions import ActionException
+from ..core import ResourcePoolBase
+from ..locations import BoundLocation, Location
+from .client import BoundPrimaryIP, PrimaryIPsClient
+from .domain import PrimaryIP
+
+if TYPE_CHECKING:
+    from ..servers import ServerCreatePublicNetwork
+
+__all__ = [
+    "PrimaryIPPool",
+]
+
+
+class PrimaryIPPool(ResourcePoolBase[tuple[str, str], BoundPrimaryIP]):
+    """
+    Keeps a number of unassigned Primary IPs ready for each location and type, so
+    that creating a server with dedicated addresses does not wait for their creation.
+
+    The Primary IPs of the pool are labeled with ``primary-ip-pool=<name>``, the pool
+    can be recovered with :meth:`load` after a restart.
+
+    :param client: Primary IPs client used to manage the Primary IPs.
+    :param name: Name of the pool, used to label and name its Primary IPs.
+    :param locations: Locations to keep Primary IPs in, e.g. ``fsn1``.
+    :param types: Types of Primary IPs to keep, ``ipv4`` and/or ``ipv6``.
+    :param size: Number of unassigned Primary IPs to keep per location and type.
+    :param concurrency: Maximum number of Primary IPs created concurrently.
+    """
+
+    LABEL = "primary-ip-pool"
+    """Label identifying the Primary IPs of a pool"""
+
+    def __init__(
+        self,
+        client: PrimaryIPsClient,
+        name: str,
+        locations: Iterable[str | Location | BoundLocation],
+        *,
+        types: Iterable[str] = ("ipv4", "ipv6"),
+        size: int = 2,
+        concurrency: int = 5,
+    ):
+        super().__init__(
+            name,
+            (
+                (self._location_name(location), type)
+                for location in locations
+                for type in types
+            ),
+            size=size,
+            concurrency=concurrency,
+        )
+        self._client = client
+
+    @staticmethod
+    def _location_name(location: str | Location | BoundLocation) -> str:
+        if isinstance(location, str):
+            return location
+        assert location.name is not None
+        return location.name
+
+    @property
+    def labels(self) -> dict[str, str]:
+        """
+        Labels of the Primary IPs of the pool.
+        """
+        return {self.LABEL: self._name}
+
+    def available(self, location: str | Location | BoundLocation, type: str) -> int:
+        """
+        Returns the number of unassigned Primary IPs ready for a location and type.
+
+        :param location: Location of the Primary IPs.
+        :param type: Type of the Primary IPs, ``ipv4`` or ``ipv6``.
+        """
+        return self._count((self._location_name(location), type))
+
+    def _key(self, resource: BoundPrimaryIP) -> tuple[str, str]:
+        assert resource.location is not None and resource.type is not None
+        return (self._location_name(resource.location), resource.type)
+
+    def _describe(self, key: tuple[str, str]) -> str:
+        return f"Primary IPs for location {key[0]!r} and type {key[1]!r}"
+
+    def load(self) -> None:
+        """
+        Adds the existing unassigned Primary IPs of the pool, found by their label.
+        """
+        for primary_ip in self._client.get_all(
+            label_selector=f"{self.LABEL}={self._name}"
+        ):
+            if primary_ip.assignee_id is None:
+                self._put(primary_ip)
+
+    def _create(self, location: str, type: str) -> BoundPrimaryIP:
+        response = self._client.create(
+            type=type,
+            name=f"{self._name}-{type}-{uuid.uuid4().hex[:8]}",
+            location=Location(name=location),
+            auto_delete=False,
+            labels=self.labels,
+        )
+        if response.action is not None:
+            response.action.wait_until_finished()
+        return response.primary_ip
+
+    def _create_many(
+        self,
+        keys: list[tuple[str, str]],
+    ) -> tuple[list[BoundPrimaryIP], list[Exception]]:
+        errors: list[Exception] = []
+
+        def create(key: tuple[str, str]) -> BoundPrimaryIP | None:
+            try:
+                return self._create(*key)
+            except (APIException, ActionException) as exception:
+                errors.append(exception)
+                return None
+
+        with ThreadPoolExecutor(max_workers=self._concurrency) as executor:
+            created = [o for o in executor.map(create, keys) if o is not None]
+
+        return created, errors
+
+    def acquire(
+        self,
+        location: str | Location | BoundLocation,
+        type: str,
+    ) -> BoundPrimaryIP:
+        """
+        Takes an unassigned Primary IP out of the pool. When the pool is empty, a new
+        Primary IP is created right away. The pool is refilled in the background, see
+        :meth:`start`.
+
+        :param location: Location of the Primary IP.
+        :param type: Type of the Primary IP, ``ipv4`` or ``ipv6``.
+        :raises: ValueError when the pool does not keep Primary IPs for the location
+            and type.
+        """
+        location = self._location_name(location)
+        primary_ip = self._take((location, type))
+        if primary_ip is None:
+            primary_ip = self._create(location, type)
+        return primary_ip
+
+    def acquire_public_net(
+        self,
+        location: str | Location | BoundLocation,
+        *,
+        enable_ipv4: bool = True,
+        enable_ipv6: bool = True,
+    ) -> ServerCreatePublicNetwork:
+        """
+        Takes Primary IPs out of the pool, ready to be passed to
+        :meth:`ServersClient.create <hcloud.servers.client.ServersClient.create>`.
+
+        :param location: Location of the server.
+        :param enable_ipv4: Whether to take an IPv4 Primary IP.
+        :param enable_ipv6: Whether to take an IPv6 Primary IP.
+        """
+        # pylint: disable=import-outside-toplevel
+        from ..servers import ServerCreatePublicNetwork
+
+        return ServerCreatePublicNetwork(
+            ipv4=self.acquire(location, "ipv4") if enable_ipv4 else None,
+            ipv6=self.acquire(location, "ipv6") if enable_ipv6 else None,
+            enable_ipv4=enable_ipv4,
+            enable_ipv6=enable_ipv6,
+        )
+
+    def release(self, primary_ip: PrimaryIP | BoundPrimaryIP) -> None:
+        """
+        Puts a Primary IP back into the pool, for example after a failed server
+        creation, or after deleting its server. The Primary IP is unassigned first
+        if needed.
+
+        :param primary_ip: Primary IP to put back into the pool.
+        """
+        if not isinstance(primary_ip, BoundPrimaryIP) or primary_ip.location is None:
+            assert primary_ip.id is not None
+            primary_ip = self._client.get_by_id(primary_ip.id)
+
+        if primary_ip.assignee_id is not None:
+            self._client.unassign(primary_ip).wait_until_finished()
+            primary_ip.data_model.assignee_id = None
+            primary_ip.data_model.assignee_type = None
+
+        self._put(primary_ip)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from .domain import DNSPtr
+from .bulk import change_dns_ptrs
+from .domain import DNSPtr, DNSPtrChangeResult
 
 __all__ = [
     "DNSPtr",
+    "DNSPtrChangeResult",
+    "change_dns_ptrs",
 ]
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import ipaddress
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+import requests
+
+from .._exceptions import APIException
+from ..core import BoundModelBase
+from ..floating_ips import FloatingIP
+from ..load_balancers import LoadBalancer
+from ..primary_ips import PrimaryIP
+from ..servers import Server
+from .domain import DNSPtrChangeResult
+
+if TYPE_CHECKING:
+    from .._client import Client
+    from .domain import DNSPtrResource
+
+__all__ = [
+    "change_dns_ptrs",
+]
+
+_IPAddress = ipaddress.IPv4Address | ipaddress.IPv6Address
+
+
+def _resource_client(client: Client, resource: DNSPtrResource) -> Any:
+    if isinstance(resource, Server):
+        return client.servers
+    if isinstance(resource, PrimaryIP):
+        return client.primary_ips
+    if isinstance(resource, FloatingIP):
+        return client.floating_ips
+    if isinstance(resource, LoadBalancer):
+        return client.load_balancers
+    raise ValueError(f"unsupported resource {resource!r}")
+
+
+def _current_dns_ptrs(resource: DNSPtrResource) -> dict[_IPAddress, str]:
+    """
+    Returns the reverse DNS entries of a resource, indexed by IP.
+    """
+    entries: list[tuple[str | None, Any]] = []
+    if isinstance(resource, (Server, LoadBalancer)):
+        public_net: Any = resource.public_net
+        if public_net is not None:
+            for address in (public_net.ipv4, public_net.ipv6):
+                if address is not None:
+                    entries.append((address.ip, address.dns_ptr))
+    else:
+        entries.append((None, resource.dns_ptr))
+
+    result: dict[_IPAddress, str] = {}
+    for ip, dns_ptr in entries:
+        if isinstance(dns_ptr, list):
+            for o in dns_ptr:
+                result[ipaddress.ip_address(o["ip"])] = o["dns_ptr"]
+        elif ip is not None and dns_ptr is not None:
+            result[ipaddress.ip_address(ip)] = dns_ptr
+    return result
+
+
+def change_dns_ptrs(
+    client: Client,
+    entries: Iterable[tuple[DNSPtrResource, str, str | None]],
+    *,
+    concurrency: int = 5,
+) -> list[DNSPtrChangeResult]:
+    """
+    Changes many reverse DNS entries of Servers, Primary IPs, Floating IPs and Load
+    Balancers.
+
+    The current reverse DNS entries of each resource are fetched once, unless the
+    resource is already loaded. The entries already set to the requested hostname are
+    skipped, the others are changed concurrently, and all the resulting Actions are
+    waited for together.
+
+    A failed change does not interrupt the others, its error is stored in the result.
+
+    :param client: Client used to change the reverse DNS entries.
+    :param entries: Tuples of resource, IP and hostname, the hostname may be None to
+           reset the entry to its default value.
+    :param concurrency: Maximum number of concurrent requests.
+    :return: List[:class:`DNSPtrChangeResult <hcloud.rdns.domain.DNSPtrChangeResult>`]
+             The results of the changed entries, in the order of the entries.
+    :raises: ValueError when an entry has an invalid IP, before any request is sent
+    """
+    entries = list(entries)
+
+    addresses: list[_IPAddress] = []
+    for _, ip, _ in entries:
+        try:
+            addresses.append(ipaddress.ip_address(ip))
+        except ValueError as exception:
+            raise ValueError(f"invalid IP {ip!r}") from exception
+
+    # Fetch the current reverse DNS entries, once per resource
+    resources: dict[tuple[Any, int], DNSPtrResource] = {}
+    keys: list[tuple[Any, int]] = []
+    for resource, _, _ in entries:
+        assert resource.id is not None
+        key = (_resource_client(client, resource), resource.id)
+        resources.setdefault(key, resource)
+        keys.append(key)
+
+    def fetch(
+        key: tuple[Any, int],
+    ) -> tuple[DNSPtrResource, dict[_IPAddress, str] | Exception]:
+        resource = resources[key]
+        try:
+            if not isinstance(resource, BoundModelBase):
+                resource = key[0].get_by_id(key[1])
+            return resource, _current_dns_ptrs(resource)
+        except (APIException, requests.exceptions.RequestException) as exception:
+            return resource, exception
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        current = dict(zip(resources, executor.map(fetch, resources)))
+
+        results: list[DNSPtrChangeResult] = []
+        for key, address, (_, ip, dns_ptr) in zip(keys, addresses, entries):
+            resource, dns_ptrs = current[key]
+            if isinstance(dns_ptrs, Exception):
+                results.append(
+                    DNSPtrChangeResult(resource, ip, dns_ptr, error=dns_ptrs)
+                )
+            elif dns_ptrs.get(address) != dns_ptr:
+                results.append(DNSPtrChangeResult(resource, ip, dns_ptr))
+
+        def change(result: DNSPtrChangeResult) -> None:
+            if result.error is not None:
+                return
+            try:
+                result.action = _resource_client(
+                    client, result.resource
+                ).change_dns_ptr(result.resource, ip=result.ip, dns_ptr=result.dns_ptr)
+            except (APIException, requests.exceptions.RequestException) as exception:
+                result.error = exception
+
+        list(executor.map(change, results))
+
+    actions = [o.action for o in results if o.action is not None]
+    errors = client.actions.wait_for_all(actions)
+    for result in results:
+        if result.action is not None and result.action.id in errors:
+            result.error = errors[result.action.id]
+
+    return results
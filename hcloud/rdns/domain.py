@@ -1,12 +1,71 @@
 from __future__ import annotations
 
-from typing import TypedDict
+from typing import TYPE_CHECKING, TypeAlias, TypedDict
+
+from ..core import BaseDomain
+
+if TYPE_CHECKING:
+    from ..actions import BoundAction
+    from ..floating_ips import BoundFloatingIP, FloatingIP
+    from ..load_balancers import BoundLoadBalancer, LoadBalancer
+    from ..primary_ips import BoundPrimaryIP, PrimaryIP
+    from ..servers import BoundServer, Server
+
+    DNSPtrResource: TypeAlias = (
+        Server
+        | BoundServer
+        | PrimaryIP
+        | BoundPrimaryIP
+        | FloatingIP
+        | BoundFloatingIP
+        | LoadBalancer
+        | BoundLoadBalancer
+    )
 
 __all__ = [
     "DNSPtr",
+    "DNSPtrChangeResult",
 ]
 
 
 class DNSPtr(TypedDict):
     ip: str
     dns_ptr: str
+
+
+class DNSPtrChangeResult(BaseDomain):
+    """DNSPtrChangeResult Domain
+
+    :param resource: Server, Primary IP, Floating IP or Load Balancer owning the IP
+    :param ip: str
+           IP of the reverse DNS entry
+    :param dns_ptr: str, None
+           Hostname set as reverse DNS entry, None to reset to the default value
+    :param action: :class:`BoundAction <hcloud.actions.client.BoundAction>`
+           Action of the change, None if the change failed
+    :param error: Exception
+           Error raised while changing the reverse DNS entry
+    """
+
+    __api_properties__ = (
+        "resource",
+        "ip",
+        "dns_ptr",
+        "action",
+        "error",
+    )
+    __slots__ = __api_properties__
+
+    def __init__(
+        self,
+        resource: DNSPtrResource,
+        ip: str,
+        dns_ptr: str | None,
+        action: BoundAction | None = None,
+        error: Exception | None = None,
+    ):
+        self.resource = resource
+        self.ip = ip
+        self.dns_ptr = dns_ptr
+        self.action = action
+        self.error = error
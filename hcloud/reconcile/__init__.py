@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from .domain import (
+    FirewallSpec,
+    LoadBalancerSpec,
+    NetworkSpec,
+    OperationResult,
+    PlannedOperation,
+    ServerSpec,
+    VolumeSpec,
+)
+from .plan import OWNER_LABEL, Plan, create_plan
+
+__all__ = [
+    "FirewallSpec",
+    "LoadBalancerSpec",
+    "NetworkSpec",
+    "OperationResult",
+    "OWNER_LABEL",
+    "Plan",
+    "PlannedOperation",
+    "ServerSpec",
+    "VolumeSpec",
+    "create_plan",
+]
@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from ..core import BaseDomain
+
+if TYPE_CHECKING:
+    from ..actions import BoundAction
+    from ..firewalls import FirewallRule
+    from ..images import BoundImage, Image
+    from ..load_balancer_types import BoundLoadBalancerType, LoadBalancerType
+    from ..load_balancers import LoadBalancerService
+    from ..locations import BoundLocation, Location
+    from ..networks import NetworkSubnet
+    from ..server_types import BoundServerType, ServerType
+    from ..ssh_keys import BoundSSHKey, SSHKey
+
+__all__ = [
+    "NetworkSpec",
+    "ServerSpec",
+    "VolumeSpec",
+    "FirewallSpec",
+    "LoadBalancerSpec",
+    "PlannedOperation",
+    "OperationResult",
+]
+
+
+class NetworkSpec(BaseDomain):
+    """Network Spec Domain
+
+    :param name: str
+           Name of the network
+    :param ip_range: str
+           IP range of the network, used on creation
+    :param subnets: List[:class:`NetworkSubnet <hcloud.networks.domain.NetworkSubnet>`]
+           Subnets of the network, used on creation
+    :param labels: Dict[str, str]
+           User-defined labels (key-value pairs)
+    """
+
+    __api_properties__ = ("name", "ip_range", "subnets", "labels")
+    __slots__ = __api_properties__
+
+    def __init__(
+        self,
+        name: str,
+        ip_range: str,
+        subnets: list[NetworkSubnet] | None = None,
+        labels: dict[str, str] | None = None,
+    ):
+        self.name = name
+        self.ip_range = ip_range
+        self.subnets = subnets
+        self.labels = labels or {}
+
+
+class ServerSpec(BaseDomain):
+    """Server Spec Domain
+
+    :param name: str
+           Name of the server
+    :param server_type: :class:`BoundServerType <hcloud.server_types.client.BoundServerType>` or :class:`ServerType <hcloud.server_types.domain.ServerType>`
+           Server type of the server, used on creation
+    :param image: :class:`BoundImage <hcloud.images.client.BoundImage>` or :class:`Image <hcloud.images.domain.Image>`
+           Image of the server, used on creation
+    :param location: :class:`BoundLocation <hcloud.locations.client.BoundLocation>` or :class:`Location <hcloud.locations.domain.Location>`
+           Location of the server, used on creation
+    :param networks: List[str]
+           Names of the networks the server is attached to
+    :param ssh_keys: List[:class:`BoundSSHKey <hcloud.ssh_keys.client.BoundSSHKey>` or :class:`SSHKey <hcloud.ssh_keys.domain.SSHKey>`]
+           SSH keys of the server, used on creation
+    :param user_data: str
+           Cloud-Init user data of the server, used on creation
+    :param labels: Dict[str, str]
+           User-defined labels (key-value pairs)
+    """
+
+    __api_properties__ = (
+        "name",
+        "server_type",
+        "image",
+        "location",
+        "networks",
+        "ssh_keys",
+        "user_data",
+        "labels",
+    )
+    __slots__ = __api_properties__
+
+    def __init__(
+        self,
+        name: str,
+        server_type: ServerType | BoundServerType,
+        image: Image | BoundImage,
+        location: Location | BoundLocation | None = None,
+        networks: list[str] | None = None,
+        ssh_keys: list[SSHKey | BoundSSHKey] | None = None,
+        user_data: str | None = None,
+        labels: dict[str, str] | None = None,
+    ):
+        self.name = name
+        self.server_type = server_type
+        self.image = image
+        self.location = location
+        self.networks = networks or []
+        self.ssh_keys = ssh_keys
+        self.user_data = user_data
+        self.labels = labels or {}
+
+
+class VolumeSpec(BaseDomain):
+    """Volume Spec Domain
+
+    :param name: str
+           Name of the volume
+    :param size: int
+           Size of the volume in GB, an existing volume is only grown
+    :param location: :class:`BoundLocation <hcloud.locations.client.BoundLocation>` or :class:`Location <hcloud.locations.domain.Location>`
+           Location of the volume, used on creation
+    :param server: str, None
+           Name of the server the volume is attached to
+    :param format: str, None
+           Filesystem of the volume, used on creation. Choices: xfs, ext4
+    :param labels: Dict[str, str]
+           User-defined labels (key-value pairs)
+    """
+
+    __api_properties__ = ("name", "size", "location", "server", "format", "labels")
+    __slots__ = __api_properties__
+
+    def __init__(
+        self,
+        name: str,
+        size: int,
+        location: Location | BoundLocation,
+        server: str | None = None,
+        format: str | None = None,
+        labels: dict[str, str] | None = None,
+    ):
+        self.name = name
+        self.size = size
+        self.location = location
+        self.server = server
+        self.format = format
+        self.labels = labels or {}
+
+
+class FirewallSpec(BaseDomain):
+    """Firewall Spec Domain
+
+    :param name: str
+           Name of the firewall
+    :param rules: List[:class:`FirewallRule <hcloud.firewalls.domain.FirewallRule>`]
+           Rules of the firewall
+    :param servers: List[str]
+           Names of the servers the firewall is applied to
+    :param labels: Dict[str, str]
+           User-defined labels (key-value pairs)
+    """
+
+    __api_properties__ = ("name", "rules", "servers", "labels")
+    __slots__ = __api_properties__
+
+    def __init__(
+        self,
+        name: str,
+        rules: list[FirewallRule] | None = None,
+        servers: list[str] | None = None,
+        labels: dict[str, str] | None = None,
+    ):
+        self.name = name
+        self.rules = rules or []
+        self.servers = servers or []
+        self.labels = labels or {}
+
+
+class LoadBalancerSpec(BaseDomain):
+    """Load Balancer Spec Domain
+
+    :param name: str
+           Name of the load balancer
+    :param load_balancer_type: :class:`BoundLoadBalancerType <hcloud.load_balancer_types.client.BoundLoadBalancerType>` or :class:`LoadBalancerType <hcloud.load_balancer_types.domain.LoadBalancerType>`
+           Load balancer type, used on creation
+    :param location: :class:`BoundLocation <hcloud.locations.client.BoundLocation>` or :class:`Location <hcloud.locations.domain.Location>`
+           Location of the load balancer, used on creation
+    :param network: str, None
+           Name of the network the load balancer is attached to
+    :param servers: List[str]
+           Names of the target servers
+    :param services: List[:class:`LoadBalancerService <hcloud.load_balancers.domain.LoadBalancerService>`]
+           Services of the load balancer, used on creation
+    :param labels: Dict[str, str]
+           User-defined labels (key-value pairs)
+    """
+
+    __api_properties__ = (
+        "name",
+        "load_balancer_type",
+        "location",
+        "network",
+        "servers",
+        "services",
+        "labels",
+    )
+    __slots__ = __api_properties__
+
+    def __init__(
+        self,
+        name: str,
+        load_balancer_type: LoadBalancerType | BoundLoadBalancerType,
+        location: Location | BoundLocation,
+        network: str | None = None,
+        servers: list[str] | None = None,
+        services: list[LoadBalancerService] | None = None,
+        labels: dict[str, str] | None = None,
+    ):
+        self.name = name
+        self.load_balancer_type = load_balancer_type
+        self.location = location
+        self.network = network
+        self.servers = servers or []
+        self.services = services
+        self.labels = labels or {}
+
+
+class PlannedOperation(BaseDomain):
+    """Planned Operation Domain
+
+    :param id: str
+           Unique description of the operation, e.g. ``attach server web-1 network private``
+    :param type: str
+           Type of the operation. Choices: create, update, attach, detach, delete
+    :param resource: Tuple[str, str]
+           Type and name of the resource the operation applies to
+    :param depends_on: List[str]
+           IDs of the operations that must succeed before this operation
+    """
+
+    TYPE_CREATE = "create"
+    """Planned Operation Type create"""
+    TYPE_UPDATE = "update"
+    """Planned Operation Type update"""
+    TYPE_ATTACH = "attach"
+    """Planned Operation Type attach"""
+    TYPE_DETACH = "detach"
+    """Planned Operation Type detach"""
+    TYPE_DELETE = "delete"
+    """Planned Operation Type delete"""
+
+    __api_properties__ = ("id", "type", "resource", "depends_on")
+    __slots__ = (*__api_properties__, "run")
+
+    def __init__(
+        self,
+        id: str,
+        type: str,
+        resource: tuple[str, str],
+        depends_on: list[str] | None = None,
+        run: Callable[[], list[BoundAction]] | None = None,
+    ):
+        self.id = id
+        self.type = type
+        self.resource = resource
+        self.depends_on = depends_on or []
+        self.run = run
+
+
+class OperationResult(BaseDomain):
+    """Operation Result Domain
+
+    :param operation: :class:`PlannedOperation <hcloud.reconcile.domain.PlannedOperation>`
+           The operation
+    :param status: str, None
+           Status of the operation, None if it was not run. Choices: success, error, skipped
+    :param actions: List[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
+           Actions of the operation
+    :param error: Exception, None
+           Error raised by the operation, or by the operation it depends on when skipped
+    """
+
+    STATUS_SUCCESS = "success"
+    """Operation Result Status success"""
+    STATUS_ERROR = "error"
+    """Operation Result Status error"""
+    STATUS_SKIPPED = "skipped"
+    """Operation Result Status skipped"""
+
+    __api_properties__ = ("operation", "status", "actions", "error")
+    __slots__ = __api_properties__
+
+    def __init__(
+        self,
+        operation: PlannedOperation,
+        status: str | None = None,
+        actions: list[BoundAction] | None = None,
+        error: Exception | None = None,
+    ):
+        self.operation = operation
+        self.status = status
+        self.actions = actions or []
+        self.error = error
@@ -0,0 +1,788 @@
+from __future__ import annotations
+
+import time
+from collections import Counter, deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from typing import TYPE_CHECKING, Any, Union
+
+from ..actions import (
+    Action,
+    ActionFailedException,
+    ActionTimeoutException,
+    BoundAction,
+)
+from ..firewalls import FirewallResource
+from ..load_balancers import LoadBalancerTarget
+from .domain import (
+    FirewallSpec,
+    LoadBalancerSpec,
+    NetworkSpec,
+    OperationResult,
+    PlannedOperation,
+    ServerSpec,
+    VolumeSpec,
+)
+
+if TYPE_CHECKING:
+    from .._client import Client
+    from ..firewalls import FirewallRule
+    from ..inventory import Inventory
+
+    Spec = Union[NetworkSpec, ServerSpec, VolumeSpec, FirewallSpec, LoadBalancerSpec]
+
+__all__ = [
+    "OWNER_LABEL",
+    "Plan",
+    "create_plan",
+]
+
+OWNER_LABEL = "reconcile-owner"
+"""Label identifying the resources managed by a reconciliation owner"""
+
+# Resource type, spec class and inventory collection, in planning order
+_RESOURCE_TYPES: list[tuple[str, type[Any], str]] = [
+    ("network", NetworkSpec, "networks"),
+    ("server", ServerSpec, "servers"),
+    ("volume", VolumeSpec, "volumes"),
+    ("firewall", FirewallSpec, "firewalls"),
+    ("load_balancer", LoadBalancerSpec, "load_balancers"),
+]
+_COLLECTIONS = {type_: collection for type_, _, collection in _RESOURCE_TYPES}
+
+_CREATE = PlannedOperation.TYPE_CREATE
+_UPDATE = PlannedOperation.TYPE_UPDATE
+_ATTACH = PlannedOperation.TYPE_ATTACH
+_DETACH = PlannedOperation.TYPE_DETACH
+_DELETE = PlannedOperation.TYPE_DELETE
+
+
+def _operation_id(
+    type_: str,
+    resource: tuple[str, str],
+    target: tuple[str, ...] = (),
+) -> str:
+    return " ".join((type_, *resource, *target))
+
+
+def _create_id(type_: str, name: str) -> str:
+    return _operation_id(_CREATE, (type_, name))
+
+
+class _Planner:
+    """
+    Compares the desired specs with an inventory, and collects the operations
+    converging the inventory to the specs.
+    """
+
+    # pylint: disable=too-many-public-methods
+
+    def __init__(self, client: Client, inventory: Inventory, owner: str):
+        self.client = client
+        self.inventory = inventory
+        self.owner = owner
+        self.desired: dict[str, dict[str, Any]] = {o: {} for o in _COLLECTIONS}
+        self.operations: dict[str, PlannedOperation] = {}
+
+        # Bound resources by type and name, completed by the create operations
+        self.resources: dict[tuple[str, str], Any] = {}
+        for type_, collection in _COLLECTIONS.items():
+            for resource in getattr(inventory, collection):
+                self.resources[(type_, resource.name)] = resource
+
+    # Planning
+
+    def existing(self, type_: str, name: str) -> Any:
+        return getattr(self.inventory, _COLLECTIONS[type_]).get_by_name(name)
+
+    def name_of(self, type_: str, id: int | None) -> str | None:
+        resource = getattr(self.inventory, _COLLECTIONS[type_]).get_by_id(id)
+        return resource.name if resource is not None else None
+
+    def is_owned(self, resource: Any) -> bool:
+        return bool((resource.labels or {}).get(OWNER_LABEL) == self.owner)
+
+    def labels(self, spec: Spec) -> dict[str, str]:
+        return {**spec.labels, OWNER_LABEL: self.owner}
+
+    def check_reference(self, type_: str, name: str) -> None:
+        if name in self.desired[type_]:
+            return
+        resource = self.existing(type_, name)
+        if resource is None:
+            raise ValueError(f"{type_} {name!r} is neither desired nor existing")
+        if self.is_owned(resource):
+            raise ValueError(f"{type_} {name!r} is not desired and would be deleted")
+
+    def add(
+        self,
+        type_: str,
+        resource: tuple[str, str],
+        run: Callable[[], list[BoundAction]],
+        depends_on: Iterable[str] = (),
+        target: tuple[str, ...] = (),
+    ) -> str:
+        id = _operation_id(type_, resource, target)
+        if id not in self.operations:
+            self.operations[id] = PlannedOperation(
+                id, type_, resource, list(depends_on), run
+            )
+        return id
+
+    def plan(self, specs: Iterable[Spec]) -> list[PlannedOperation]:
+        for spec in specs:
+            for type_, cls, _ in _RESOURCE_TYPES:
+                if isinstance(spec, cls):
+                    if spec.name in self.desired[type_]:
+                        raise ValueError(f"duplicate {type_} {spec.name!r}")
+                    self.desired[type_][spec.name] = spec
+                    break
+            else:
+                raise ValueError(f"unsupported spec {spec!r}")
+
+        for type_, _, _ in _RESOURCE_TYPES:
+            for spec in self.desired[type_].values():
+                getattr(self, f"plan_{type_}")(spec)
+        self.plan_deletes()
+
+        return list(self.operations.values())
+
+    def plan_labels(self, type_: str, spec: Spec, resource: Any) -> None:
+        labels = self.labels(spec)
+        if resource.labels != labels:
+            self.add(
+                _UPDATE,
+                (type_, spec.name),
+                partial(self.run_update, type_, spec.name, labels),
+            )
+
+    def plan_network(self, spec: NetworkSpec) -> None:
+        network = self.existing("network", spec.name)
+        if network is None:
+            self.add(
+                _CREATE,
+                ("network", spec.name),
+                partial(self.run_create_network, spec),
+            )
+        else:
+            self.plan_labels("network", spec, network)
+
+    def plan_server(self, spec: ServerSpec) -> None:
+        resource = ("server", spec.name)
+        server = self.existing(*resource)
+        current: set[str | None] = set()
+        if server is None:
+            self.add(_CREATE, resource, partial(self.run_create_server, spec))
+        else:
+            self.plan_labels("server", spec, server)
+            current = {
+                self.name_of("network", o.network.id) for o in server.private_net or []
+            }
+
+        for network in spec.networks:
+            self.check_reference("network", network)
+            if network not in current:
+                self.add(
+                    _ATTACH,
+                    resource,
+                    partial(self.run_attach_server_network, spec.name, network),
+                    [_create_id(*resource), _create_id("network", network)],
+                    ("network", network),
+                )
+        for stale in current - set(spec.networks):
+            if stale is not None:
+                self.detach_server_network(spec.name, stale)
+
+    def plan_volume(self, spec: VolumeSpec) -> None:
+        resource = ("volume", spec.name)
+        volume = self.existing(*resource)
+        current = None
+        if volume is None:
+            self.add(_CREATE, resource, partial(self.run_create_volume, spec))
+        else:
+            self.plan_labels("volume", spec, volume)
+            if spec.size > volume.size:
+                self.add(
+                    _UPDATE,
+                    resource,
+                    partial(self.run_resize_volume, spec.name, spec.size),
+                    target=("size", str(spec.size)),
+                )
+            if volume.server is not None:
+                current = self.name_of("server", volume.server.id)
+
+        if spec.server != current:
+            depends_on = [_create_id(*resource)]
+            if current is not None:
+                depends_on.append(self.detach_volume(spec.name))
+            if spec.server is not None:
+                self.check_reference("server", spec.server)
+                self.add(
+                    _ATTACH,
+                    resource,
+                    partial(self.run_attach_volume, spec.name, spec.server),
+                    [*depends_on, _create_id("server", spec.server)],
+                    ("server", spec.server),
+                )
+
+    def plan_firewall(self, spec: FirewallSpec) -> None:
+        resource = ("firewall", spec.name)
+        firewall = self.existing(*resource)
+        current: set[str | None] = set()
+        if firewall is None:
+            self.add(_CREATE, resource, partial(self.run_create_firewall, spec))
+        else:
+            self.plan_labels("firewall", spec, firewall)
+            rules = [o.to_payload() for o in spec.rules]
+            if [o.to_payload() for o in firewall.rules or []] != rules:
+                self.add(
+                    _UPDATE,
+                    resource,
+                    partial(self.run_set_rules, spec.name, spec.rules),
+                    target=("rules",),
+                )
+            current = {
+                self.name_of("server", o.server.id)
+                for o in firewall.applied_to or []
+                if o.type == FirewallResource.TYPE_SERVER and o.server is not None
+            }
+
+        for server in spec.servers:
+            self.check_reference("server", server)
+            if server not in current:
+                self.add(
+                    _ATTACH,
+                    resource,
+                    partial(self.run_apply_firewall, spec.name, server),
+                    [_create_id(*resource), _create_id("server", server)],
+                    ("server", server),
+                )
+        for stale in current - set(spec.servers):
+            if stale is not None:
+                self.add(
+                    _DETACH,
+                    resource,
+                    partial(self.run_remove_firewall, spec.name, stale),
+                    target=("server", stale),
+                )
+
+    def plan_load_balancer(self, spec: LoadBalancerSpec) -> None:
+        resource = ("load_balancer", spec.name)
+        load_balancer = self.existing(*resource)
+        networks: set[str | None] = set()
+        servers: set[str | None] = set()
+        if load_balancer is None:
+            self.add(_CREATE, resource, partial(self.run_create_load_balancer, spec))
+        else:
+            self.plan_labels("load_balancer", spec, load_balancer)
+            networks = {
+                self.name_of("network", o.network.id)
+                for o in load_balancer.private_net or []
+            }
+            servers = {
+                self.name_of("server", o.server.id)
+                for o in load_balancer.targets or []
+                if o.type == "server" and o.server is not None
+            }
+
+        desired_networks = [spec.network] if spec.network is not None else []
+        for network in desired_networks:
+            self.check_reference("network", network)
+            if network not in networks:
+                self.add(
+                    _ATTACH,
+                    resource,
+                    partial(self.run_attach_load_balancer_network, spec.name, network),
+                    [_create_id(*resource), _create_id("network", network)],
+                    ("network", network),
+                )
+        for stale in networks - set(desired_networks):
+            if stale is not None:
+                self.detach_load_balancer_network(spec.name, stale)
+
+        for server in spec.servers:
+            self.check_reference("server", server)
+            if server not in servers:
+                self.add(
+                    _ATTACH,
+                    resource,
+                    partial(self.run_add_target, spec.name, server),
+                    [_create_id(*resource), _create_id("server", server)],
+                    ("server", server),
+                )
+        for stale in servers - set(spec.servers):
+            if stale is not None:
+                self.add(
+                    _DETACH,
+                    resource,
+                    partial(self.run_remove_target, spec.name, stale),
+                    target=("server", stale),
+                )
+
+    def detach_server_network(self, server: str, network: str) -> str:
+        return self.add(
+            _DETACH,
+            ("server", server),
+            partial(self.run_detach_server_network, server, network),
+            target=("network", network),
+        )
+
+    def detach_load_balancer_network(self, load_balancer: str, network: str) -> str:
+        return self.add(
+            _DETACH,
+            ("load_balancer", load_balancer),
+            partial(self.run_detach_load_balancer_network, load_balancer, network),
+            target=("network", network),
+        )
+
+    def detach_volume(self, volume: str) -> str:
+        return self.add(
+            _DETACH,
+            ("volume", volume),
+            partial(self.run_detach_volume, volume),
+        )
+
+    def delete(self, type_: str, name: str, depends_on: Iterable[str] = ()) -> str:
+        return self.add(
+            _DELETE,
+            (type_, name),
+            partial(self.run_delete, type_, name),
+            depends_on,
+        )
+
+    def plan_deletes(self) -> None:
+        """
+        Deletes the resources of the owner that are not desired anymore, after
+        detaching their dependencies.
+        """
+        # Names of the deleted resources by type and ID
+        deleted: dict[str, dict[int, str]] = {o: {} for o in _COLLECTIONS}
+        for type_, collection in _COLLECTIONS.items():
+            for resource in getattr(self.inventory, collection):
+                if self.is_owned(resource) and resource.name not in self.desired[type_]:
+                    deleted[type_][resource.id] = resource.name
+
+        for server in self.inventory.servers:
+            if server.id in deleted["server"]:
+                depends_on = []
+                for volume in server.volumes or []:
+                    name = self.name_of("volume", volume.id)
+                    if name is not None:
+                        depends_on.append(self.detach_volume(name))
+                self.delete("server", deleted["server"][server.id], depends_on)
+
+        for volume in self.inventory.volumes:
+            if volume.id in deleted["volume"]:
+                name = deleted["volume"][volume.id]
+                depends_on = []
+                if volume.server is not None:
+                    depends_on.append(self.detach_volume(name))
+                self.delete("volume", name, depends_on)
+
+        for firewall in self.inventory.firewalls:
+            if firewall.id in deleted["firewall"]:
+                name = deleted["firewall"][firewall.id]
+                depends_on = []
+                if firewall.applied_to:
+                    depends_on.append(
+                        self.add(
+                            _DETACH,
+                            ("firewall", name),
+                            partial(self.run_remove_firewall, name, None),
+                        )
+                    )
+                self.delete("firewall", name, depends_on)
+
+        for name in deleted["load_balancer"].values():
+            self.delete("load_balancer", name)
+
+        for id, name in deleted["network"].items():
+            depends_on = []
+            for type_, attached in (
+                ("server", self.inventory.servers),
+                ("load_balancer", self.inventory.load_balancers),
+            ):
+                for resource in attached:
+                    if resource.name is None or not any(
+                        o.network.id == id for o in resource.private_net or []
+                    ):
+                        continue
+                    if resource.id in deleted[type_]:
+                        depends_on.append(
+                            _operation_id(_DELETE, (type_, deleted[type_][resource.id]))
+                        )
+                    elif type_ == "server":
+                        depends_on.append(
+                            self.detach_server_network(resource.name, name)
+                        )
+                    else:
+                        depends_on.append(
+                            self.detach_load_balancer_network(resource.name, name)
+                        )
+            self.delete("network", name, depends_on)
+
+    # Operations
+
+    def get(self, type_: str, name: str) -> Any:
+        return self.resources[(type_, name)]
+
+    def run_create_network(self, spec: NetworkSpec) -> list[BoundAction]:
+        self.resources[("network", spec.name)] = self.client.networks.create(
+            name=spec.name,
+            ip_range=spec.ip_range,
+            subnets=spec.subnets,
+            labels=self.labels(spec),
+        )
+        return []
+
+    def run_create_server(self, spec: ServerSpec) -> list[BoundAction]:
+        response = self.client.servers.create(
+            name=spec.name,
+            server_type=spec.server_type,
+            image=spec.image,
+            location=spec.location,
+            ssh_keys=spec.ssh_keys,
+            user_data=spec.user_data,
+            labels=self.labels(spec),
+        )
+        self.resources[("server", spec.name)] = response.server
+        return [response.action, *response.next_actions]
+
+    def run_create_volume(self, spec: VolumeSpec) -> list[BoundAction]:
+        response = self.client.volumes.create(
+            size=spec.size,
+            name=spec.name,
+            labels=self.labels(spec),  # type: ignore[arg-type]
+            location=spec.location,
+            format=spec.format,
+        )
+        self.resources[("volume", spec.name)] = response.volume
+        return [response.action, *response.next_actions]
+
+    def run_create_firewall(self, spec: FirewallSpec) -> list[BoundAction]:
+        response = self.client.firewalls.create(
+            name=spec.name,
+            rules=spec.rules,
+            labels=self.labels(spec),  # type: ignore[arg-type]
+        )
+        self.resources[("firewall", spec.name)] = response.firewall
+        return response.actions or []
+
+    def run_create_load_balancer(self, spec: LoadBalancerSpec) -> list[BoundAction]:
+        response = self.client.load_balancers.create(
+            name=spec.name,
+            load_balancer_type=spec.load_balancer_type,
+            location=spec.location,
+            services=spec.services,
+            labels=self.labels(spec),
+        )
+        self.resources[("load_balancer", spec.name)] = response.load_balancer
+        return [response.action]
+
+    def run_update(
+        self,
+        type_: str,
+        name: str,
+        labels: dict[str, str],
+    ) -> list[BoundAction]:
+        resources_client = getattr(self.client, _COLLECTIONS[type_])
+        self.resources[(type_, name)] = resources_client.update(
+            self.get(type_, name), labels=labels
+        )
+        return []
+
+    def run_resize_volume(self, volume: str, size: int) -> list[BoundAction]:
+        return [self.client.volumes.resize(self.get("volume", volume), size)]
+
+    def run_set_rules(
+        self,
+        firewall: str,
+        rules: list[FirewallRule],
+    ) -> list[BoundAction]:
+        return self.client.firewalls.set_rules(self.get("firewall", firewall), rules)
+
+    def run_attach_server_network(self, server: str, network: str) -> list[BoundAction]:
+        return [
+            self.client.servers.attach_to_network(
+                self.get("server", server), self.get("network", network)
+            )
+        ]
+
+    def run_detach_server_network(self, server: str, network: str) -> list[BoundAction]:
+        return [
+            self.client.servers.detach_from_network(
+                self.get("server", server), self.get("network", network)
+            )
+        ]
+
+    def run_attach_volume(self, volume: str, server: str) -> list[BoundAction]:
+        return [
+            self.client.volumes.attach(
+                self.get("volume", volume), self.get("server", server)
+            )
+        ]
+
+    def run_detach_volume(self, volume: str) -> list[BoundAction]:
+        return [self.client.volumes.detach(self.get("volume", volume))]
+
+    def run_apply_firewall(self, firewall: str, server: str) -> list[BoundAction]:
+        return self.client.firewalls.apply_to_resources(
+            self.get("firewall", firewall),
+            [
+                FirewallResource(
+                    type=FirewallResource.TYPE_SERVER,
+                    server=self.get("server", server),
+                )
+            ],
+        )
+
+    def run_remove_firewall(
+        self,
+        firewall: str,
+        server: str | None,
+    ) -> list[BoundAction]:
+        """
+        Removes the firewall from a server, or from all its resources.
+        """
+        bound_firewall = self.get("firewall", firewall)
+        if server is None:
+            resources = bound_firewall.applied_to or []
+        else:
+            resources = [
+                FirewallResource(
+                    type=FirewallResource.TYPE_SERVER,
+                    server=self.get("server", server),
+                )
+            ]
+        return self.client.firewalls.remove_from_resources(bound_firewall, resources)
+
+    def run_attach_load_balancer_network(
+        self,
+        load_balancer: str,
+        network: str,
+    ) -> list[BoundAction]:
+        return [
+            self.client.load_balancers.attach_to_network(
+                self.get("load_balancer", load_balancer),
+                self.get("network", network),
+            )
+        ]
+
+    def run_detach_load_balancer_network(
+        self,
+        load_balancer: str,
+        network: str,
+    ) -> list[BoundAction]:
+        return [
+            self.client.load_balancers.detach_from_network(
+                self.get("load_balancer", load_balancer),
+                self.get("network", network),
+            )
+        ]
+
+    def run_add_target(self, load_balancer: str, server: str) -> list[BoundAction]:
+        return [
+            self.client.load_balancers.add_target(
+                self.get("load_balancer", load_balancer),
+                LoadBalancerTarget(type="server", server=self.get("server", server)),
+            )
+        ]
+
+    def run_remove_target(self, load_balancer: str, server: str) -> list[BoundAction]:
+        return [
+            self.client.load_balancers.remove_target(
+                self.get("load_balancer", load_balancer),
+                LoadBalancerTarget(type="server", server=self.get("server", server)),
+            )
+        ]
+
+    def run_delete(self, type_: str, name: str) -> list[BoundAction]:
+        resources_client = getattr(self.client, _COLLECTIONS[type_])
+        result = resources_client.delete(self.get(type_, name))
+        return [result] if isinstance(result, BoundAction) else []
+
+
+class Plan:
+    """
+    Operations converging a project to desired specs, ordered by their dependencies,
+    see :func:`create_plan`.
+
+    :param client: Client used to apply the operations.
+    :param operations: Operations of the plan, the dependencies on operations
+        missing from the plan are ignored.
+    """
+
+    def __init__(self, client: Client, operations: list[PlannedOperation]):
+        self._client = client
+        ids = {o.id for o in operations}
+        for operation in operations:
+            operation.depends_on = [o for o in operation.depends_on if o in ids]
+        self.operations = operations
+        """Operations of the plan"""
+
+    def __len__(self) -> int:
+        return len(self.operations)
+
+    def __iter__(self) -> Iterator[PlannedOperation]:
+        return iter(self.operations)
+
+    def apply(self, *, concurrency: int = 5) -> list[OperationResult]:
+        """
+        Runs the operations of the plan. An operation starts as soon as the operations
+        it depends on succeeded, and succeeds once its actions finished, so
+        independent branches of the plan run in parallel. The actions of all the
+        operations in progress are polled together.
+
+        An operation fails on any exception raised while running it, or on a failed
+        action. The operations depending on a failed operation are skipped.
+
+        :param concurrency: Maximum number of requests sent concurrently.
+        :return: List[:class:`OperationResult <hcloud.reconcile.domain.OperationResult>`]
+                 in the order of the plan
+        """
+        # pylint: disable=protected-access,too-many-locals,too-many-statements
+        poll_interval_func = self._client._client._poll_interval_func
+        max_retries = self._client._client._poll_max_retries
+        actions_client = self._client.actions
+
+        results = {o.id: OperationResult(o) for o in self.operations}
+        waiting = {o.id: set(o.depends_on) for o in self.operations}
+        dependents: dict[str, list[str]] = {o.id: [] for o in self.operations}
+        for operation in self.operations:
+            for id in operation.depends_on:
+                dependents[id].append(operation.id)
+
+        ready = deque(id for id, depends_on in waiting.items() if not depends_on)
+        running: dict[int, BoundAction] = {}
+        action_operations: dict[int, str] = {}
+        pending_actions: dict[str, set[int]] = {}
+        action_polls: Counter[int] = Counter()
+
+        def finish(id: str, error: Exception | None = None) -> None:
+            result = results[id]
+            if result.status is not None:
+                return
+            if error is None:
+                result.status = OperationResult.STATUS_SUCCESS
+                for dependent in dependents[id]:
+                    waiting[dependent].discard(id)
+                    if not waiting[dependent]:
+                        ready.append(dependent)
+                return
+
+            result.status = OperationResult.STATUS_ERROR
+            result.error = error
+            skipped = deque(dependents[id])
+            while skipped:
+                skipped_result = results[skipped.popleft()]
+                if skipped_result.status is None:
+                    skipped_result.status = OperationResult.STATUS_SKIPPED
+                    skipped_result.error = error
+                    skipped.extend(dependents[skipped_result.operation.id])
+
+        def started(id: str, actions: list[BoundAction]) -> None:
+            results[id].actions.extend(actions)
+            failed = next((o for o in actions if o.status == Action.STATUS_ERROR), None)
+            if failed is not None:
+                # The running actions of a failed operation are not polled
+                finish(id, ActionFailedException(action=failed))
+                return
+
+            pending = {o.id for o in actions if o.status == Action.STATUS_RUNNING}
+            if not pending:
+                finish(id)
+                return
+            pending_actions[id] = pending
+            for action in actions:
+                if action.id in pending:
+                    running[action.id] = action
+                    action_operations[action.id] = id
+
+        def action_finished(action: BoundAction, error: Exception | None) -> None:
+            id = action_operations.pop(action.id)
+            if error is not None:
+                finish(id, error)
+                return
+            pending_actions[id].discard(action.id)
+            if not pending_actions[id]:
+                finish(id)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures: dict[Future[list[BoundAction]], str] = {}
+            polls = 0
+            while ready or futures or running:
+                while ready:
+                    id = ready.popleft()
+                    run = results[id].operation.run
+                    assert run is not None
+                    futures[executor.submit(run)] = id
+
+                if running:
+                    polls += 1
+                    time.sleep(poll_interval_func(polls))
+                    for action in actions_client._poll_running(running):
+                        action_finished(
+                            action,
+                            (
+                                ActionFailedException(action=action)
+                                if action.status == Action.STATUS_ERROR
+                                else None
+                            ),
+                        )
+                    for action in list(running.values()):
+                        action_polls[action.id] += 1
+                        if action_polls[action.id] >= max_retries:
+                            del running[action.id]
+                            action_finished(
+                                action, ActionTimeoutException(action=action)
+                            )
+                    done = {o for o in futures if o.done()}
+                else:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    id = futures.pop(future)
+                    try:
+                        started(id, future.result())
+                    except (
+                        Exception
+                    ) as exception:  # pylint: disable=broad-exception-caught
+                        finish(id, exception)
+
+        return list(results.values())
+
+
+def create_plan(
+    client: Client,
+    specs: Iterable[Spec],
+    *,
+    owner: str,
+    inventory: Inventory | None = None,
+) -> Plan:
+    """
+    Compares desired networks, servers, volumes, firewalls and load balancers with
+    the live project, and plans the operations converging the project to the specs.
+
+    Resources are matched by name. The created and updated resources are labeled
+    with ``reconcile-owner=<owner>``, the resources with this label that are not
+    desired anymore are deleted. Only labels, firewall rules and volume sizes are
+    updated in place, other differences of existing resources are ignored.
+
+    The operations depend on each other, e.g. a server is attached to a network
+    after both were created, and a volume is detached before being deleted.
+
+    :param client: Client used to fetch the live project and apply the plan.
+    :param specs: Desired resources, see :class:`NetworkSpec
+        <hcloud.reconcile.domain.NetworkSpec>`, :class:`ServerSpec
+        <hcloud.reconcile.domain.ServerSpec>`, :class:`VolumeSpec
+        <hcloud.reconcile.domain.VolumeSpec>`, :class:`FirewallSpec
+        <hcloud.reconcile.domain.FirewallSpec>` and :class:`LoadBalancerSpec
+        <hcloud.reconcile.domain.LoadBalancerSpec>`.
+    :param owner: Owner of the managed resources.
+    :param inventory: Live project, defaults to a new :meth:`Client.snapshot
+        <hcloud.Client.snapshot>`.
+    """
+    if inventory is None:
+        inventory = client.snapshot()
+    return Plan(client, _Planner(client, inventory, owner).plan(specs))
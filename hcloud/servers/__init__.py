@@ -15,9 +15,17 @@ from .domain import (
     RequestConsoleResponse,
     ResetPasswordResponse,
     Server,
+    ServerActionResult,
     ServerCreatePublicNetwork,
+    ServerCreateResult,
+    ServerHealthCheckException,
+    ServerNotStartedException,
     ServerProtection,
+    ServerRolloutResult,
+    ServerStatusResult,
+    ServerStatusTimeoutException,
 )
+from .pool import ServerPool
 
 __all__ = [
     "BoundServer",
@@ -32,8 +40,16 @@ __all__ = [
     "RequestConsoleResponse",
     "ResetPasswordResponse",
     "Server",
+    "ServerActionResult",
+    "ServerHealthCheckException",
+    "ServerNotStartedException",
+    "ServerPool",
     "ServerProtection",
+    "ServerRolloutResult",
+    "ServerStatusResult",
+    "ServerStatusTimeoutException",
     "ServerCreatePublicNetwork",
+    "ServerCreateResult",
     "ServersClient",
     "ServersPageResult",
     "RebuildResponse",
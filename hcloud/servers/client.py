@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, NamedTuple
 
+import requests
 from dateutil.parser import isoparse
 
+from .._exceptions import APIException
 from ..actions import (
+    Action,
+    ActionFailedException,
     ActionSort,
     ActionsPageResult,
     ActionStatus,
+    ActionTimeoutException,
     BoundAction,
     ResourceActionsClient,
 )
@@ -38,7 +46,15 @@ from .domain import (
     RequestConsoleResponse,
     ResetPasswordResponse,
     Server,
+    ServerActionResult,
+    ServerCreateResult,
+    ServerHealthCheckException,
+    ServerNotStartedException,
+    ServerRolloutResult,
+    ServerStatusResult,
+    ServerStatusTimeoutException,
 )
+from .rolling import _rollout
 
 if TYPE_CHECKING:
     from .._client import Client
@@ -511,6 +527,38 @@ class BoundServer(BoundModelBase[Server], Server):
         return self._client.remove_from_placement_group(self)
 
 
+# Status of the servers once the action is done. The servers are already running
+# before a reboot or a reset, so their status tells nothing and is not checked.
+_ACTION_STATUSES = {
+    "power_on": Server.STATUS_RUNNING,
+    "power_off": Server.STATUS_OFF,
+    "shutdown": Server.STATUS_OFF,
+}
+
+
+def _is_create_outcome_unknown(exception: Exception, retried: bool) -> bool:
+    """
+    Returns whether a server might have been created despite the error.
+
+    A ``uniqueness_error`` is unknown when the request may have been retried, as the
+    first attempt might have created the server.
+    """
+    if isinstance(exception, requests.exceptions.RequestException):
+        return True
+    assert isinstance(exception, APIException)
+    if isinstance(exception.code, int):
+        return exception.code >= 500
+    if exception.code == "uniqueness_error":
+        return retried
+    return exception.code in (
+        "bad_gateway",
+        "server_error",
+        "service_error",
+        "timeout",
+        "unavailable",
+    )
+
+
 class ServersPageResult(NamedTuple):
     servers: list[BoundServer]
     meta: Meta
@@ -711,6 +759,165 @@ class ServersClient(
         )
         return result
 
+    def _create_with_retries(
+        self,
+        spec: dict[str, Any],
+        retries: int,
+    ) -> ServerCreateResult:
+        attempt = 0
+        while True:
+            try:
+                response = self.create(**spec)
+                return ServerCreateResult(
+                    spec,
+                    server=response.server,
+                    actions=[response.action, *response.next_actions],
+                    root_password=response.root_password,
+                )
+            except (APIException, requests.exceptions.RequestException) as exception:
+                # The client retries the timed out requests on its own
+                # pylint: disable=protected-access
+                retried = attempt > 0 or self._client._retry_max_retries > 0
+                if not _is_create_outcome_unknown(exception, retried):
+                    raise
+
+                # The server might have been created despite the error
+                server = self.get_by_name(spec["name"])
+                if server is not None:
+                    return ServerCreateResult(
+                        spec,
+                        server=server,
+                        actions=self.get_actions(server, status=["running"]),
+                    )
+
+                if attempt >= retries:
+                    raise
+                attempt += 1
+                # pylint: disable=protected-access
+                time.sleep(self._client._retry_interval_func(attempt))
+
+    def create_many(
+        self,
+        specs: Iterable[dict[str, Any]],
+        *,
+        concurrency: int = 5,
+        retries: int = 2,
+    ) -> Iterator[ServerCreateResult]:
+        """Creates many servers, and yields each server as soon as its creation actions
+        are finished, e.g. once it is running.
+
+        The creation requests run concurrently. The actions of all the servers are
+        polled together, with a single request per page of actions.
+
+        When a creation fails with an error that does not tell whether the server was
+        created (e.g. a timeout or a server error, or a ``uniqueness_error`` once the
+        request may have been retried), the server is looked up by name. An existing
+        server is used, otherwise the creation is retried.
+
+        A failed creation does not interrupt the others, its error is stored in the
+        result. A failure to reload a created server is stored in the result too, along
+        with the server returned on creation.
+
+        :param specs: List[Dict]
+               Keyword arguments of :meth:`create`, one dict per server
+        :param concurrency: int
+               Maximum number of concurrent requests
+        :param retries: int
+               Maximum number of retries of a creation, if the server does not exist
+        :return: Iterator[:class:`ServerCreateResult <hcloud.servers.domain.ServerCreateResult>`]
+                 in the order the servers are ready
+        """
+        # pylint: disable=protected-access
+        poll_interval_func = self._client._poll_interval_func
+        max_retries = self._client._poll_max_retries
+        actions_client = self._parent.actions
+
+        # Results waiting for their actions, with their number of polls
+        waiting: dict[int, tuple[ServerCreateResult, int]] = {}
+        running: dict[int, BoundAction] = {}
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            creating: dict[Future[ServerCreateResult], dict[str, Any]] = {
+                executor.submit(self._create_with_retries, spec, retries): spec
+                for spec in specs
+            }
+            reloading: dict[Future[BoundServer], ServerCreateResult] = {}
+
+            def handle_finished(
+                result: ServerCreateResult,
+            ) -> ServerCreateResult | None:
+                assert result.server is not None and result.server.id is not None
+                failed = [o for o in result.actions if o.status == Action.STATUS_ERROR]
+                if failed:
+                    result.error = ActionFailedException(action=failed[0])
+                    return result
+                # Reload the server, to return its current status
+                reloading[executor.submit(self.get_by_id, result.server.id)] = result
+                return None
+
+            polls = 0
+            next_poll = time.monotonic()
+            while creating or reloading or waiting:
+                futures: list[Future[Any]] = [*creating, *reloading]
+                timeout = max(0.0, next_poll - time.monotonic()) if waiting else None
+                if futures:
+                    wait(futures, timeout=timeout, return_when=FIRST_COMPLETED)
+                elif timeout:
+                    time.sleep(timeout)
+
+                for future in [o for o in creating if o.done()]:
+                    spec = creating.pop(future)
+                    try:
+                        result = future.result()
+                    except (
+                        APIException,
+                        requests.exceptions.RequestException,
+                    ) as exception:
+                        yield ServerCreateResult(spec, error=exception)
+                        continue
+
+                    assert result.server is not None and result.server.id is not None
+                    pending = [
+                        o for o in result.actions if o.status == Action.STATUS_RUNNING
+                    ]
+                    if pending:
+                        waiting[result.server.id] = (result, 0)
+                        running.update((o.id, o) for o in pending)
+                    elif (finished := handle_finished(result)) is not None:
+                        yield finished
+
+                for reload_future in [o for o in reloading if o.done()]:
+                    result = reloading.pop(reload_future)
+                    try:
+                        result.server = reload_future.result()
+                    except (
+                        APIException,
+                        requests.exceptions.RequestException,
+                    ) as exception:
+                        # The server is created, keep the server returned on creation
+                        result.error = exception
+                    yield result
+
+                if waiting and time.monotonic() >= next_poll:
+                    actions_client._poll_running(running)
+                    polls += 1
+                    next_poll = time.monotonic() + poll_interval_func(polls)
+
+                    for server_id, (result, count) in list(waiting.items()):
+                        pending = [o for o in result.actions if o.id in running]
+                        if not pending:
+                            del waiting[server_id]
+                            if (finished := handle_finished(result)) is not None:
+                                yield finished
+                        elif count + 1 >= max_retries:
+                            del waiting[server_id]
+                            for action in pending:
+                                del running[action.id]
+                            result.error = ActionTimeoutException(action=pending[0])
+                            yield result
+                        else:
+                            waiting[server_id] = (result, count + 1)
+
     def get_actions_list(
         self,
         server: Server | BoundServer,
@@ -894,6 +1101,427 @@ class ServersClient(
         )
         return BoundAction(self._parent.actions, response["action"])
 
+    def _wait_for_status(
+        self,
+        servers: list[Server | BoundServer],
+        status: list[str],
+        *,
+        label_selector: str | None = None,
+        max_retries: int | None = None,
+        timeout: float | None = None,
+    ) -> dict[int, BoundServer]:
+        """
+        Waits until the servers reach one of the given statuses, listing the servers
+        with the statuses once per poll, instead of reloading each server.
+
+        The API cannot filter the servers by ID, so each poll lists every server of
+        the project with the statuses, and matching the label selector if given.
+
+        :return: The servers that reached the statuses, indexed by ID.
+        """
+        # pylint: disable=protected-access
+        if max_retries is None:
+            max_retries = self._client._poll_max_retries
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        pending = {o.id for o in servers}
+        matched: dict[int, BoundServer] = {}
+
+        retries = 0
+        while pending:
+            for server in self.get_all(label_selector=label_selector, status=status):
+                if server.id in pending:
+                    pending.discard(server.id)
+                    matched[server.id] = server  # type: ignore[index]
+
+            if not pending:
+                break
+
+            retries += 1
+            interval = self._client._poll_interval_func(retries)
+            if deadline is None:
+                if retries >= max_retries:
+                    break
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                interval = min(interval, remaining)
+            time.sleep(interval)
+
+        return matched
+
+    def wait_for_status(
+        self,
+        servers: list[Server | BoundServer],
+        status: list[str],
+        *,
+        label_selector: str | None = None,
+        timeout: float | None = None,
+    ) -> list[ServerStatusResult]:
+        """Waits until many servers reach one of the given statuses.
+
+        Each poll lists the servers with the statuses, page by page, instead of
+        reloading each server. The API cannot filter the servers by ID, so without a
+        label selector a poll pages through every server of the project with the
+        statuses, and its cost grows with the size of the project rather than with
+        the number of servers waited for. Give a ``label_selector`` matching the
+        servers to bound it.
+
+        :param servers: List[:class:`BoundServer <hcloud.servers.client.BoundServer>` or :class:`Server <hcloud.servers.domain.Server>`]
+        :param status: List[str]
+               Statuses to wait for, e.g. ``running`` or ``off``
+        :param label_selector: str (optional)
+               Label selector matching the servers, limits each poll to these servers
+        :param timeout: float (optional)
+               Seconds to wait for, defaults to the number of polls of the client
+        :return: List[:class:`ServerStatusResult <hcloud.servers.domain.ServerStatusResult>`]
+                 in the order of ``servers``
+        """
+        matched = self._wait_for_status(
+            servers,
+            status,
+            label_selector=label_selector,
+            timeout=timeout,
+        )
+        return [
+            (
+                ServerStatusResult(matched[o.id])
+                if o.id in matched
+                else ServerStatusResult(o, ServerStatusTimeoutException(o, status))
+            )
+            for o in servers
+        ]
+
+    def _action_many(
+        self,
+        command: str,
+        servers: list[Server | BoundServer] | None,
+        label_selector: str | None,
+        concurrency: int,
+        max_unavailable: int | None,
+        health_check: Callable[[list[Server | BoundServer]], bool] | None,
+    ) -> list[ServerActionResult]:
+        if max_unavailable is not None and max_unavailable < 1:
+            raise ValueError("max_unavailable must be at least 1")
+        if servers is None:
+            if label_selector is None:
+                raise ValueError("servers or label_selector must be given")
+            servers = list(self.get_all(label_selector=label_selector))
+
+        status = [_ACTION_STATUSES[command]] if command in _ACTION_STATUSES else None
+        batch_size = max_unavailable or len(servers) or 1
+
+        def apply(result: ServerActionResult) -> None:
+            try:
+                result.action = getattr(self, command)(result.server)
+            except (APIException, requests.exceptions.RequestException) as exception:
+                result.error = exception
+
+        results = [ServerActionResult(o) for o in servers]
+        stopped = False
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for start in range(0, len(results), batch_size):
+                batch = results[start : start + batch_size]
+                if stopped:
+                    for result in batch:
+                        result.error = ServerNotStartedException(result.server)
+                    continue
+
+                list(executor.map(apply, batch))
+
+                actions = [o.action for o in batch if o.action is not None]
+                errors = self._parent.actions.wait_for_all(actions)
+                for result in batch:
+                    if result.action is not None and result.action.id in errors:
+                        result.error = errors[result.action.id]
+
+                # Check the status of the whole batch at once
+                if status is not None:
+                    succeeded = [o for o in batch if o.error is None]
+                    current = self._wait_for_status(
+                        [o.server for o in succeeded],
+                        status,
+                        label_selector=label_selector,
+                    )
+                    for result in succeeded:
+                        if result.server.id in current:
+                            result.server = current[result.server.id]
+                        else:
+                            result.error = ServerStatusTimeoutException(
+                                result.server, status
+                            )
+
+                # Stop the rollout at the first unhealthy batch
+                if any(o.error is not None for o in batch):
+                    stopped = True
+                elif health_check is not None and not health_check(
+                    [o.server for o in batch]
+                ):
+                    error = ServerHealthCheckException([o.server for o in batch])
+                    for result in batch:
+                        result.error = error
+                    stopped = True
+
+        return results
+
+    def power_on_many(
+        self,
+        servers: list[Server | BoundServer] | None = None,
+        *,
+        label_selector: str | None = None,
+        concurrency: int = 5,
+        max_unavailable: int | None = None,
+        health_check: Callable[[list[Server | BoundServer]], bool] | None = None,
+    ) -> list[ServerActionResult]:
+        """Powers on many servers, in rolling batches of ``max_unavailable`` servers.
+
+        The actions of a batch are waited for together, then the status of the
+        servers of the batch is checked with a list request per poll. The next batch
+        starts once every server of the batch reached its status and the health check
+        passed. A failed batch stops the rollout, the servers of the following batches
+        are left untouched, with a
+        :class:`ServerNotStartedException <hcloud.servers.domain.ServerNotStartedException>`
+        error.
+
+        The list requests return every server of the project with the expected
+        status, pass a label selector matching the servers to keep them small.
+
+        The other bulk power operations, :meth:`power_off_many`,
+        :meth:`shutdown_many`, :meth:`reboot_many` and :meth:`reset_many`, work the
+        same way and take the same parameters. As the servers are already running
+        before a reboot or a reset, their status is not checked, the batch is done
+        once its actions are, use the health check to verify the servers came back.
+
+        :param servers: List[:class:`BoundServer <hcloud.servers.client.BoundServer>` or :class:`Server <hcloud.servers.domain.Server>`] (optional)
+               Servers to apply the operation to, defaults to the servers matching the label selector
+        :param label_selector: str (optional)
+               Label selector matching the servers
+        :param concurrency: int
+               Maximum number of concurrent requests
+        :param max_unavailable: int (optional)
+               Number of servers in each batch, at least 1, defaults to all of them
+        :param health_check: Callable (optional)
+               Called with the servers of each batch once they reached their status,
+               returns whether to continue with the next batch. When it returns
+               False, the servers of the batch get a
+               :class:`ServerHealthCheckException <hcloud.servers.domain.ServerHealthCheckException>`
+               error.
+        :return: List[:class:`ServerActionResult <hcloud.servers.domain.ServerActionResult>`]
+                 in the order of the servers
+        """
+        return self._action_many(
+            "power_on",
+            servers,
+            label_selector,
+            concurrency,
+            max_unavailable,
+            health_check,
+        )
+
+    def power_off_many(
+        self,
+        servers: list[Server | BoundServer] | None = None,
+        *,
+        label_selector: str | None = None,
+        concurrency: int = 5,
+        max_unavailable: int | None = None,
+        health_check: Callable[[list[Server | BoundServer]], bool] | None = None,
+    ) -> list[ServerActionResult]:
+        """Cuts the power of many servers, in rolling batches, until they are off.
+
+        See :meth:`power_on_many` for the rollout and the parameters.
+        """
+        return self._action_many(
+            "power_off",
+            servers,
+            label_selector,
+            concurrency,
+            max_unavailable,
+            health_check,
+        )
+
+    def shutdown_many(
+        self,
+        servers: list[Server | BoundServer] | None = None,
+        *,
+        label_selector: str | None = None,
+        concurrency: int = 5,
+        max_unavailable: int | None = None,
+        health_check: Callable[[list[Server | BoundServer]], bool] | None = None,
+    ) -> list[ServerActionResult]:
+        """Shuts down many servers gracefully, in rolling batches, until they are off.
+
+        See :meth:`power_on_many` for the rollout and the parameters.
+        """
+        return self._action_many(
+            "shutdown",
+            servers,
+            label_selector,
+            concurrency,
+            max_unavailable,
+            health_check,
+        )
+
+    def reboot_many(
+        self,
+        servers: list[Server | BoundServer] | None = None,
+        *,
+        label_selector: str | None = None,
+        concurrency: int = 5,
+        max_unavailable: int | None = None,
+        health_check: Callable[[list[Server | BoundServer]], bool] | None = None,
+    ) -> list[ServerActionResult]:
+        """Reboots many servers gracefully, in rolling batches.
+
+        See :meth:`power_on_many` for the rollout and the parameters.
+        """
+        return self._action_many(
+            "reboot",
+            servers,
+            label_selector,
+            concurrency,
+            max_unavailable,
+            health_check,
+        )
+
+    def reset_many(
+        self,
+        servers: list[Server | BoundServer] | None = None,
+        *,
+        label_selector: str | None = None,
+        concurrency: int = 5,
+        max_unavailable: int | None = None,
+        health_check: Callable[[list[Server | BoundServer]], bool] | None = None,
+    ) -> list[ServerActionResult]:
+        """Cuts the power of many servers and starts them again, in rolling batches.
+
+        See :meth:`power_on_many` for the rollout and the parameters.
+        """
+        return self._action_many(
+            "reset",
+            servers,
+            label_selector,
+            concurrency,
+            max_unavailable,
+            health_check,
+        )
+
+    def _resolve_servers(
+        self,
+        servers: list[Server | BoundServer] | None,
+        label_selector: str | None,
+    ) -> list[BoundServer]:
+        if servers is None:
+            if label_selector is None:
+                raise ValueError("servers or label_selector must be given")
+            return self.get_all(label_selector=label_selector)
+        return [
+            o if isinstance(o, BoundServer) else self.get_by_id(o.id)  # type: ignore[arg-type]
+            for o in servers
+        ]
+
+    def rebuild_many(
+        self,
+        image: Image | BoundImage,
+        servers: list[Server | BoundServer] | None = None,
+        *,
+        label_selector: str | None = None,
+        user_data: str | None = None,
+        parallelism: int = 5,
+        max_failures: int = 0,
+        max_unavailable_per_placement_group: int | None = 1,
+    ) -> list[ServerRolloutResult]:
+        """Rebuilds many servers from an image, thereby destroying all data on the servers.
+
+        Each server is powered off, rebuilt, and powered on again, unless it was off.
+        A failed server is left as is. The actions of all the servers in progress are
+        polled together. Once more than ``max_failures`` servers failed, the remaining
+        servers are left untouched, with a
+        :class:`ServerNotStartedException <hcloud.servers.domain.ServerNotStartedException>`
+        error.
+
+        :param image: :class:`BoundImage <hcloud.images.client.BoundImage>` or :class:`Image <hcloud.images.domain.Image>`
+               Image to use for the rebuilt servers
+        :param servers: List[:class:`BoundServer <hcloud.servers.client.BoundServer>` or :class:`Server <hcloud.servers.domain.Server>`] (optional)
+               Servers to rebuild
+        :param user_data: str (optional)
+               Cloud-Init user data to use during the rebuild
+        :param label_selector: str (optional)
+               Label selector of the servers, if no servers are given
+        :param parallelism: int
+               Maximum number of servers in progress at the same time
+        :param max_failures: int
+               Number of failed servers tolerated, no server is started once it is exceeded
+        :param max_unavailable_per_placement_group: int (optional)
+               Maximum number of servers of the same Placement Group in progress at the same time, None for no limit
+        :return: List[:class:`ServerRolloutResult <hcloud.servers.domain.ServerRolloutResult>`]
+        :raises: ValueError when ``parallelism`` or ``max_unavailable_per_placement_group`` is lower than 1
+        """
+        return _rollout(
+            self,
+            servers,
+            label_selector,
+            lambda server: self.rebuild(server, image, user_data=user_data),
+            parallelism=parallelism,
+            max_failures=max_failures,
+            max_unavailable_per_placement_group=max_unavailable_per_placement_group,
+        )
+
+    def change_type_many(
+        self,
+        server_type: ServerType | BoundServerType,
+        upgrade_disk: bool,
+        servers: list[Server | BoundServer] | None = None,
+        *,
+        label_selector: str | None = None,
+        parallelism: int = 5,
+        max_failures: int = 0,
+        max_unavailable_per_placement_group: int | None = 1,
+        shutdown_timeout: float = 300.0,
+    ) -> list[ServerRolloutResult]:
+        """Changes the type of many servers.
+
+        Each server is shut down, its type is changed, and it is powered on again,
+        unless it was off. A server still not off ``shutdown_timeout`` seconds after
+        the shutdown is powered off. A failed server is left as is. The actions of all
+        the servers in progress are polled together, and the servers waiting to be off
+        are checked with a single list request per poll, listing every server of the
+        project that is off, pass a label selector to keep it small. Once more than ``max_failures``
+        servers failed, the remaining servers are left untouched, with a
+        :class:`ServerNotStartedException <hcloud.servers.domain.ServerNotStartedException>`
+        error.
+
+        :param server_type: :class:`BoundServerType <hcloud.server_types.client.BoundServerType>` or :class:`ServerType <hcloud.server_types.domain.ServerType>`
+               Server type the servers should migrate to
+        :param upgrade_disk: boolean
+               If false, do not upgrade the disks. This allows downgrading the servers later.
+        :param servers: List[:class:`BoundServer <hcloud.servers.client.BoundServer>` or :class:`Server <hcloud.servers.domain.Server>`] (optional)
+               Servers to change the type of
+        :param label_selector: str (optional)
+               Label selector of the servers, if no servers are given
+        :param parallelism: int
+               Maximum number of servers in progress at the same time
+        :param max_failures: int
+               Number of failed servers tolerated, no server is started once it is exceeded
+        :param max_unavailable_per_placement_group: int (optional)
+               Maximum number of servers of the same Placement Group in progress at the same time, None for no limit
+        :param shutdown_timeout: float
+               Seconds to wait for a server to be off after the shutdown, before powering it off
+        :return: List[:class:`ServerRolloutResult <hcloud.servers.domain.ServerRolloutResult>`]
+        :raises: ValueError when ``parallelism`` or ``max_unavailable_per_placement_group`` is lower than 1
+        """
+        return _rollout(
+            self,
+            servers,
+            label_selector,
+            lambda server: self.change_type(server, server_type, upgrade_disk),
+            parallelism=parallelism,
+            max_failures=max_failures,
+            max_unavailable_per_placement_group=max_unavailable_per_placement_group,
+            shutdown_timeout=shutdown_timeout,
+        )
+
     def reset_password(self, server: Server | BoundServer) -> ResetPasswordResponse:
         """Resets the root password. Only works for Linux systems that are running the qemu guest agent.
 
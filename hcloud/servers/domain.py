@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal, TypedDict
+from typing import TYPE_CHECKING, Any, Literal, TypedDict
 
+from .._exceptions import HCloudException
 from ..core import BaseDomain, DomainIdentityMixin
 
 if TYPE_CHECKING:
@@ -25,6 +26,13 @@ __all__ = [
     "Server",
     "ServerProtection",
     "CreateServerResponse",
+    "ServerCreateResult",
+    "ServerActionResult",
+    "ServerRolloutResult",
+    "ServerStatusResult",
+    "ServerStatusTimeoutException",
+    "ServerHealthCheckException",
+    "ServerNotStartedException",
     "ResetPasswordResponse",
     "EnableRescueResponse",
     "RequestConsoleResponse",
@@ -217,6 +225,151 @@ class CreateServerResponse(BaseDomain):
         self.root_password = root_password
 
 
+class ServerCreateResult(BaseDomain):
+    """Server Create Result Domain
+
+    :param spec: Dict
+           Arguments of :meth:`ServersClient.create <hcloud.servers.client.ServersClient.create>` used to create the server
+    :param server: :class:`BoundServer <hcloud.servers.client.BoundServer>`
+           The created server, None if the creation failed
+    :param actions: List[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
+           The creation action and the additional actions, like a `start_server` action
+    :param root_password: str, None
+           The root password of the server if no SSH-Key was given on server creation
+    :param error: Exception
+           Error raised while creating the server
+    """
+
+    __api_properties__ = ("spec", "server", "actions", "root_password", "error")
+    __slots__ = __api_properties__
+
+    def __init__(
+        self,
+        spec: dict[str, Any],
+        server: BoundServer | None = None,
+        actions: list[BoundAction] | None = None,
+        root_password: str | None = None,
+        error: Exception | None = None,
+    ):
+        self.spec = spec
+        self.server = server
+        self.actions = actions or []
+        self.root_password = root_password
+        self.error = error
+
+
+class ServerActionResult(BaseDomain):
+    """Server Action Result Domain
+
+    :param server: :class:`BoundServer <hcloud.servers.client.BoundServer>` or :class:`Server <hcloud.servers.domain.Server>`
+           The server the action was applied to
+    :param action: :class:`BoundAction <hcloud.actions.client.BoundAction>`
+           The action, None if the request failed or was not sent
+    :param error: Exception
+           Error raised while applying the action, or why it was not applied
+    """
+
+    __api_properties__ = ("server", "action", "error")
+    __slots__ = __api_properties__
+
+    def __init__(
+        self,
+        server: Server | BoundServer,
+        action: BoundAction | None = None,
+        error: Exception | None = None,
+    ):
+        self.server = server
+        self.action = action
+        self.error = error
+
+
+class ServerRolloutResult(BaseDomain):
+    """Server Rollout Result Domain
+
+    :param server: :class:`BoundServer <hcloud.servers.client.BoundServer>`
+           The server the operation was applied to
+    :param actions: List[:class:`BoundAction <hcloud.actions.client.BoundAction>`]
+           The actions of the steps of the operation, e.g. ``stop_server``, ``rebuild_server`` and ``start_server``
+    :param root_password: str, None
+           The new root password of the server, if any
+    :param error: Exception
+           Error raised while applying the operation
+    """
+
+    __api_properties__ = ("server", "actions", "root_password", "error")
+    __slots__ = __api_properties__
+
+    def __init__(
+        self,
+        server: BoundServer,
+        actions: list[BoundAction] | None = None,
+        root_password: str | None = None,
+        error: Exception | None = None,
+    ):
+        self.server = server
+        self.actions = actions or []
+        self.root_password = root_password
+        self.error = error
+
+
+class ServerStatusResult(BaseDomain):
+    """Server Status Result Domain
+
+    :param server: :class:`BoundServer <hcloud.servers.client.BoundServer>` or :class:`Server <hcloud.servers.domain.Server>`
+           The server, reloaded once it reached the status
+    :param error: :class:`ServerStatusTimeoutException <hcloud.servers.domain.ServerStatusTimeoutException>`, None
+           Error raised if the server did not reach the status in time
+    """
+
+    __api_properties__ = ("server", "error")
+    __slots__ = __api_properties__
+
+    def __init__(
+        self,
+        server: Server | BoundServer,
+        error: ServerStatusTimeoutException | None = None,
+    ):
+        self.server = server
+        self.error = error
+
+
+class ServerStatusTimeoutException(HCloudException):
+    """The server did not reach the expected status in time"""
+
+    def __init__(self, server: Server | BoundServer, status: list[str]):
+        assert self.__doc__ is not None
+        message = f"{self.__doc__} ({', '.join(status)}, {server.id})"
+
+        super().__init__(message)
+        self.message = message
+        self.server = server
+        self.status = status
+
+
+class ServerHealthCheckException(HCloudException):
+    """The health check of the servers failed"""
+
+    def __init__(self, servers: list[Server | BoundServer]):
+        assert self.__doc__ is not None
+        message = f"{self.__doc__} ({', '.join(str(o.id) for o in servers)})"
+
+        super().__init__(message)
+        self.message = message
+        self.servers = servers
+
+
+class ServerNotStartedException(HCloudException):
+    """The operation was not started on the server, the rollout stopped before"""
+
+    def __init__(self, server: Server | BoundServer):
+        assert self.__doc__ is not None
+        message = f"{self.__doc__} ({server.id})"
+
+        super().__init__(message)
+        self.message = message
+        self.server = server
+
+
 class ResetPasswordResponse(BaseDomain):
     """Reset Password Response Domain
 
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from ..core import ResourcePoolBase
+from .client import BoundServer, ServersClient
+
+if TYPE_CHECKING:
+    from ..images import BoundImage, Image
+    from ..locations import BoundLocation, Location
+    from ..server_types import BoundServerType, ServerType
+
+    ServerPoolTemplate = tuple[
+        ServerType | BoundServerType,
+        Image | BoundImage,
+        Location | BoundLocation,
+    ]
+
+__all__ = [
+    "ServerPool",
+]
+
+
+def _template_key(
+    server_type: ServerType | BoundServerType,
+    image: Image | BoundImage,
+    location: Location | BoundLocation,
+) -> str:
+    return f"{server_type.id_or_name}.{image.id_or_name}.{location.id_or_name}"
+
+
+class ServerPool(ResourcePoolBase[str, BoundServer]):
+    """
+    Keeps a number of powered off servers ready for each server type, image and
+    location, so that scaling out only waits for a server to power on, instead of
+    a full server creation.
+
+    The servers of the pool are labeled with ``server-pool=<name>`` and
+    ``server-pool-template=<server type>.<image>.<location>``, the pool can be recovered
+    with :meth:`load` after a restart. The server types, images and locations must
+    be identified the same way, by ID or by name, when creating and using the pool.
+
+    The servers are handed out atomically within the process, a pool must not be
+    shared by many processes.
+
+    :param client: Servers client used to manage the servers.
+    :param name: Name of the pool, used to label and name its servers.
+    :param templates: Server types, images and locations of the servers to keep.
+    :param size: Number of powered off servers to keep per template.
+    :param concurrency: Maximum number of servers created concurrently.
+    :param create_options: Additional arguments of
+           :meth:`ServersClient.create <hcloud.servers.client.ServersClient.create>`,
+           e.g. ``ssh_keys`` or ``networks``.
+    """
+
+    LABEL = "server-pool"
+    """Label identifying the servers of a pool"""
+
+    TEMPLATE_LABEL = "server-pool-template"
+    """Label identifying the server type, image and location of the servers of a pool"""
+
+    def __init__(
+        self,
+        client: ServersClient,
+        name: str,
+        templates: Iterable[ServerPoolTemplate],
+        *,
+        size: int = 1,
+        concurrency: int = 5,
+        create_options: dict[str, Any] | None = None,
+    ):
+        self._templates: dict[str, ServerPoolTemplate] = {
+            _template_key(*template): template for template in templates
+        }
+        super().__init__(name, self._templates, size=size, concurrency=concurrency)
+        self._client = client
+        self._create_options = create_options or {}
+
+    def _labels(self, key: str) -> dict[str, str]:
+        return {self.LABEL: self._name, self.TEMPLATE_LABEL: key}
+
+    def available(
+        self,
+        server_type: ServerType | BoundServerType,
+        image: Image | BoundImage,
+        location: Location | BoundLocation,
+    ) -> int:
+        """
+        Returns the number of powered off servers ready for a template.
+
+        :param server_type: Server type of the servers.
+        :param image: Image of the servers.
+        :param location: Location of the servers.
+        """
+        return self._count(_template_key(server_type, image, location))
+
+    def _key(self, resource: BoundServer) -> str | None:
+        return (resource.labels or {}).get(self.TEMPLATE_LABEL)
+
+    def _describe(self, key: str) -> str:
+        return f"servers for the template {key!r}"
+
+    def load(self) -> None:
+        """
+        Adds the existing powered off servers of the pool, found by their label.
+        """
+        for server in self._client.get_all(
+            label_selector=f"{self.LABEL}={self._name}",
+            status=["off"],
+        ):
+            self._put(server)
+
+    def _create_many(
+        self, keys: list[str]
+    ) -> tuple[list[BoundServer], list[Exception]]:
+        specs = []
+        for key in keys:
+            server_type, image, location = self._templates[key]
+            specs.append(
+                {
+                    **self._create_options,
+                    "name": f"{self._name}-{uuid.uuid4().hex[:8]}",
+                    "server_type": server_type,
+                    "image": image,
+                    "location": location,
+                    "labels": self._labels(key),
+                    "start_after_create": False,
+                }
+            )
+
+        created: list[BoundServer] = []
+        errors: list[Exception] = []
+        for result in self._client.create_many(specs, concurrency=self._concurrency):
+            if result.error is not None:
+                errors.append(result.error)
+                continue
+            assert result.server is not None
+            created.append(result.server)
+
+        return created, errors
+
+    def acquire(
+        self,
+        server_type: ServerType | BoundServerType,
+        image: Image | BoundImage,
+        location: Location | BoundLocation,
+        *,
+        name: str | None = None,
+        labels: dict[str, str] | None = None,
+    ) -> BoundServer:
+        """
+        Takes a powered off server out of the pool, replaces its name and labels, and
+        powers it on. When the pool is empty, a new server is created right away. The
+        pool is refilled in the background, see :meth:`start`.
+
+        :param server_type: Server type of the server.
+        :param image: Image of the server.
+        :param location: Location of the server.
+        :param name: New name of the server, defaults to the name given by the pool.
+        :param labels: New labels of the server, replacing the labels of the pool.
+        :return: The running server.
+        :raises: ValueError when the pool does not keep servers for the template.
+        """
+        server = self._take(_template_key(server_type, image, location))
+        if server is None:
+            response = self._client.create(
+                **self._create_options,
+                name=name or f"{self._name}-{uuid.uuid4().hex[:8]}",
+                server_type=server_type,
+                image=image,
+                location=location,
+                labels=labels or {},
+            )
+            # pylint: disable=protected-access
+            self._client._parent.actions.wait_for(
+                [response.action, *response.next_actions]
+            )
+            return self._client.get_by_id(response.server.id)  # type: ignore[arg-type]
+
+        server = self._client.update(server, name=name, labels=labels or {})
+        self._client.power_on(server).wait_until_finished()
+        server.reload()
+        return server
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import time
+from collections import Counter, deque
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Union
+
+from ..actions import (
+    Action,
+    ActionFailedException,
+    ActionTimeoutException,
+    BoundAction,
+)
+from .domain import (
+    RebuildResponse,
+    Server,
+    ServerNotStartedException,
+    ServerRolloutResult,
+)
+
+if TYPE_CHECKING:
+    from .client import BoundServer, ServersClient
+
+# A step returning None waits for the server to be off
+_Step = Callable[["BoundServer"], Union[BoundAction, RebuildResponse, None]]
+
+
+def _wait_for_off(server: BoundServer) -> None:  # pylint: disable=unused-argument
+    return None
+
+
+class _RolloutTask:
+    """
+    Remaining steps of the operation of one server.
+    """
+
+    __slots__ = ("result", "steps", "action", "polls", "deadline")
+
+    def __init__(self, result: ServerRolloutResult, steps: list[_Step]):
+        self.result = result
+        self.steps = deque(steps)
+        self.action: BoundAction | None = None
+        self.polls = 0
+        # Set while waiting for the server to be off
+        self.deadline: float | None = None
+
+    @property
+    def placement_group(self) -> int | None:
+        placement_group = self.result.server.placement_group
+        return placement_group.id if placement_group is not None else None
+
+
+def _rollout(
+    client: ServersClient,
+    servers: list[Server | BoundServer] | None,
+    label_selector: str | None,
+    operation: _Step,
+    *,
+    parallelism: int,
+    max_failures: int,
+    max_unavailable_per_placement_group: int | None,
+    shutdown_timeout: float | None = None,
+) -> list[ServerRolloutResult]:
+    """
+    Applies an operation to many servers, given or selected by their labels, each
+    server being stopped before the operation, and powered on again afterwards if it
+    was not off.
+
+    A server is powered off, or, with a ``shutdown_timeout``, shut down and powered
+    off if it is still not off after ``shutdown_timeout`` seconds. The servers waiting
+    to be off are checked together, with a list request of the servers that are off.
+
+    At most ``parallelism`` servers are in progress at the same time, and at most
+    ``max_unavailable_per_placement_group`` servers of the same Placement Group. The
+    actions of all the servers in progress are polled together. No server is started
+    once more than ``max_failures`` servers failed, the servers not started have a
+    :class:`ServerNotStartedException` error.
+
+    :raises: ValueError when ``parallelism`` or ``max_unavailable_per_placement_group`` is lower than 1
+    """
+    if parallelism < 1:
+        raise ValueError("parallelism must be at least 1")
+    if (
+        max_unavailable_per_placement_group is not None
+        and max_unavailable_per_placement_group < 1
+    ):
+        raise ValueError("max_unavailable_per_placement_group must be at least 1")
+    # pylint: disable=protected-access
+    bound_servers = client._resolve_servers(servers, label_selector)
+
+    poll_interval_func = client._client._poll_interval_func
+    max_retries = client._client._poll_max_retries
+    actions_client = client._parent.actions
+
+    queue = list(bound_servers)
+    results: dict[int, ServerRolloutResult] = {}
+    in_progress: list[_RolloutTask] = []
+    running: dict[int, BoundAction] = {}
+    unavailable: Counter[int | None] = Counter()
+    failures = 0
+
+    def finish(task: _RolloutTask, error: Exception | None = None) -> None:
+        nonlocal failures
+        in_progress.remove(task)
+        unavailable[task.placement_group] -= 1
+        if error is not None:
+            task.result.error = error
+            failures += 1
+
+    def advance(task: _RolloutTask) -> None:
+        """
+        Starts the next step of the task, or finishes the task.
+        """
+        while task.steps:
+            step = task.steps.popleft()
+            try:
+                response = step(task.result.server)
+            except Exception as exception:  # pylint: disable=broad-exception-caught
+                finish(task, exception)
+                return
+
+            if response is None:
+                assert shutdown_timeout is not None
+                task.action = None
+                task.deadline = time.monotonic() + shutdown_timeout
+                return
+            if isinstance(response, RebuildResponse):
+                task.result.root_password = response.root_password
+                response = response.action
+            task.result.actions.append(response)
+
+            if response.status == Action.STATUS_RUNNING:
+                task.action = response
+                task.polls = 0
+                running[response.id] = response
+                return
+            if response.status == Action.STATUS_ERROR:
+                finish(task, ActionFailedException(action=response))
+                return
+        finish(task)
+
+    def can_start(server: BoundServer) -> bool:
+        if (
+            server.placement_group is None
+            or max_unavailable_per_placement_group is None
+        ):
+            return True
+        return (
+            unavailable[server.placement_group.id] < max_unavailable_per_placement_group
+        )
+
+    def check_off(tasks: list[_RolloutTask]) -> None:
+        """
+        Continues the tasks whose server is off, and powers off the servers whose
+        shutdown timed out, with a single list request for all the tasks.
+
+        A failed list request is retried on the next poll, until the shutdown of
+        the server timed out, then the task fails with the error.
+        """
+        off: set[int | None] = set()
+        error: Exception | None = None
+        try:
+            off = {
+                o.id
+                for o in client.get_all(
+                    label_selector=label_selector, status=[Server.STATUS_OFF]
+                )
+            }
+        except Exception as exception:  # pylint: disable=broad-exception-caught
+            error = exception
+
+        now = time.monotonic()
+        for task in tasks:
+            assert task.deadline is not None
+            if task.result.server.id in off:
+                task.deadline = None
+                advance(task)
+            elif now >= task.deadline:
+                task.deadline = None
+                if error is not None:
+                    finish(task, error)
+                    continue
+                task.steps.appendleft(client.power_off)
+                advance(task)
+
+    polls = 0
+    while True:
+        # Start as many servers as the budgets allow
+        while queue and len(in_progress) < parallelism and failures <= max_failures:
+            server = next((o for o in queue if can_start(o)), None)
+            if server is None:
+                break
+            queue.remove(server)
+
+            steps: list[_Step] = []
+            if server.status != Server.STATUS_OFF:
+                if shutdown_timeout is None:
+                    steps.append(client.power_off)
+                else:
+                    steps.extend((client.shutdown, _wait_for_off))
+            steps.append(operation)
+            if server.status != Server.STATUS_OFF:
+                steps.append(client.power_on)
+
+            task = _RolloutTask(ServerRolloutResult(server), steps)
+            results[server.id] = task.result  # type: ignore[index]
+            in_progress.append(task)
+            unavailable[task.placement_group] += 1
+            advance(task)
+
+        if not in_progress:
+            break
+
+        polls += 1
+        time.sleep(poll_interval_func(polls))
+        try:
+            actions_client._poll_running(running)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Retried on the next poll, the Actions still time out after
+            # ``max_retries`` polls
+            pass
+
+        waiting = [o for o in in_progress if o.deadline is not None]
+        if waiting:
+            check_off(waiting)
+
+        for task in list(in_progress):
+            if task.deadline is not None or task in waiting:
+                continue
+            action = task.action
+            assert action is not None
+            if action.id in running:
+                task.polls += 1
+                if task.polls >= max_retries:
+                    del running[action.id]
+                    finish(task, ActionTimeoutException(action=action))
+            elif action.status == Action.STATUS_ERROR:
+                finish(task, ActionFailedException(action=action))
+            else:
+                advance(task)
+
+    return [
+        (
+            results[o.id]
+            if o.id in results
+            else ServerRolloutResult(o, error=ServerNotStartedException(o))
+        )
+        for o in bound_servers
+    ]
@@ -18,14 +18,21 @@ from .domain import (
     DeleteStorageBoxSubaccountResponse,
     StorageBox,
     StorageBoxAccessSettings,
+    StorageBoxFolder,
     StorageBoxFoldersResponse,
+    StorageBoxFolderTree,
     StorageBoxSnapshot,
     StorageBoxSnapshotPlan,
+    StorageBoxSnapshotRetentionPlan,
+    StorageBoxSnapshotRetentionPolicy,
+    StorageBoxSnapshotRetentionResult,
     StorageBoxSnapshotStats,
     StorageBoxStats,
     StorageBoxStatus,
     StorageBoxSubaccount,
     StorageBoxSubaccountAccessSettings,
+    StorageBoxSubaccountProvisioningResult,
+    StorageBoxSubaccountSpec,
 )
 
 __all__ = [
@@ -42,14 +49,21 @@ __all__ = [
     "StorageBoxAccessSettings",
     "StorageBoxesClient",
     "StorageBoxesPageResult",
+    "StorageBoxFolder",
     "StorageBoxFoldersResponse",
+    "StorageBoxFolderTree",
     "StorageBoxSnapshot",
     "StorageBoxSnapshotPlan",
+    "StorageBoxSnapshotRetentionPlan",
+    "StorageBoxSnapshotRetentionPolicy",
+    "StorageBoxSnapshotRetentionResult",
     "StorageBoxSnapshotsPageResult",
     "StorageBoxSnapshotStats",
     "StorageBoxStats",
     "StorageBoxStatus",
     "StorageBoxSubaccount",
     "StorageBoxSubaccountAccessSettings",
+    "StorageBoxSubaccountProvisioningResult",
+    "StorageBoxSubaccountSpec",
     "StorageBoxSubaccountsPageResult",
 ]
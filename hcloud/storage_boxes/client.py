@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import TYPE_CHECKING, Any, NamedTuple
 
+import requests
+
+from .._exceptions import APIException
 from ..actions import (
     ActionSort,
     ActionsPageResult,
@@ -23,13 +28,20 @@ from .domain import (
     DeleteStorageBoxSubaccountResponse,
     StorageBox,
     StorageBoxAccessSettings,
+    StorageBoxFolder,
     StorageBoxFoldersResponse,
+    StorageBoxFolderTree,
     StorageBoxSnapshot,
     StorageBoxSnapshotPlan,
+    StorageBoxSnapshotRetentionPlan,
+    StorageBoxSnapshotRetentionPolicy,
+    StorageBoxSnapshotRetentionResult,
     StorageBoxSnapshotStats,
     StorageBoxStats,
     StorageBoxSubaccount,
     StorageBoxSubaccountAccessSettings,
+    StorageBoxSubaccountProvisioningResult,
+    StorageBoxSubaccountSpec,
 )
 
 if TYPE_CHECKING:
@@ -174,6 +186,52 @@ class BoundStorageBox(BoundModelBase[StorageBox], StorageBox):
             path=path,
         )
 
+    def walk_folders(
+        self,
+        *,
+        path: str | None = None,
+        max_depth: int | None = None,
+        concurrency: int = 5,
+    ) -> Iterator[StorageBoxFolder]:
+        """
+        Walks the (sub)folders contained in a Storage Box, breadth-first and concurrently.
+
+        See :meth:`StorageBoxesClient.walk_folders`.
+
+        :param path: Relative path to start the walk from.
+        :param max_depth: Maximum depth of the walk, relative to the start path.
+        :param concurrency: Maximum number of folders listed concurrently.
+        """
+        return self._client.walk_folders(
+            self,
+            path=path,
+            max_depth=max_depth,
+            concurrency=concurrency,
+        )
+
+    def get_folder_tree(
+        self,
+        *,
+        path: str | None = None,
+        max_depth: int | None = None,
+        concurrency: int = 5,
+    ) -> StorageBoxFolderTree:
+        """
+        Walks the (sub)folders contained in a Storage Box, and returns them as a tree.
+
+        See :meth:`StorageBoxesClient.get_folder_tree`.
+
+        :param path: Relative path to start the walk from.
+        :param max_depth: Maximum depth of the walk, relative to the start path.
+        :param concurrency: Maximum number of folders listed concurrently.
+        """
+        return self._client.get_folder_tree(
+            self,
+            path=path,
+            max_depth=max_depth,
+            concurrency=concurrency,
+        )
+
     def change_protection(
         self,
         *,
@@ -509,6 +567,26 @@ class BoundStorageBox(BoundModelBase[StorageBox], StorageBox):
             labels=labels,
         )
 
+    def provision_subaccounts(
+        self,
+        specs: list[StorageBoxSubaccountSpec],
+        *,
+        concurrency: int = 5,
+    ) -> list[StorageBoxSubaccountProvisioningResult]:
+        """
+        Provisions many Subaccounts for the Storage Box, concurrently.
+
+        See :meth:`StorageBoxesClient.provision_subaccounts`.
+
+        :param specs: Specs of the Subaccounts to provision.
+        :param concurrency: Maximum number of Subaccounts provisioned concurrently.
+        """
+        return self._client.provision_subaccounts(
+            self,
+            specs=specs,
+            concurrency=concurrency,
+        )
+
 
 class BoundStorageBoxSnapshot(BoundModelBase[StorageBoxSnapshot], StorageBoxSnapshot):
     _client: StorageBoxesClient
@@ -940,6 +1018,92 @@ class StorageBoxesClient(
 
         return StorageBoxFoldersResponse(folders=response["folders"])
 
+    def _list_folder(
+        self,
+        storage_box: BoundStorageBox | StorageBox,
+        path: str,
+        depth: int,
+    ) -> StorageBoxFolder:
+        # Transient errors are already retried by the client request
+        try:
+            response = self.get_folders(storage_box, path=path or None)
+        except (APIException, requests.exceptions.RequestException) as exception:
+            return StorageBoxFolder(path, depth, [], error=exception)
+        return StorageBoxFolder(path, depth, response.folders)
+
+    def walk_folders(
+        self,
+        storage_box: BoundStorageBox | StorageBox,
+        *,
+        path: str | None = None,
+        max_depth: int | None = None,
+        concurrency: int = 5,
+    ) -> Iterator[StorageBoxFolder]:
+        """
+        Walks the (sub)folders contained in a Storage Box, breadth-first and concurrently.
+
+        Each folder is yielded as soon as it has been listed, including the start
+        folder. Transient errors are retried like any other request, a folder that still
+        cannot be listed is yielded with its ``error`` set, and the walk continues with
+        the other folders.
+
+        See https://docs.hetzner.cloud/reference/hetzner#storage-boxes-list-folders-of-a-storage-box
+
+        :param storage_box: Storage Box to walk the folders from.
+        :param path: Relative path to start the walk from.
+        :param max_depth: Maximum depth of the walk, relative to the start path.
+        :param concurrency: Maximum number of folders listed concurrently.
+        """
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            pending: set[Future[StorageBoxFolder]] = {
+                executor.submit(self._list_folder, storage_box, path or "", 0)
+            }
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    folder = future.result()
+                    if max_depth is None or folder.depth < max_depth:
+                        for name in folder.folders:
+                            pending.add(
+                                executor.submit(
+                                    self._list_folder,
+                                    storage_box,
+                                    folder.join(name),
+                                    folder.depth + 1,
+                                )
+                            )
+                    yield folder
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_folder_tree(
+        self,
+        storage_box: BoundStorageBox | StorageBox,
+        *,
+        path: str | None = None,
+        max_depth: int | None = None,
+        concurrency: int = 5,
+    ) -> StorageBoxFolderTree:
+        """
+        Walks the (sub)folders contained in a Storage Box, and returns them as a tree.
+
+        See :meth:`walk_folders`.
+
+        :param storage_box: Storage Box to walk the folders from.
+        :param path: Relative path to start the walk from.
+        :param max_depth: Maximum depth of the walk, relative to the start path.
+        :param concurrency: Maximum number of folders listed concurrently.
+        """
+        return StorageBoxFolderTree(
+            self.walk_folders(
+                storage_box,
+                path=path,
+                max_depth=max_depth,
+                concurrency=concurrency,
+            )
+        )
+
     def get_actions_list(
         self,
         storage_box: StorageBox | BoundStorageBox,
@@ -1349,6 +1513,83 @@ class StorageBoxesClient(
             action=BoundAction(self._parent.actions, response["action"]),
         )
 
+    def plan_snapshot_retention(
+        self,
+        storage_boxes: list[BoundStorageBox | StorageBox],
+        policy: StorageBoxSnapshotRetentionPolicy,
+        *,
+        concurrency: int = 5,
+    ) -> list[StorageBoxSnapshotRetentionPlan]:
+        """
+        Computes the Snapshots to keep and to delete for each Storage Box, based on a
+        retention policy.
+
+        The Snapshots of each Storage Box are listed once, concurrently.
+
+        :param storage_boxes: Storage Boxes to plan the retention for.
+        :param policy: Retention policy to apply.
+        :param concurrency: Maximum number of Storage Boxes listed concurrently.
+        """
+
+        def plan(
+            storage_box: BoundStorageBox | StorageBox,
+        ) -> StorageBoxSnapshotRetentionPlan:
+            snapshots = self.get_snapshot_all(
+                storage_box,
+                is_automatic=policy.is_automatic,
+                label_selector=policy.label_selector,
+            )
+            keep, delete = policy.select(snapshots)
+            return StorageBoxSnapshotRetentionPlan(
+                storage_box, keep=keep, delete=delete
+            )
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(plan, storage_boxes))
+
+    def apply_snapshot_retention(
+        self,
+        plans: list[StorageBoxSnapshotRetentionPlan],
+        *,
+        dry_run: bool = False,
+        concurrency: int = 5,
+    ) -> list[StorageBoxSnapshotRetentionResult]:
+        """
+        Deletes the Snapshots planned for deletion, concurrently, and waits for all the
+        deletion Actions.
+
+        A failed deletion does not interrupt the others, its error is reported in the
+        result.
+
+        :param plans: Retention plans to apply, see :meth:`plan_snapshot_retention`.
+        :param dry_run: Only return the Snapshots that would be deleted.
+        :param concurrency: Maximum number of Snapshots deleted concurrently.
+        """
+        results = [
+            StorageBoxSnapshotRetentionResult(snapshot)
+            for plan in plans
+            for snapshot in plan.delete
+        ]
+        if dry_run or not results:
+            return results
+
+        def delete(result: StorageBoxSnapshotRetentionResult) -> None:
+            try:
+                result.action = self.delete_snapshot(result.snapshot).action
+            except APIException as exception:
+                result.error = exception
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(delete, results))
+
+        actions = [o.action for o in results if o.action is not None]
+        errors = self.actions.wait_for_all(actions)
+        for result in results:
+            if result.action is not None:
+                result.error = errors.get(result.action.id)
+
+        return results
+
     # Subaccounts
     ###########################################################################
 
@@ -1670,3 +1911,112 @@ class StorageBoxesClient(
             json=data,
         )
         return BoundAction(self._parent.actions, response["action"])
+
+    def _provision_subaccount(
+        self,
+        storage_box: StorageBox | BoundStorageBox,
+        result: StorageBoxSubaccountProvisioningResult,
+    ) -> None:
+        spec = result.spec
+
+        subaccount = None
+        if spec.username is not None:
+            subaccount = self.get_subaccount_by_username(storage_box, spec.username)
+        if subaccount is None and spec.name is not None:
+            subaccount = self.get_subaccount_by_name(storage_box, spec.name)
+
+        if subaccount is None:
+            if spec.name is None:
+                # The username is assigned by the API, a new Subaccount would never
+                # match the spec.
+                result.error = ValueError(
+                    f"subaccount with username {spec.username!r} not found"
+                )
+                return
+
+            response = self.create_subaccount(
+                storage_box,
+                name=spec.name,
+                home_directory=spec.home_directory,
+                password=spec.password,
+                access_settings=spec.access_settings,
+                description=spec.description,
+                labels=spec.labels,
+            )
+            result.subaccount = response.subaccount
+            result.created = True
+            result.actions.append(response.action)
+            return
+
+        result.subaccount = subaccount
+
+        # Converge the existing Subaccount towards the spec.
+        if subaccount.home_directory != spec.home_directory:
+            result.actions.append(
+                self.change_subaccount_home_directory(subaccount, spec.home_directory)
+            )
+
+        if spec.access_settings is not None:
+            current = subaccount.access_settings
+            wanted = spec.access_settings.to_payload()
+            if current is None or any(
+                getattr(current, key) != value for key, value in wanted.items()
+            ):
+                result.actions.append(
+                    self.update_subaccount_access_settings(
+                        subaccount, spec.access_settings
+                    )
+                )
+
+    def provision_subaccounts(
+        self,
+        storage_box: StorageBox | BoundStorageBox,
+        specs: list[StorageBoxSubaccountSpec],
+        *,
+        concurrency: int = 5,
+    ) -> list[StorageBoxSubaccountProvisioningResult]:
+        """
+        Provisions many Subaccounts for a Storage Box, concurrently.
+
+        Each Subaccount is first looked up by its username, then by its name. Missing
+        Subaccounts are created with their name, home directory and access settings,
+        existing Subaccounts have their home directory and access settings updated if
+        they differ from the spec. All the resulting Actions are then waited for
+        together.
+
+        As the usernames are assigned by the API, a spec without name whose username
+        is not found fails instead of creating a Subaccount.
+
+        A failed Subaccount does not interrupt the others, its error is reported in the
+        result. Provisioning the same specs again resumes an interrupted provisioning.
+
+        :param storage_box: Storage Box to provision the Subaccounts for.
+        :param specs: Specs of the Subaccounts to provision.
+        :param concurrency: Maximum number of Subaccounts provisioned concurrently.
+        :raises: ValueError when a spec has neither a name nor a username
+        """
+        for spec in specs:
+            if spec.name is None and spec.username is None:
+                raise ValueError(f"{spec!r} must have a name or a username")
+
+        results = [StorageBoxSubaccountProvisioningResult(spec) for spec in specs]
+
+        def provision(result: StorageBoxSubaccountProvisioningResult) -> None:
+            try:
+                self._provision_subaccount(storage_box, result)
+            except APIException as exception:
+                result.error = exception
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(provision, results))
+
+        errors = self.actions.wait_for_all(
+            [action for result in results for action in result.actions]
+        )
+        for result in results:
+            for action in result.actions:
+                if action.id in errors:
+                    result.error = errors[action.id]
+                    break
+
+        return results
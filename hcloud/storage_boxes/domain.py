@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime
 from typing import TYPE_CHECKING, Any, Literal
 
 from ..actions import BoundAction
@@ -22,14 +24,21 @@ __all__ = [
     "CreateStorageBoxResponse",
     "DeleteStorageBoxResponse",
     "StorageBoxFoldersResponse",
+    "StorageBoxFolder",
+    "StorageBoxFolderTree",
     "StorageBoxSnapshot",
     "StorageBoxSnapshotStats",
     "CreateStorageBoxSnapshotResponse",
     "DeleteStorageBoxSnapshotResponse",
+    "StorageBoxSnapshotRetentionPolicy",
+    "StorageBoxSnapshotRetentionPlan",
+    "StorageBoxSnapshotRetentionResult",
     "StorageBoxSubaccount",
     "StorageBoxSubaccountAccessSettings",
     "CreateStorageBoxSubaccountResponse",
     "DeleteStorageBoxSubaccountResponse",
+    "StorageBoxSubaccountSpec",
+    "StorageBoxSubaccountProvisioningResult",
     "StorageBoxStatus",
 ]
 
@@ -265,6 +274,108 @@ class StorageBoxFoldersResponse(BaseDomain):
         self.folders = folders
 
 
+class StorageBoxFolder(BaseDomain):
+    """
+    Storage Box Folder Domain, as returned when walking the folders of a Storage Box.
+
+    :param path: Relative path of the folder, the root folder being an empty string.
+    :param depth: Depth of the folder, relative to the folder the walk started from.
+    :param folders: Names of the (sub)folders contained in the folder.
+    :param error: Error raised while listing the folder, the folders are then empty.
+    """
+
+    __api_properties__ = (
+        "path",
+        "depth",
+        "folders",
+    )
+    __slots__ = (*__api_properties__, "error")
+
+    def __init__(
+        self,
+        path: str,
+        depth: int,
+        folders: list[str],
+        error: Exception | None = None,
+    ):
+        self.path = path
+        self.depth = depth
+        self.folders = folders
+        self.error = error
+
+    def join(self, name: str) -> str:
+        """
+        Return the relative path of a (sub)folder contained in the folder.
+
+        :param name: Name of the (sub)folder.
+        """
+        return f"{self.path}/{name}" if self.path else name
+
+
+class StorageBoxFolderTree:
+    """
+    In-memory index of the folders of a Storage Box, built from the result of
+    :meth:`StorageBoxesClient.walk_folders <hcloud.storage_boxes.client.StorageBoxesClient.walk_folders>`.
+
+    :param folders: Walked folders to add to the tree.
+    """
+
+    def __init__(self, folders: Iterable[StorageBoxFolder] = ()):
+        self._folders: dict[str, StorageBoxFolder] = {}
+        for folder in folders:
+            self.add(folder)
+
+    def __len__(self) -> int:
+        return len(self._folders)
+
+    def __iter__(self) -> Iterator[StorageBoxFolder]:
+        return iter(self._folders.values())
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._folders
+
+    def add(self, folder: StorageBoxFolder) -> None:
+        """
+        Add a walked folder to the tree, replacing any folder with the same path.
+
+        :param folder: Walked folder to add.
+        """
+        self._folders[folder.path] = folder
+
+    def get(self, path: str) -> StorageBoxFolder | None:
+        """
+        Return the walked folder with the given path.
+
+        :param path: Relative path of the folder.
+        """
+        return self._folders.get(path)
+
+    def get_subfolders(self, path: str) -> list[str]:
+        """
+        Return the paths of all the walked folders below the given path.
+
+        :param path: Relative path of the folder, use an empty string for the root folder.
+        """
+        result = []
+        stack = [path]
+        while stack:
+            folder = self._folders.get(stack.pop())
+            if folder is None:
+                continue
+            for name in folder.folders:
+                subpath = folder.join(name)
+                result.append(subpath)
+                stack.append(subpath)
+        return result
+
+    @property
+    def errors(self) -> list[StorageBoxFolder]:
+        """
+        Walked folders that could not be listed.
+        """
+        return [o for o in self._folders.values() if o.error is not None]
+
+
 # Snapshots
 ###############################################################################
 
@@ -362,6 +473,152 @@ class DeleteStorageBoxSnapshotResponse(BaseDomain):
         self.action = action
 
 
+class StorageBoxSnapshotRetentionPolicy(BaseDomain):
+    """
+    Storage Box Snapshot Retention Policy Domain.
+
+    The Snapshots matching the filters are sorted from the newest to the oldest, and a
+    Snapshot is kept as soon as one of the rules selects it. For the time based rules,
+    the newest Snapshot of each day, week or month is kept. The Snapshots not matching
+    the filters are always kept.
+
+    :param keep_last: Number of most recent Snapshots to keep.
+    :param keep_daily: Number of days to keep a Snapshot for.
+    :param keep_weekly: Number of weeks to keep a Snapshot for.
+    :param keep_monthly: Number of months to keep a Snapshot for.
+    :param label_selector: Only apply the policy to the Snapshots matching the label selector.
+    :param is_automatic: Only apply the policy to the Snapshots made (or not) by a Snapshot Plan.
+    """
+
+    __api_properties__ = (
+        "keep_last",
+        "keep_daily",
+        "keep_weekly",
+        "keep_monthly",
+        "label_selector",
+        "is_automatic",
+    )
+    __slots__ = __api_properties__
+
+    def __init__(
+        self,
+        keep_last: int | None = None,
+        keep_daily: int | None = None,
+        keep_weekly: int | None = None,
+        keep_monthly: int | None = None,
+        label_selector: str | None = None,
+        is_automatic: bool | None = None,
+    ):
+        if keep_last is keep_daily is keep_weekly is keep_monthly is None:
+            raise ValueError("at least one keep rule must be set")
+
+        self.keep_last = keep_last
+        self.keep_daily = keep_daily
+        self.keep_weekly = keep_weekly
+        self.keep_monthly = keep_monthly
+        self.label_selector = label_selector
+        self.is_automatic = is_automatic
+
+    def select(
+        self,
+        snapshots: list[BoundStorageBoxSnapshot],
+    ) -> tuple[list[BoundStorageBoxSnapshot], list[BoundStorageBoxSnapshot]]:
+        """
+        Split the given Snapshots in the Snapshots to keep and the Snapshots to delete.
+
+        The Snapshots must already match the filters of the policy.
+
+        :param snapshots: Snapshots to select from.
+        :return: The Snapshots to keep and the Snapshots to delete.
+        """
+        # Snapshots without a creation date are never deleted.
+        undated = [o for o in snapshots if o.created is None]
+        dated = sorted(
+            ((o.created, o) for o in snapshots if o.created is not None),
+            key=lambda o: o[0],
+            reverse=True,
+        )
+        ordered = [o for _, o in dated]
+
+        rules: list[tuple[int | None, Callable[[datetime], object]]] = [
+            (self.keep_daily, lambda o: o.date()),
+            (self.keep_weekly, lambda o: o.isocalendar()[:2]),
+            (self.keep_monthly, lambda o: (o.year, o.month)),
+        ]
+
+        kept_ids = {o.id for o in ordered[: self.keep_last or 0]}
+        for count, bucket_of in rules:
+            if not count:
+                continue
+            buckets: set[object] = set()
+            for created, snapshot in dated:
+                bucket = bucket_of(created)
+                if bucket in buckets:
+                    continue
+                if len(buckets) == count:
+                    break
+                buckets.add(bucket)
+                kept_ids.add(snapshot.id)
+
+        keep = undated + [o for o in ordered if o.id in kept_ids]
+        delete = [o for o in ordered if o.id not in kept_ids]
+        return keep, delete
+
+
+class StorageBoxSnapshotRetentionPlan(BaseDomain):
+    """
+    Storage Box Snapshot Retention Plan Domain.
+
+    :param storage_box: Storage Box the plan applies to.
+    :param keep: Snapshots to keep.
+    :param delete: Snapshots to delete.
+    """
+
+    __api_properties__ = (
+        "storage_box",
+        "keep",
+        "delete",
+    )
+    __slots__ = __api_properties__
+
+    def __init__(
+        self,
+        storage_box: BoundStorageBox | StorageBox,
+        keep: list[BoundStorageBoxSnapshot],
+        delete: list[BoundStorageBoxSnapshot],
+    ):
+        self.storage_box = storage_box
+        self.keep = keep
+        self.delete = delete
+
+
+class StorageBoxSnapshotRetentionResult(BaseDomain):
+    """
+    Storage Box Snapshot Retention Result Domain.
+
+    :param snapshot: Snapshot to delete.
+    :param action: Action of the deletion, None during a dry run or if the deletion failed.
+    :param error: Error raised while deleting the Snapshot.
+    """
+
+    __api_properties__ = (
+        "snapshot",
+        "action",
+        "error",
+    )
+    __slots__ = __api_properties__
+
+    def __init__(
+        self,
+        snapshot: BoundStorageBoxSnapshot,
+        action: BoundAction | None = None,
+        error: Exception | None = None,
+    ):
+        self.snapshot = snapshot
+        self.action = action
+        self.error = error
+
+
 # Subaccounts
 ###############################################################################
 
@@ -489,3 +746,89 @@ class DeleteStorageBoxSubaccountResponse(BaseDomain):
         action: BoundAction,
     ):
         self.action = action
+
+
+class StorageBoxSubaccountSpec(BaseDomain):
+    """
+    Storage Box Subaccount Spec Domain, describes a Subaccount to provision.
+
+    The Subaccount is looked up by its ``username``, then by its ``name``, before
+    being created, so an interrupted provisioning can be resumed. At least one of
+    them is required, and only a spec with a ``name`` can create a Subaccount.
+
+    :param home_directory: Home directory of the Subaccount.
+    :param password: Password of the Subaccount, only used when creating the Subaccount.
+    :param name: Name of the Subaccount.
+    :param username: User name of an existing Subaccount, assigned by the API.
+    :param access_settings: Access settings of the Subaccount.
+    :param description: Description of the Subaccount.
+    :param labels: User-defined labels (key/value pairs) for the Subaccount.
+    """
+
+    __api_properties__ = (
+        "home_directory",
+        "password",
+        "name",
+        "username",
+        "access_settings",
+        "description",
+        "labels",
+    )
+    __slots__ = __api_properties__
+
+    def __init__(
+        self,
+        home_directory: str,
+        password: str,
+        name: str | None = None,
+        username: str | None = None,
+        access_settings: StorageBoxSubaccountAccessSettings | None = None,
+        description: str | None = None,
+        labels: dict[str, str] | None = None,
+    ):
+        self.home_directory = home_directory
+        self.password = password
+        self.name = name
+        self.username = username
+        self.access_settings = access_settings
+        self.description = description
+        self.labels = labels
+
+    def __repr__(self) -> str:
+        # Never leak the password.
+        return f"{self.__class__.__qualname__}(name={self.name!r}, username={self.username!r})"
+
+
+class StorageBoxSubaccountProvisioningResult(BaseDomain):
+    """
+    Storage Box Subaccount Provisioning Result Domain.
+
+    :param spec: Spec of the provisioned Subaccount.
+    :param subaccount: Provisioned Subaccount, None if the provisioning failed before the Subaccount existed.
+    :param created: Whether the Subaccount was created, or already existed.
+    :param actions: Actions triggered to provision the Subaccount.
+    :param error: Error raised while provisioning the Subaccount.
+    """
+
+    __api_properties__ = (
+        "spec",
+        "subaccount",
+        "created",
+        "actions",
+        "error",
+    )
+    __slots__ = __api_properties__
+
+    def __init__(
+        self,
+        spec: StorageBoxSubaccountSpec,
+        subaccount: BoundStorageBoxSubaccount | None = None,
+        created: bool = False,
+        actions: list[BoundAction] | None = None,
+        error: Exception | None = None,
+    ):
+        self.spec = spec
+        self.subaccount = subaccount
+        self.created = created
+        self.actions = actions or []
+        self.error = error
@@ -235,6 +235,140 @@ class TestResourceActionsClient:
         assert_bound_action1(actions[0], resource_client._parent.actions)
         assert_bound_action2(actions[1], resource_client._parent.actions)
 
+    def test_wait_for(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: ResourceActionsClient,
+        resource: str,
+        action1_running,
+        action2_running,
+        action1_success,
+        action2_success,
+    ):
+        actions = [
+            BoundAction(resource_client._parent.actions, action1_running),
+            BoundAction(resource_client._parent.actions, action2_running),
+        ]
+        request_mock.side_effect = [
+            {"actions": [action1_success, action2_running]},
+            {"actions": [action2_success]},
+        ]
+
+        resource_client.wait_for(actions)
+
+        assert request_mock.call_args_list == [
+            mock.call(
+                method="GET",
+                url=f"/{resource}/actions",
+                params={"id": [1, 2], "per_page": 2},
+            ),
+            mock.call(
+                method="GET",
+                url=f"/{resource}/actions",
+                params={"id": [2], "per_page": 1},
+            ),
+        ]
+        assert [o.status for o in actions] == ["success", "success"]
+
+    def test_wait_for_with_error(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: ResourceActionsClient,
+        action1_running,
+        action2_running,
+        action1_error,
+    ):
+        actions = [
+            BoundAction(resource_client._parent.actions, action1_running),
+            BoundAction(resource_client._parent.actions, action2_running),
+        ]
+        request_mock.side_effect = [
+            {"actions": [action1_error, action2_running]},
+        ]
+
+        with pytest.raises(ActionFailedException) as exc:
+            resource_client.wait_for(actions)
+
+        assert exc.value.action is actions[0]
+        assert request_mock.call_count == 1
+
+    def test_wait_for_max_retries(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: ResourceActionsClient,
+        action1_running,
+        action2_running,
+        action1_success,
+    ):
+        actions = [
+            BoundAction(resource_client._parent.actions, action1_running),
+            BoundAction(resource_client._parent.actions, action2_running),
+        ]
+        request_mock.side_effect = [
+            {"actions": [action1_success, action2_running]},
+            {"actions": [action2_running]},
+        ]
+
+        with pytest.raises(ActionTimeoutException) as exc:
+            resource_client.wait_for(actions, max_retries=2)
+
+        assert exc.value.action is actions[1]
+        assert request_mock.call_count == 2
+
+    def test_wait_for_all(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: ResourceActionsClient,
+        action1_running,
+        action2_running,
+        action1_error,
+    ):
+        actions = [
+            BoundAction(resource_client._parent.actions, action1_running),
+            BoundAction(resource_client._parent.actions, action2_running),
+        ]
+        request_mock.side_effect = [
+            {"actions": [action1_error, action2_running]},
+            {"actions": [action2_running]},
+        ]
+
+        errors = resource_client.wait_for_all(actions, max_retries=2)
+
+        assert request_mock.call_count == 2
+        assert set(errors) == {1, 2}
+        assert isinstance(errors[1], ActionFailedException)
+        assert isinstance(errors[2], ActionTimeoutException)
+        assert errors[2].action is actions[1]
+
+    def test_wait_for_function(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: ResourceActionsClient,
+        action1_running,
+        action2_running,
+        action1_success,
+        action2_error,
+    ):
+        resource_client.max_per_page = 1
+        actions = [
+            BoundAction(resource_client._parent.actions, action1_running),
+            BoundAction(resource_client._parent.actions, action2_running),
+        ]
+        request_mock.side_effect = [
+            {"actions": [action1_success]},
+            {"actions": [action2_error]},
+        ]
+
+        handle_update = mock.MagicMock()
+        resource_client.wait_for_function(handle_update, actions)
+
+        assert request_mock.call_count == 2
+        assert handle_update.call_args_list == [
+            mock.call(actions[0]),
+            mock.call(actions[1]),
+        ]
+        assert [o.status for o in actions] == ["success", "error"]
+
 
 class TestResourceObjectActionsClient:
     """
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import inspect
+import threading
 import warnings
 from collections.abc import Callable
-from typing import ClassVar, TypedDict
+from typing import Any, ClassVar, TypedDict
 from unittest import mock
 
 import pytest
@@ -137,6 +138,68 @@ def action_list_response(action1_running, action2_running):
     }
 
 
+class RequestRouter:
+    """
+    Side effect of the request mock, returning the responses queued by method and URL,
+    for the concurrent requests that are not sent in a predictable order.
+
+    The responses of a route are returned in order, the last one being repeated. A
+    response may be an exception to raise, or a function called with the keyword
+    arguments of the request.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._routes: dict[tuple[str, str], list[Any]] = {}
+        self._actions: dict[int, list[dict[str, Any]]] = {}
+
+    def add(self, method: str, url: str, *responses: Any) -> None:
+        self._routes.setdefault((method, url), []).extend(responses)
+
+    def add_action(self, id: int, *statuses: str, command: str = "command") -> dict:
+        """
+        Adds an action returning its next status each time it is fetched.
+
+        :return: The action with its first status, e.g. to return it on creation.
+        """
+        self._actions[id] = [
+            {"id": id, "command": command, "status": status} for status in statuses
+        ]
+        self.add("GET", f"/actions/{id}", lambda **_: {"action": self._next(id)})
+        if ("GET", "/actions") not in self._routes:
+            self.add(
+                "GET",
+                "/actions",
+                lambda params, **_: {
+                    "actions": [self._next(id) for id in params["id"]]
+                },
+            )
+        return self._next(id)
+
+    def _next(self, id: int) -> dict[str, Any]:
+        statuses = self._actions[id]
+        return statuses.pop(0) if len(statuses) > 1 else statuses[0]
+
+    def __call__(self, method: str, url: str, **kwargs: Any) -> Any:
+        with self._lock:
+            responses = self._routes.get((method, url))
+            if not responses:
+                raise AssertionError(f"unexpected request {method} {url}")
+            response = responses.pop(0) if len(responses) > 1 else responses[0]
+            if isinstance(response, Exception):
+                raise response
+            if callable(response):
+                return response(**kwargs)
+            return response
+
+
+@pytest.fixture()
+def request_router(request_mock: mock.MagicMock) -> RequestRouter:
+    router = RequestRouter()
+    request_mock.side_effect = router
+    return router
+
+
 def build_kwargs_mock(func: Callable) -> dict[str, mock.Mock]:
     """
     Generate a kwargs dict that may be passed to the provided function for testing purposes.
@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+from unittest import mock
+
 import pytest
 
-from hcloud.exp.zone import format_txt_record, is_txt_record_quoted
+from hcloud.exp.zone import (
+    ZoneIndex,
+    are_txt_records_quoted,
+    format_txt_record,
+    format_txt_records,
+    is_txt_record_quoted,
+    parse_zonefile,
+)
+from hcloud.zones import ZoneRecord, ZoneRRSet
 
 
 @pytest.mark.parametrize(
@@ -35,3 +45,203 @@ SOME_B = "b" * 10
 )
 def test_format_txt_record(value: str, expected: str):
     assert format_txt_record(value) == expected
+
+
+ZONEFILE = """$ORIGIN example.com.
+$TTL 3600
+
+@	IN	SOA	hydrogen.ns.hetzner.com. dns.hetzner.com. (
+		2024010100 86400 10800 3600000 3600 )
+@	IN	NS	hydrogen.ns.hetzner.com.
+@	IN	NS	oxygen.ns.hetzner.com.
+www	300	IN	A	201.42.91.35 ; web server
+	IN	AAAA	2001:db8::1
+*.dev	IN	A	201.42.91.36
+api.dev	IN	A	201.42.91.37
+mail.example.com.	IN	TXT	"v=spf1 -all ; not a comment" "second"
+"""
+
+
+def test_parse_zonefile():
+    rrsets = {(o.name, o.type): o for o in parse_zonefile(ZONEFILE)}
+
+    assert list(rrsets) == [
+        ("@", "SOA"),
+        ("@", "NS"),
+        ("www", "A"),
+        ("www", "AAAA"),
+        ("*.dev", "A"),
+        ("api.dev", "A"),
+        ("mail", "TXT"),
+    ]
+    assert rrsets[("@", "SOA")].records[0].value == (
+        "hydrogen.ns.hetzner.com. dns.hetzner.com. 2024010100 86400 10800 3600000 3600"
+    )
+    assert [o.value for o in rrsets[("@", "NS")].records] == [
+        "hydrogen.ns.hetzner.com.",
+        "oxygen.ns.hetzner.com.",
+    ]
+    assert rrsets[("www", "A")].ttl == 300
+    assert rrsets[("www", "AAAA")].ttl == 3600
+    assert rrsets[("mail", "TXT")].records[0].value == (
+        '"v=spf1 -all ; not a comment" "second"'
+    )
+
+
+def test_parse_zonefile_directives():
+    rrsets = parse_zonefile("""$ORIGIN example.com.
+@	IN	A	201.42.91.35
+$TTL 1h30m
+www	IN	A	201.42.91.36
+$ORIGIN dev.example.com.
+@	1d	IN	A	201.42.91.37
+api	1W2d	IN	A	201.42.91.38
+$ORIGIN other.org.
+ext	60	IN	CNAME	www.example.com.
+""")
+
+    assert [(o.name, o.type, o.ttl) for o in rrsets] == [
+        ("@", "A", None),
+        ("www", "A", 5400),
+        ("dev", "A", 86400),
+        ("api.dev", "A", 777600),
+        ("ext.other.org", "CNAME", 60),
+    ]
+
+
+@pytest.mark.parametrize(
+    "zonefile",
+    [
+        "$TTL 1y\n",
+        "$TTL\n",
+        "www	1h5	IN	A	201.42.91.35\n",
+        "www	300	IN\n",
+        "www	IN	A\n",
+        "www\n",
+    ],
+)
+def test_parse_zonefile_invalid(zonefile: str):
+    with pytest.raises(ValueError):
+        parse_zonefile(zonefile)
+
+
+def test_parse_zonefile_invalid_line():
+    with pytest.raises(ValueError, match="on line 3"):
+        parse_zonefile("$ORIGIN example.com.\n\nwww	300	IN\n")
+
+
+class TestZoneIndex:
+    @pytest.fixture()
+    def index(self) -> ZoneIndex:
+        return ZoneIndex.from_zonefile(ZONEFILE)
+
+    def test_get(self, index: ZoneIndex):
+        assert len(index) == 7
+        assert ("WWW", "A") in index
+        assert index.get("www", "A").records[0].value == "201.42.91.35"
+        assert index.get("www", "MX") is None
+        assert {o.type for o in index.get_by_name("www")} == {"A", "AAAA"}
+        assert index.get_by_name("unknown") == []
+
+    def test_get_by_suffix(self, index: ZoneIndex):
+        assert {o.id for o in index.get_by_suffix("dev")} == {"*.dev/A", "api.dev/A"}
+        assert len(index.get_by_suffix("@")) == 7
+        assert {o.id for o in index.get_by_suffix("@", "A")} == {
+            "www/A",
+            "*.dev/A",
+            "api.dev/A",
+        }
+        assert index.get_by_suffix("unknown") == []
+
+    @pytest.mark.parametrize(
+        ("name", "type", "expected"),
+        [
+            ("www", "A", "www/A"),
+            ("web.dev", "A", "*.dev/A"),
+            ("a.b.dev", "A", "*.dev/A"),
+            ("api.dev", "A", "api.dev/A"),
+            ("web.dev", "AAAA", None),
+            ("unknown", "A", None),
+        ],
+    )
+    def test_resolve(self, index: ZoneIndex, name: str, type: str, expected):
+        result = index.resolve(name, type)
+        assert (result and result.id) == expected
+
+    def test_add_remove(self, index: ZoneIndex):
+        index.add(ZoneRRSet(name="a.b.c", type="A"))
+        assert index.get_by_suffix("b.c")[0].id == "a.b.c/A"
+
+        removed = index.remove("a.b.c", "A")
+        assert [o.id for o in removed] == ["a.b.c/A"]
+        assert index.get_by_suffix("c") == []
+        assert index.remove("a.b.c") == []
+
+        removed = index.remove("www")
+        assert {o.id for o in removed} == {"www/A", "www/AAAA"}
+        assert len(index) == 5
+
+    def test_refresh(self, index: ZoneIndex):
+        zone = mock.MagicMock()
+        zone.get_rrset_all.return_value = [
+            ZoneRRSet(name="www", type="A", records=[ZoneRecord("201.42.91.40")])
+        ]
+        index.zone = zone
+
+        index.refresh(name="www", type="A")
+
+        zone.get_rrset_all.assert_called_with(name="www", type=["A"])
+        assert index.get("www", "A").records[0].value == "201.42.91.40"
+        assert index.get("www", "AAAA") is not None
+
+        index.refresh()
+
+        zone.get_rrset_all.assert_called_with(name=None, type=None)
+        assert len(index) == 1
+
+    def test_refresh_without_zone(self, index: ZoneIndex):
+        with pytest.raises(ValueError):
+            index.refresh()
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("hello world", False),
+        ('"hello world', False),
+        ('"hello world"', True),
+        ('"hello" "world"', True),
+        ('"hello \\"world\\""', True),
+        ('"hello "world""', False),
+        ('"hello world\\"', False),
+        (f'"{MANY_A}"', True),
+        (f'"{MANY_A}{SOME_B}"', False),
+    ],
+)
+def test_are_txt_records_quoted(value: str, expected: bool):
+    assert are_txt_records_quoted([value]) == [expected]
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("", ""),
+        ('""', '""'),
+        ("hello world", '"hello world"'),
+        ("hello\nworld", '"hello\nworld"'),
+        ('hello "world"', '"hello \\"world\\""'),
+        ('hello "world', '"hello \\"world"'),
+        ('hello \\"world\\"', '"hello \\"world\\""'),
+        ("hello\\", '"hello\\\\"'),
+        ('"hello" "world"', '"hello" "world"'),
+        (MANY_A + SOME_B, f'"{MANY_A}" "{SOME_B}"'),
+        ("a" * 254 + '"' + SOME_B, f'"{"a" * 254}\\"" "{SOME_B}"'),
+    ],
+)
+def test_format_txt_records(value: str, expected: str):
+    assert format_txt_records([value]) == [expected]
+
+
+def test_format_txt_records_many():
+    values = ["hello world", 'hello "world"', MANY_A + SOME_B]
+    assert format_txt_records(values) == [format_txt_record(v) for v in values]
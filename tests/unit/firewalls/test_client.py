@@ -4,7 +4,8 @@ from unittest import mock
 
 import pytest
 
-from hcloud import Client
+from hcloud import APIException, Client
+from hcloud.actions import ActionFailedException
 from hcloud.firewalls import (
     BoundFirewall,
     Firewall,
@@ -25,6 +26,9 @@ class TestBoundFirewall(BoundModelTestCase):
         BoundFirewall.apply_to_resources,
         BoundFirewall.remove_from_resources,
         BoundFirewall.set_rules,
+        BoundFirewall.sync_rules,
+        BoundFirewall.apply_to_many_resources,
+        BoundFirewall.remove_from_many_resources,
     ]
 
     @pytest.fixture()
@@ -355,6 +359,90 @@ class TestFirewallsClient:
         assert actions[0].id == 13
         assert actions[0].progress == 100
 
+    def test_sync_rules(
+        self,
+        request_mock: mock.MagicMock,
+        firewalls_client: FirewallsClient,
+        firewall_response,
+        response_set_rules,
+    ):
+        firewall = BoundFirewall(firewalls_client, firewall_response["firewall"])
+        request_mock.return_value = response_set_rules
+
+        actions = firewalls_client.sync_rules(
+            firewall,
+            [
+                FirewallRule(
+                    direction=FirewallRule.DIRECTION_IN,
+                    protocol=FirewallRule.PROTOCOL_TCP,
+                    port="80",
+                    source_ips=["10.0.0.0/25", "10.0.0.128/25"],
+                ),
+                FirewallRule(
+                    direction=FirewallRule.DIRECTION_IN,
+                    protocol=FirewallRule.PROTOCOL_TCP,
+                    port="81-90",
+                    source_ips=["10.0.0.0/24"],
+                ),
+            ],
+        )
+
+        request_mock.assert_called_with(
+            method="POST",
+            url="/firewalls/38/actions/set_rules",
+            json={
+                "rules": [
+                    {
+                        "direction": "in",
+                        "protocol": "tcp",
+                        "port": "80-90",
+                        "source_ips": ["10.0.0.0/24"],
+                    },
+                ]
+            },
+        )
+
+        assert actions[0].id == 13
+
+    def test_sync_rules_unchanged(
+        self,
+        request_mock: mock.MagicMock,
+        firewalls_client: FirewallsClient,
+        firewall_response,
+    ):
+        firewall = BoundFirewall(firewalls_client, firewall_response["firewall"])
+
+        actions = firewalls_client.sync_rules(
+            firewall,
+            [
+                FirewallRule(
+                    direction=FirewallRule.DIRECTION_OUT,
+                    protocol=FirewallRule.PROTOCOL_TCP,
+                    port="80",
+                    destination_ips=[
+                        "FF21:1EAC:9A3B:EE58:5CA:990C:8BC9:C03B",
+                        "28.239.14.0/24",
+                        "28.239.13.1",
+                    ],
+                    description="allow http out",
+                ),
+                FirewallRule(
+                    direction=FirewallRule.DIRECTION_IN,
+                    protocol=FirewallRule.PROTOCOL_TCP,
+                    port="80",
+                    source_ips=[
+                        "28.239.13.1/32",
+                        "28.239.14.0/24",
+                        "ff21:1eac:9a3b:ee58:5ca:990c:8bc9:c03b/128",
+                    ],
+                    description="allow http in",
+                ),
+            ],
+        )
+
+        request_mock.assert_not_called()
+        assert actions == []
+
     @pytest.mark.parametrize(
         "firewall", [Firewall(id=1), BoundFirewall(mock.MagicMock(), dict(id=1))]
     )
@@ -424,3 +512,135 @@ class TestFirewallsClient:
 
         assert actions[0].id == 13
         assert actions[0].progress == 100
+
+    def test_apply_to_many_resources(
+        self,
+        request_mock: mock.MagicMock,
+        firewalls_client: FirewallsClient,
+        firewall_response,
+        action1_running,
+        action1_success,
+    ):
+        firewall_response["firewall"]["applied_to"][1]["applied_to_resources"] = [
+            {"type": "server", "server": {"id": 43}}
+        ]
+        firewall = BoundFirewall(firewalls_client, firewall_response["firewall"])
+        request_mock.side_effect = [
+            {"actions": [action1_running]},
+            APIException(code="invalid_input", message="Invalid", details=None),
+            {"actions": [action1_success]},
+        ]
+
+        results = firewalls_client.apply_to_many_resources(
+            firewall,
+            [
+                # Already applied
+                FirewallResource(type="server", server=Server(id=42)),
+                # Covered by the label selector
+                FirewallResource(type="server", server=Server(id=43)),
+                FirewallResource(type="server", server=Server(id=44)),
+                FirewallResource(type="server", server=Server(id=44)),
+                FirewallResource(type="server", server=Server(id=45)),
+                FirewallResource(type="server", server=Server(id=46)),
+                FirewallResource(
+                    type="label_selector",
+                    label_selector=FirewallResourceLabelSelector(selector="a=b"),
+                ),
+            ],
+            chunk_size=2,
+            concurrency=1,
+        )
+
+        assert request_mock.call_args_list == [
+            mock.call(
+                url="/firewalls/38/actions/apply_to_resources",
+                method="POST",
+                json={
+                    "apply_to": [
+                        {"type": "server", "server": {"id": 44}},
+                        {"type": "server", "server": {"id": 45}},
+                    ]
+                },
+            ),
+            mock.call(
+                url="/firewalls/38/actions/apply_to_resources",
+                method="POST",
+                json={
+                    "apply_to": [
+                        {"type": "server", "server": {"id": 46}},
+                        {
+                            "type": "label_selector",
+                            "label_selector": {"selector": "a=b"},
+                        },
+                    ]
+                },
+            ),
+            mock.call(
+                method="GET",
+                url="/firewalls/actions",
+                params={"id": [1], "per_page": 1},
+            ),
+        ]
+        assert len(results) == 2
+        assert results[0].actions[0].status == "success"
+        assert results[0].error is None
+        assert results[1].actions == []
+        assert results[1].error.code == "invalid_input"
+
+    def test_remove_from_many_resources(
+        self,
+        request_mock: mock.MagicMock,
+        firewalls_client: FirewallsClient,
+        firewall_response,
+        action1_running,
+        action1_success,
+        action2_running,
+        action2_error,
+    ):
+        firewall_response["firewall"]["applied_to"][1]["applied_to_resources"] = [
+            {"type": "server", "server": {"id": 43}}
+        ]
+        firewall = BoundFirewall(firewalls_client, firewall_response["firewall"])
+        request_mock.side_effect = [
+            {"actions": [action1_running, action2_running]},
+            {"actions": [action1_success, action2_error]},
+        ]
+
+        results = firewalls_client.remove_from_many_resources(
+            firewall,
+            [
+                FirewallResource(type="server", server=Server(id=42)),
+                # Only covered by the label selector
+                FirewallResource(type="server", server=Server(id=43)),
+                # Not applied
+                FirewallResource(type="server", server=Server(id=99)),
+                FirewallResource(
+                    type="label_selector",
+                    label_selector=FirewallResourceLabelSelector(selector="key==value"),
+                ),
+            ],
+        )
+
+        assert request_mock.call_args_list == [
+            mock.call(
+                url="/firewalls/38/actions/remove_from_resources",
+                method="POST",
+                json={
+                    "remove_from": [
+                        {"type": "server", "server": {"id": 42}},
+                        {
+                            "type": "label_selector",
+                            "label_selector": {"selector": "key==value"},
+                        },
+                    ]
+                },
+            ),
+            mock.call(
+                method="GET",
+                url="/firewalls/actions",
+                params={"id": [1, 2], "per_page": 2},
+            ),
+        ]
+        assert len(results) == 1
+        assert isinstance(results[0].error, ActionFailedException)
+        assert results[0].error.action.id == 2
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import pytest
+
+from hcloud import Client
+from hcloud.firewalls import BoundFirewall, FirewallEvaluator
+from hcloud.servers import Server
+
+
+@pytest.fixture()
+def evaluator(client: Client):
+    firewalls = [
+        {
+            "id": 1,
+            "rules": [
+                {
+                    "direction": "in",
+                    "protocol": "tcp",
+                    "port": "80",
+                    "source_ips": ["10.0.0.0/16", "2001:db8::/32"],
+                    "destination_ips": [],
+                    "description": None,
+                },
+                {
+                    "direction": "in",
+                    "protocol": "tcp",
+                    "port": "8000-8999",
+                    "source_ips": ["10.0.1.0/24"],
+                    "destination_ips": [],
+                    "description": None,
+                },
+                {
+                    "direction": "in",
+                    "protocol": "icmp",
+                    "port": None,
+                    "source_ips": ["0.0.0.0/0"],
+                    "destination_ips": [],
+                    "description": None,
+                },
+            ],
+            "applied_to": [
+                {"type": "server", "server": {"id": 42}},
+                {
+                    "type": "label_selector",
+                    "label_selector": {"selector": "env=prod"},
+                    "applied_to_resources": [
+                        {"type": "server", "server": {"id": 43}},
+                    ],
+                },
+            ],
+        },
+        {
+            "id": 2,
+            "rules": [
+                {
+                    "direction": "in",
+                    "protocol": "tcp",
+                    "port": "22",
+                    "source_ips": ["192.168.0.1/32"],
+                    "destination_ips": [],
+                    "description": None,
+                },
+                {
+                    "direction": "out",
+                    "protocol": "udp",
+                    "port": "53",
+                    "source_ips": [],
+                    "destination_ips": ["1.1.1.1/32"],
+                    "description": None,
+                },
+            ],
+            "applied_to": [
+                {"type": "server", "server": {"id": 43}},
+            ],
+        },
+    ]
+    return FirewallEvaluator(
+        [BoundFirewall(client.firewalls, data) for data in firewalls]
+    )
+
+
+@pytest.mark.parametrize(
+    ("server", "direction", "protocol", "ip", "port", "expected"),
+    [
+        # No Firewall applied
+        (44, "in", "tcp", "1.2.3.4", 22, True),
+        (Server(id=44), "out", "udp", "1.2.3.4", 53, True),
+        # Server target
+        (42, "in", "tcp", "10.0.5.1", 80, True),
+        (42, "in", "tcp", "10.1.0.1", 80, False),
+        (42, "in", "tcp", "10.0.5.1", 81, False),
+        (42, "in", "tcp", "10.0.1.1", 8500, True),
+        (42, "in", "tcp", "10.0.2.1", 8500, False),
+        (42, "in", "tcp", "2001:db8::1", 80, True),
+        (42, "in", "tcp", "2001:db9::1", 80, False),
+        (42, "in", "udp", "10.0.5.1", 80, False),
+        (42, "in", "icmp", "8.8.8.8", None, True),
+        (42, "in", "tcp", "192.168.0.1", 22, False),
+        # No outbound rules
+        (42, "out", "tcp", "8.8.8.8", 443, True),
+        # Label selector target, combined with a server target
+        (43, "in", "tcp", "10.0.5.1", 80, True),
+        (43, "in", "tcp", "192.168.0.1", 22, True),
+        (43, "out", "udp", "1.1.1.1", 53, True),
+        (43, "out", "udp", "8.8.8.8", 53, False),
+        (43, "out", "tcp", "1.1.1.1", 443, False),
+    ],
+)
+def test_is_allowed(evaluator, server, direction, protocol, ip, port, expected):
+    assert evaluator.is_allowed(server, direction, protocol, ip, port) is expected
+
+
+@pytest.mark.parametrize("protocol", ["tcp", "udp"])
+def test_is_allowed_without_port(evaluator, protocol):
+    with pytest.raises(ValueError):
+        evaluator.is_allowed(42, "in", protocol, "10.0.5.1")
+
+
+def test_is_protected(evaluator):
+    assert evaluator.is_protected(42)
+    assert evaluator.is_protected(Server(id=43))
+    assert not evaluator.is_protected(44)
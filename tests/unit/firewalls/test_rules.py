@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import pytest
+
+from hcloud.firewalls import FirewallRule, compile_firewall_rules
+
+
+def rule(port: str | None = "80", ips: list[str] | None = None, **kwargs):
+    return FirewallRule(
+        direction=kwargs.pop("direction", FirewallRule.DIRECTION_IN),
+        protocol=kwargs.pop("protocol", FirewallRule.PROTOCOL_TCP),
+        port=port,
+        source_ips=ips if ips is not None else ["0.0.0.0/0"],
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize(
+    ("rules", "expected"),
+    [
+        pytest.param([], [], id="empty"),
+        pytest.param(
+            [rule(ips=["10.0.0.1", "10.0.0.0/31", "2001:DB8::1/64"])],
+            [rule(ips=["10.0.0.0/31", "2001:db8::/64"])],
+            id="normalize",
+        ),
+        pytest.param(
+            [rule(ips=["10.0.0.0/25"]), rule(ips=["10.0.0.128/25", "10.0.0.3/32"])],
+            [rule(ips=["10.0.0.0/24"])],
+            id="merge-ips",
+        ),
+        pytest.param(
+            [rule("80"), rule("81-85"), rule("84-90"), rule("443")],
+            [rule("80-90"), rule("443")],
+            id="merge-ports",
+        ),
+        pytest.param(
+            [rule("22"), rule("any")],
+            [rule("any")],
+            id="merge-ports-any",
+        ),
+        pytest.param(
+            [
+                rule("80", ["10.0.0.0/25"]),
+                rule("81", ["10.0.0.0/25"]),
+                rule("80-81", ["10.0.0.128/25"]),
+            ],
+            [rule("80-81", ["10.0.0.0/24"])],
+            id="merge-ports-then-ips",
+        ),
+        pytest.param(
+            [
+                rule(None, protocol=FirewallRule.PROTOCOL_ICMP),
+                rule(None, ["::/0"], protocol=FirewallRule.PROTOCOL_ICMP),
+            ],
+            [rule(None, ["0.0.0.0/0", "::/0"], protocol=FirewallRule.PROTOCOL_ICMP)],
+            id="no-port",
+        ),
+        pytest.param(
+            [rule(ips=["10.0.0.0/24"], description="a"), rule(ips=["10.0.1.0/24"])],
+            [rule(ips=["10.0.0.0/24"], description="a"), rule(ips=["10.0.1.0/24"])],
+            id="keep-descriptions",
+        ),
+        pytest.param(
+            [
+                rule(ips=["10.0.0.0/24"]),
+                FirewallRule(
+                    direction=FirewallRule.DIRECTION_OUT,
+                    protocol=FirewallRule.PROTOCOL_TCP,
+                    port="80",
+                    destination_ips=["10.0.1.0/24"],
+                ),
+            ],
+            [
+                rule(ips=["10.0.0.0/24"]),
+                FirewallRule(
+                    direction=FirewallRule.DIRECTION_OUT,
+                    protocol=FirewallRule.PROTOCOL_TCP,
+                    port="80",
+                    destination_ips=["10.0.1.0/24"],
+                ),
+            ],
+            id="keep-directions",
+        ),
+    ],
+)
+def test_compile_firewall_rules(rules, expected):
+    assert compile_firewall_rules(rules) == expected
+
+
+def test_compile_firewall_rules_split():
+    ips = [f"10.0.{i}.1/32" for i in range(250)]
+
+    result = compile_firewall_rules([rule(ips=ips)])
+
+    assert [len(o.source_ips) for o in result] == [100, 100, 50]
+    assert sorted(ip for o in result for ip in o.source_ips) == sorted(ips)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from hcloud.helpers import LabelIndex, LabelRequirement, LabelSelector
+
+LABELS = [
+    {"env": "prod", "role": "web"},
+    {"env": "prod", "role": "db", "backup": ""},
+    {"env": "staging", "role": "web"},
+    {"role": "web"},
+    {},
+]
+
+
+@pytest.mark.parametrize(
+    "selector,expected",
+    [
+        ("", [0, 1, 2, 3, 4]),
+        ("env=prod", [0, 1]),
+        ("env==prod", [0, 1]),
+        ("env!=prod", [2, 3, 4]),
+        ("env in (prod, staging)", [0, 1, 2]),
+        ("env notin (prod,staging)", [3, 4]),
+        ("env", [0, 1, 2]),
+        ("!env", [3, 4]),
+        ("backup", [1]),
+        ("backup=", [1]),
+        ("env=prod,role=web", [0]),
+        ("role in (web), env notin (staging), !backup", [0, 3]),
+        ("env=prod, env=staging", []),
+        ("unknown=value", []),
+    ],
+)
+def test_label_selector(selector: str, expected: list[int]):
+    label_selector = LabelSelector(selector)
+
+    assert [i for i, o in enumerate(LABELS) if label_selector.matches(o)] == expected
+    assert (
+        LabelIndex(range(len(LABELS)), LABELS.__getitem__).select(selector) == expected
+    )
+
+
+def test_label_selector_requirements():
+    assert LabelSelector(" env == prod , tier in (a, b),!old ").requirements == [
+        LabelRequirement("env", "=", frozenset(["prod"])),
+        LabelRequirement("tier", "in", frozenset(["a", "b"])),
+        LabelRequirement("old", "!exists"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "selector",
+    [
+        "env=prod,",
+        "env in prod",
+        "env in (prod",
+        "env=prod=staging",
+        "env=-prod",
+        "-env",
+        "env = prod staging",
+    ],
+)
+def test_label_selector_invalid(selector: str):
+    with pytest.raises(ValueError):
+        LabelSelector(selector)
+
+
+def test_label_index():
+    rng = random.Random(42)
+
+    class Item:
+        def __init__(self, labels):
+            self.labels = labels
+
+    items = [
+        Item(
+            {
+                key: rng.choice(["a", "b", "c"])
+                for key in ("env", "role", "zone")
+                if rng.random() < 0.7
+            }
+        )
+        for _ in range(500)
+    ]
+    index = LabelIndex(items)
+
+    assert len(index) == 500
+    for selector in (
+        "env=a",
+        "env=a,role!=b",
+        "zone in (a,c),!role",
+        "env notin (a,b),role",
+    ):
+        assert index.select(selector) == LabelSelector(selector).filter(items)
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import pytest
+
+from hcloud import Client
+from hcloud.firewalls import BoundFirewall
+from hcloud.floating_ips import BoundFloatingIP
+from hcloud.inventory import Inventory, InventoryCollection, ResourceGraph
+from hcloud.load_balancers import BoundLoadBalancer
+from hcloud.networks import BoundNetwork
+from hcloud.placement_groups import BoundPlacementGroup
+from hcloud.primary_ips import BoundPrimaryIP
+from hcloud.servers import BoundServer, Server
+from hcloud.volumes import BoundVolume, Volume
+
+
+@pytest.fixture()
+def inventory(client: Client) -> Inventory:
+    servers = [
+        BoundServer(
+            client.servers,
+            {
+                "id": 1,
+                "name": "web-1",
+                "volumes": [10],
+                "private_net": [
+                    {
+                        "network": 20,
+                        "ip": "10.0.0.2",
+                        "alias_ips": [],
+                        "mac_address": "86:00:ff:2a:7d:e1",
+                    }
+                ],
+                "placement_group": {"id": 60, "name": "web", "servers": [1, 2]},
+                "public_net": {
+                    "ipv4": None,
+                    "ipv6": None,
+                    "floating_ips": [40],
+                    "firewalls": [{"id": 30, "status": "applied"}],
+                },
+            },
+        ),
+        BoundServer(client.servers, {"id": 2, "name": "web-2"}),
+        BoundServer(client.servers, {"id": 3, "name": "db"}),
+    ]
+    load_balancers = [
+        BoundLoadBalancer(
+            client.load_balancers,
+            {
+                "id": 50,
+                "name": "web",
+                "targets": [
+                    {
+                        "type": "label_selector",
+                        "label_selector": {"selector": "role=web"},
+                        "use_private_ip": True,
+                        "targets": [
+                            {
+                                "type": "server",
+                                "server": {"id": id},
+                                "use_private_ip": True,
+                            }
+                            for id in (1, 2)
+                        ],
+                    }
+                ],
+                "private_net": [{"network": 20, "ip": "10.0.0.3"}],
+                "services": [],
+            },
+        )
+    ]
+    collections = {name: InventoryCollection() for name in Inventory._fields}
+    collections.update(
+        servers=InventoryCollection(servers),
+        volumes=InventoryCollection(
+            [BoundVolume(client.volumes, {"id": 10, "server": 1})]
+        ),
+        networks=InventoryCollection(
+            [BoundNetwork(client.networks, {"id": 20, "servers": [1]})]
+        ),
+        firewalls=InventoryCollection(
+            [
+                BoundFirewall(
+                    client.firewalls,
+                    {
+                        "id": 31,
+                        "applied_to": [
+                            {
+                                "type": "label_selector",
+                                "label_selector": {"selector": "role=db"},
+                                "applied_to_resources": [
+                                    {"type": "server", "server": {"id": 3}}
+                                ],
+                            }
+                        ],
+                    },
+                )
+            ]
+        ),
+        floating_ips=InventoryCollection(
+            [BoundFloatingIP(client.floating_ips, {"id": 40, "server": 1})]
+        ),
+        primary_ips=InventoryCollection(
+            [
+                BoundPrimaryIP(
+                    client.primary_ips,
+                    {"id": 41, "assignee_type": "server", "assignee_id": 3},
+                )
+            ]
+        ),
+        placement_groups=InventoryCollection(
+            [BoundPlacementGroup(client.placement_groups, {"id": 60, "servers": [2]})]
+        ),
+        load_balancers=InventoryCollection(load_balancers),
+    )
+    return Inventory(**collections)
+
+
+def test_from_inventory(inventory: Inventory):
+    graph = ResourceGraph.from_inventory(inventory)
+
+    assert graph.dependencies(Server(id=1)) == {
+        ("volume", 10),
+        ("network", 20),
+        ("firewall", 30),
+        ("floating_ip", 40),
+        ("placement_group", 60),
+    }
+    assert graph.dependencies(("server", 2)) == {("placement_group", 60)}
+    assert graph.dependencies(("server", 3)) == {
+        ("firewall", 31),
+        ("primary_ip", 41),
+    }
+    assert graph.dependencies(("load_balancer", 50)) == {
+        ("server", 1),
+        ("server", 2),
+        ("network", 20),
+    }
+
+    assert graph.dependents(("network", 20)) == {("server", 1), ("load_balancer", 50)}
+    assert graph.dependents(Volume(id=10)) == {("server", 1)}
+    assert graph.neighbours(("server", 2)) == {
+        ("placement_group", 60),
+        ("load_balancer", 50),
+    }
+    assert ("firewall", 30) in graph
+    assert ("server", 4) not in graph
+    assert graph.dependents(("server", 4)) == frozenset()
+
+
+def test_blast_radius(inventory: Inventory):
+    graph = ResourceGraph.from_inventory(inventory)
+
+    assert graph.blast_radius(("volume", 10)) == {
+        ("server", 1),
+        ("load_balancer", 50),
+    }
+    assert graph.blast_radius(("placement_group", 60)) == {
+        ("server", 1),
+        ("server", 2),
+        ("load_balancer", 50),
+    }
+    assert graph.blast_radius(("load_balancer", 50)) == set()
+
+
+def test_add_edge():
+    graph = ResourceGraph()
+    graph.add_edge(("server", 1), ("server", 2))
+    graph.add_edge(("server", 2), ("server", 1))
+
+    assert len(graph) == 2
+    assert graph.blast_radius(("server", 1)) == {("server", 2)}
+
+    with pytest.raises(ValueError):
+        graph.add(object())
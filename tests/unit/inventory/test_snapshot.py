@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from hcloud import APIException, Client
+from hcloud.inventory import Inventory, InventoryCollection
+from hcloud.servers import BoundServer
+
+from ..conftest import RequestRouter
+
+URLS = {
+    "/servers": "servers",
+    "/volumes": "volumes",
+    "/networks": "networks",
+    "/firewalls": "firewalls",
+    "/load_balancers": "load_balancers",
+    "/floating_ips": "floating_ips",
+    "/primary_ips": "primary_ips",
+    "/certificates": "certificates",
+    "/placement_groups": "placement_groups",
+    "/ssh_keys": "ssh_keys",
+    "/images": "images",
+    "/zones": "zones",
+    "/storage_boxes": "storage_boxes",
+}
+
+
+def pages(key: str, size: int, last_page: bool = True):
+    """
+    Returns the pages of a collection of ``size`` resources, depending on the page
+    requested.
+    """
+
+    def response(params, **_):
+        page, per_page = params["page"], params["per_page"]
+        count = max(1, -(-size // per_page))
+        ids = range((page - 1) * per_page + 1, min(page * per_page, size) + 1)
+        return {
+            key: [{"id": id, "name": f"{key}-{id}"} for id in ids],
+            "meta": {
+                "pagination": {
+                    "page": page,
+                    "per_page": per_page,
+                    "next_page": page + 1 if page < count else None,
+                    "last_page": count if last_page else None,
+                }
+            },
+        }
+
+    return response
+
+
+def test_snapshot(
+    request_mock: mock.MagicMock,
+    request_router: RequestRouter,
+    client: Client,
+):
+    sizes = {"servers": 120, "volumes": 60, "zones": 0}
+    for url, key in URLS.items():
+        # The volumes do not announce their number of pages
+        request_router.add(
+            "GET", url, pages(key, sizes.get(key, 1), last_page=key != "volumes")
+        )
+
+    inventory = client.snapshot(concurrency=1)
+
+    assert isinstance(inventory, Inventory)
+    assert [(name, len(o)) for name, o in inventory.collections()] == [
+        ("servers", 120),
+        ("volumes", 60),
+        ("networks", 1),
+        ("firewalls", 1),
+        ("load_balancers", 1),
+        ("floating_ips", 1),
+        ("primary_ips", 1),
+        ("certificates", 1),
+        ("placement_groups", 1),
+        ("ssh_keys", 1),
+        ("images", 1),
+        ("zones", 0),
+        ("storage_boxes", 1),
+    ]
+    requests = [
+        (URLS[o.kwargs["url"]], o.kwargs["params"]["page"])
+        for o in request_mock.call_args_list
+    ]
+    # The first page of every collection is requested at once
+    assert requests[: len(URLS)] == [(o, 1) for o in URLS.values()]
+    assert sorted(requests[len(URLS) :]) == [
+        ("servers", 2),
+        ("servers", 3),
+        ("volumes", 2),
+    ]
+
+    assert [o.id for o in inventory.servers] == list(range(1, 121))
+    server = inventory.servers.get_by_id(51)
+    assert isinstance(server, BoundServer)
+    assert server.name == "servers-51"
+    assert inventory.servers.get_by_name("servers-51") is server
+    assert 120 in inventory.servers
+    assert inventory.servers.get_by_id(121) is None
+    assert inventory.storage_boxes.get_by_name("storage_boxes-1") is not None
+
+    with pytest.raises(AttributeError):
+        inventory.servers = InventoryCollection()  # type: ignore[misc]
+
+
+def test_snapshot_error(request_mock: mock.MagicMock, client: Client):
+    request_mock.side_effect = APIException(
+        code="forbidden", message="Forbidden", details=None
+    )
+
+    with pytest.raises(APIException):
+        client.snapshot()
+
+
+def test_inventory_collection_select(client: Client):
+    servers = InventoryCollection(
+        BoundServer(client.servers, {"id": id, "name": f"web-{id}", "labels": labels})
+        for id, labels in enumerate(
+            [{"env": "prod"}, {"env": "staging"}, {"env": "prod", "role": "web"}]
+        )
+    )
+
+    assert [o.id for o in servers.select("env=prod")] == [0, 2]
+    assert [o.id for o in servers.select("env=prod,!role")] == [0]
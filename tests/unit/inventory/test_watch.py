@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import threading
+from unittest import mock
+
+import pytest
+import requests
+
+from hcloud import APIException, Client
+from hcloud.inventory import ChangeWatcher, ResourceChange
+from hcloud.servers import BoundServer
+
+from ..conftest import RequestRouter
+
+
+def make_server(id: int, **kwargs):
+    return {"id": id, "name": f"web-{id}", "labels": {}, **kwargs}
+
+
+def make_page(key: str, items: list, page: int = 1, next_page: int | None = None):
+    return {
+        key: items,
+        "meta": {"pagination": {"page": page, "per_page": 50, "next_page": next_page}},
+    }
+
+
+@pytest.fixture()
+def now():
+    with mock.patch("hcloud.inventory.watch.time.monotonic") as monotonic:
+        monotonic.return_value = 1000.0
+        yield monotonic
+
+
+def test_poll(request_mock: mock.MagicMock, now: mock.MagicMock, client: Client):
+    servers = [make_server(id) for id in range(1, 61)]
+    changed = [
+        make_server(1, labels={"role": "web"}),
+        make_server(2),  # unchanged
+        *servers[3:],
+        make_server(61),
+    ]
+    request_mock.side_effect = [
+        make_page("servers", servers[:50], 1, 2),
+        make_page("servers", servers[50:], 2),
+        make_page("servers", changed[:50], 1, 2),
+        make_page("servers", changed[50:], 2),
+    ]
+    watcher = ChangeWatcher(client, ["servers"], label_selector="env=prod")
+    received = []
+    watcher.subscribe(received.append)
+
+    added = watcher.poll()
+    assert len(added) == 60
+    assert {o.type for o in added} == {ResourceChange.TYPE_ADDED}
+    assert isinstance(added[0].resource, BoundServer)
+    assert added[0].resource.name == "web-1"
+    assert received == added
+    assert [o.kwargs["params"] for o in request_mock.call_args_list] == [
+        {"page": 1, "per_page": 50, "label_selector": "env=prod"},
+        {"page": 2, "per_page": 50, "label_selector": "env=prod"},
+    ]
+
+    # Not due yet
+    assert watcher.poll() == []
+    assert request_mock.call_count == 2
+
+    now.return_value += 10
+    changes = watcher.poll()
+    assert [(o.type, o.resource.id, o.fields) for o in changes] == [
+        ("changed", 1, ["labels"]),
+        ("added", 61, []),
+        ("removed", 3, []),
+    ]
+    assert changes[0].resource.labels == {"role": "web"}
+    # A removed resource is the bound model last passed to the callbacks
+    assert changes[2].resource is added[2].resource
+
+
+def test_poll_backoff(
+    request_mock: mock.MagicMock,
+    request_router: RequestRouter,
+    now: mock.MagicMock,
+    client: Client,
+):
+    request_router.add("GET", "/servers", make_page("servers", []))
+    request_router.add(
+        "GET",
+        "/volumes",
+        *[make_page("volumes", [{"id": 1, "name": "data"}])] * 3,
+        make_page("volumes", [{"id": 1, "name": "other"}]),
+    )
+    watcher = ChangeWatcher(client, ["servers", "volumes"], max_interval=25.0)
+
+    watcher.poll()
+    polls = []
+    for _ in range(6):
+        now.return_value += 5
+        request_mock.reset_mock()
+        watcher.poll()
+        polls.append(sorted(o.kwargs["url"] for o in request_mock.call_args_list))
+
+    # The empty servers are idle from the first poll, the volumes from the second
+    assert polls == [
+        [],
+        ["/volumes"],
+        [],
+        ["/servers"],
+        [],
+        ["/volumes"],
+    ]
+
+    now.return_value += 25
+    assert [o.type for o in watcher.poll()] == ["changed"]
+    assert watcher._intervals == {"servers": 25.0, "volumes": 10.0}
+
+
+def test_poll_error(request_mock: mock.MagicMock, now: mock.MagicMock, client: Client):
+    request_mock.side_effect = [
+        make_page("servers", [make_server(1)]),
+        APIException(code="unavailable", message="", details=None),
+        requests.exceptions.ConnectionError(),
+        make_page("servers", [make_server(1)]),
+    ]
+    watcher = ChangeWatcher(client, ["servers"], interval=0.0)
+    watcher.poll()
+
+    assert watcher.poll() == []
+    assert isinstance(watcher.errors["servers"], APIException)
+    assert watcher.poll() == []
+    assert isinstance(watcher.errors["servers"], requests.exceptions.ConnectionError)
+
+    assert watcher.poll() == []
+    assert watcher.errors == {}
+
+
+def test_run_errors(request_mock: mock.MagicMock, client: Client):
+    watcher = ChangeWatcher(client, ["servers"], interval=0.0)
+    errors = []
+
+    class Stop(threading.Event):
+        def wait(self, timeout=None):
+            errors.append(dict(watcher.errors))
+            return super().wait(timeout)
+
+    stop = Stop()
+
+    def callback(change: ResourceChange):
+        if change.type == ResourceChange.TYPE_ADDED:
+            raise ValueError("callback failed")
+        stop.set()
+
+    watcher.subscribe(callback)
+    request_mock.side_effect = [
+        requests.exceptions.ConnectionError(),
+        make_page("servers", [make_server(1)]),
+        make_page("servers", [make_server(1, name="other")]),
+    ]
+    watcher.run(stop)
+
+    assert request_mock.call_count == 3
+    assert [list(o) for o in errors] == [["servers"], [None], []]
+    assert isinstance(errors[0]["servers"], requests.exceptions.ConnectionError)
+    assert isinstance(errors[1][None], ValueError)
+
+
+def test_unsupported_collection(client: Client):
+    with pytest.raises(ValueError):
+        ChangeWatcher(client, ["datacenters"])
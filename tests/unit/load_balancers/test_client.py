@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import copy
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 import pytest
 
-from hcloud import Client
+from hcloud import APIException, Client
 from hcloud.load_balancer_types import LoadBalancerType
 from hcloud.load_balancers import (
     BoundLoadBalancer,
@@ -38,6 +41,7 @@ class TestBoundLoadBalancer(BoundModelTestCase):
         BoundLoadBalancer.delete_service,
         BoundLoadBalancer.add_target,
         BoundLoadBalancer.remove_target,
+        BoundLoadBalancer.sync_targets,
         BoundLoadBalancer.attach_to_network,
         BoundLoadBalancer.detach_from_network,
         BoundLoadBalancer.disable_public_interface,
@@ -85,6 +89,116 @@ class TestBoundLoadBalancer(BoundModelTestCase):
         assert nested.health_status[1].listen_port == 3000
         assert nested.health_status[1].status == "healthy"
 
+    def test_init_lazy_targets_and_services(self, response_load_balancer):
+        bound_load_balancer = BoundLoadBalancer(
+            client=mock.MagicMock(), data=response_load_balancer["load_balancer"]
+        )
+
+        assert set(bound_load_balancer._lazy_data) == {"targets", "services"}
+
+        assert isinstance(bound_load_balancer.targets[0], LoadBalancerTarget)
+        assert set(bound_load_balancer._lazy_data) == {"services"}
+
+        assert isinstance(bound_load_balancer.services[0], LoadBalancerService)
+        assert bound_load_balancer._lazy_data == {}
+
+    def test_eq_lazy_targets_and_services(self, response_load_balancer):
+        client = mock.MagicMock()
+        o1 = BoundLoadBalancer(
+            client, data=copy.deepcopy(response_load_balancer["load_balancer"])
+        )
+        o2 = BoundLoadBalancer(
+            client, data=copy.deepcopy(response_load_balancer["load_balancer"])
+        )
+
+        o1.targets  # pylint: disable=pointless-statement
+        assert o1 == o2
+        assert o2._lazy_data == {}
+
+    @staticmethod
+    def make_load_balancer(size: int) -> dict:
+        """
+        Returns a Load Balancer with a label selector target selecting ``size``
+        servers, and ``size`` services.
+        """
+        health_status = [{"listen_port": 80, "status": "healthy"}]
+        return {
+            "id": 1,
+            "name": "web",
+            "targets": [
+                {
+                    "type": "label_selector",
+                    "label_selector": {"selector": "role=web"},
+                    "use_private_ip": True,
+                    "health_status": health_status,
+                    "targets": [
+                        {
+                            "type": "server",
+                            "server": {"id": id},
+                            "use_private_ip": True,
+                            "health_status": health_status,
+                        }
+                        for id in range(size)
+                    ],
+                }
+            ],
+            "services": [
+                {
+                    "protocol": "tcp",
+                    "listen_port": 1000 + id,
+                    "destination_port": 1000 + id,
+                    "proxyprotocol": False,
+                    "health_check": {
+                        "protocol": "tcp",
+                        "port": 1000 + id,
+                        "interval": 15,
+                        "timeout": 10,
+                        "retries": 3,
+                    },
+                }
+                for id in range(size)
+            ],
+        }
+
+    @pytest.mark.parametrize("size", [10, 100, 1000])
+    def test_init_lazy_size(self, size: int):
+        data = self.make_load_balancer(size)
+
+        with mock.patch(
+            "hcloud.load_balancers.client.BoundServer", wraps=BoundServer
+        ) as bound_server:
+            bound_load_balancer = BoundLoadBalancer(client=mock.MagicMock(), data=data)
+            # Nothing is decoded on construction, whatever the number of targets
+            assert bound_load_balancer.name == "web"
+            assert bound_server.call_count == 0
+
+            assert len(bound_load_balancer.targets[0].targets) == size
+            assert bound_server.call_count == size
+        assert len(bound_load_balancer.services) == size
+        assert bound_load_balancer.services[-1].health_check.port == 1000 + size - 1
+
+    def test_lazy_targets_concurrent_access(self, response_load_balancer):
+        bound_load_balancer = BoundLoadBalancer(
+            client=mock.MagicMock(), data=response_load_balancer["load_balancer"]
+        )
+
+        decoder = BoundLoadBalancer._lazy_decoders["targets"]
+
+        def slow_decoder(client, raw):
+            time.sleep(0.05)
+            return decoder(client, raw)
+
+        with mock.patch.dict(
+            BoundLoadBalancer._lazy_decoders, {"targets": slow_decoder}
+        ):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(
+                    executor.map(lambda _: bound_load_balancer.targets, range(4))
+                )
+
+        assert all(o is results[0] for o in results)
+        assert isinstance(results[0][0], LoadBalancerTarget)
+
 
 class TestLoadBalancerslient:
     @pytest.fixture()
@@ -548,6 +662,141 @@ class TestLoadBalancerslient:
         assert action.progress == 100
         assert action.command == "remove_target"
 
+    def test_sync_targets(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: LoadBalancersClient,
+        response_load_balancer,
+        action1_running,
+        action1_success,
+        action2_running,
+        action2_success,
+    ):
+        load_balancer = BoundLoadBalancer(
+            resource_client, response_load_balancer["load_balancer"]
+        )
+        request_mock.side_effect = [
+            {"action": action1_running},
+            {"actions": [action1_success]},
+            {"action": action2_running},
+            APIException(code="conflict", message="Conflict", details=None),
+            {"actions": [action2_success]},
+        ]
+
+        results = resource_client.sync_targets(
+            load_balancer,
+            [
+                LoadBalancerTarget(
+                    type="label_selector",
+                    label_selector=LoadBalancerTargetLabelSelector(selector="env=prod"),
+                ),
+                # Covered by the label selector
+                LoadBalancerTarget(type="server", server=Server(id=105054278)),
+                LoadBalancerTarget(type="server", server=Server(id=81)),
+                LoadBalancerTarget(type="ip", ip=LoadBalancerTargetIP(ip="127.0.0.1")),
+            ],
+            concurrency=1,
+        )
+
+        assert request_mock.call_args_list == [
+            mock.call(
+                method="POST",
+                url="/load_balancers/4711/actions/remove_target",
+                json={"type": "server", "server": {"id": 80}},
+            ),
+            mock.call(
+                method="GET",
+                url="/load_balancers/actions",
+                params={"id": [1], "per_page": 1},
+            ),
+            mock.call(
+                method="POST",
+                url="/load_balancers/4711/actions/add_target",
+                json={"type": "server", "server": {"id": 81}},
+            ),
+            mock.call(
+                method="POST",
+                url="/load_balancers/4711/actions/add_target",
+                json={"type": "ip", "ip": {"ip": "127.0.0.1"}},
+            ),
+            mock.call(
+                method="GET",
+                url="/load_balancers/actions",
+                params={"id": [2], "per_page": 1},
+            ),
+        ]
+        assert [o.operation for o in results] == ["remove", "add", "add"]
+        assert results[0].target.server.id == 80
+        assert results[0].action.status == "success"
+        assert results[0].error is None
+        assert results[1].target.server.id == 81
+        assert results[1].action.status == "success"
+        assert results[1].error is None
+        assert results[2].target.ip.ip == "127.0.0.1"
+        assert results[2].action is None
+        assert results[2].error.code == "conflict"
+
+    def test_sync_targets_replace(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: LoadBalancersClient,
+        response_load_balancer,
+    ):
+        load_balancer = BoundLoadBalancer(
+            resource_client, response_load_balancer["load_balancer"]
+        )
+        request_mock.side_effect = [
+            APIException(code="locked", message="Locked", details=None),
+        ]
+
+        results = resource_client.sync_targets(
+            load_balancer,
+            [
+                LoadBalancerTarget(
+                    type="label_selector",
+                    label_selector=LoadBalancerTargetLabelSelector(selector="env=prod"),
+                ),
+                LoadBalancerTarget(
+                    type="server", server=Server(id=80), use_private_ip=True
+                ),
+            ],
+        )
+
+        request_mock.assert_called_once_with(
+            method="POST",
+            url="/load_balancers/4711/actions/remove_target",
+            json={"type": "server", "server": {"id": 80}},
+        )
+        assert [o.operation for o in results] == ["remove", "add"]
+        assert results[0].error.code == "locked"
+        assert results[1].action is None
+        assert results[1].error is results[0].error
+
+    def test_sync_targets_unchanged(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: LoadBalancersClient,
+        response_load_balancer,
+    ):
+        request_mock.return_value = response_load_balancer
+
+        results = resource_client.sync_targets(
+            LoadBalancer(id=4711),
+            [
+                LoadBalancerTarget(type="server", server=Server(id=80)),
+                LoadBalancerTarget(
+                    type="label_selector",
+                    label_selector=LoadBalancerTargetLabelSelector(selector="env=prod"),
+                ),
+            ],
+        )
+
+        request_mock.assert_called_once_with(
+            method="GET",
+            url="/load_balancers/4711",
+        )
+        assert results == []
+
     @pytest.mark.parametrize(
         "load_balancer",
         [LoadBalancer(id=1), BoundLoadBalancer(mock.MagicMock(), dict(id=1))],
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import threading
+from unittest import mock
+
+import pytest
+import requests
+
+from hcloud import APIException, Client
+from hcloud.load_balancers import (
+    LoadBalancer,
+    LoadBalancerHealthMonitor,
+    LoadBalancersClient,
+)
+
+
+def make_load_balancer(id: int, statuses: dict[int, str]):
+    return {
+        "id": id,
+        "targets": [
+            {
+                "type": "ip",
+                "ip": {"ip": "127.0.0.1"},
+                "health_status": [{"listen_port": 80, "status": "healthy"}],
+            },
+            {
+                "type": "label_selector",
+                "label_selector": {"selector": "env=prod"},
+                "use_private_ip": True,
+                "targets": [
+                    {
+                        "type": "server",
+                        "server": {"id": server_id},
+                        "use_private_ip": True,
+                        "health_status": [{"listen_port": 80, "status": status}],
+                    }
+                    for server_id, status in statuses.items()
+                ],
+            },
+        ],
+    }
+
+
+class TestLoadBalancerHealthMonitor:
+    @pytest.fixture()
+    def resource_client(self, client: Client):
+        return client.load_balancers
+
+    def test_poll(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: LoadBalancersClient,
+    ):
+        monitor = LoadBalancerHealthMonitor(resource_client, label_selector="k=v")
+        callback = mock.MagicMock()
+        monitor.subscribe(callback)
+
+        request_mock.return_value = {
+            "load_balancers": [make_load_balancer(1, {10: "healthy", 11: "healthy"})]
+        }
+        changes = monitor.poll()
+
+        request_mock.assert_called_with(
+            method="GET",
+            url="/load_balancers",
+            params={"label_selector": "k=v", "page": 1, "per_page": 50},
+        )
+        assert len(changes) == 3
+        assert callback.call_count == 3
+        assert monitor.statuses == {
+            (1, ("ip", "127.0.0.1"), 80): "healthy",
+            (1, ("server", 10), 80): "healthy",
+            (1, ("server", 11), 80): "healthy",
+        }
+
+        callback.reset_mock()
+        request_mock.side_effect = lambda **kwargs: {
+            "load_balancers": [make_load_balancer(1, {10: "unhealthy", 12: "unknown"})]
+        }
+        changes = monitor.poll()
+
+        assert [
+            (o.target.server.id, o.listen_port, o.previous, o.status) for o in changes
+        ] == [
+            (10, 80, "healthy", "unhealthy"),
+            (12, 80, None, "unknown"),
+            (11, 80, "healthy", None),
+        ]
+        assert [o.load_balancer.id for o in changes] == [1, 1, 1]
+        assert callback.call_args_list == [mock.call(o) for o in changes]
+
+        assert monitor.poll() == []
+
+    def test_poll_errors(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: LoadBalancersClient,
+    ):
+        monitor = LoadBalancerHealthMonitor(
+            resource_client,
+            [LoadBalancer(id=1), LoadBalancer(id=2)],
+            concurrency=1,
+        )
+
+        request_mock.side_effect = [
+            {"load_balancer": make_load_balancer(1, {10: "healthy"})},
+            {"load_balancer": make_load_balancer(2, {20: "healthy"})},
+        ]
+        assert len(monitor.poll()) == 4
+
+        request_mock.side_effect = [
+            {"load_balancer": make_load_balancer(1, {10: "unhealthy"})},
+            APIException(code="unavailable", message="Unavailable", details=None),
+        ]
+        changes = monitor.poll()
+
+        assert [(o.target.server.id, o.status) for o in changes] == [(10, "unhealthy")]
+        assert monitor.errors[2].code == "unavailable"
+        assert monitor.statuses[(2, ("server", 20), 80)] == "healthy"
+
+    def test_run(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: LoadBalancersClient,
+    ):
+        stop = threading.Event()
+        monitor = LoadBalancerHealthMonitor(resource_client, interval=0)
+        monitor.subscribe(
+            lambda change: stop.set() if change.target.type == "server" else None
+        )
+
+        request_mock.side_effect = [
+            {"load_balancers": [make_load_balancer(1, {})]},
+            {"load_balancers": [make_load_balancer(1, {})]},
+            {"load_balancers": [make_load_balancer(1, {10: "healthy"})]},
+        ]
+        monitor.run(stop)
+
+        assert request_mock.call_count == 3
+        assert stop.is_set()
+
+    def test_poll_callback_error(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: LoadBalancersClient,
+    ):
+        monitor = LoadBalancerHealthMonitor(resource_client)
+        failing = mock.MagicMock(side_effect=ValueError("callback failed"))
+        callback = mock.MagicMock()
+        monitor.subscribe(failing)
+        monitor.subscribe(callback)
+
+        request_mock.return_value = {
+            "load_balancers": [make_load_balancer(1, {10: "healthy", 11: "healthy"})]
+        }
+        changes = monitor.poll()
+
+        # Every transition is delivered to every callback
+        assert len(changes) == 3
+        assert failing.call_count == 3
+        assert [o.args[0] for o in callback.call_args_list] == changes
+        assert isinstance(monitor.errors[None], ValueError)
+
+    def test_run_errors(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: LoadBalancersClient,
+    ):
+        monitor = LoadBalancerHealthMonitor(resource_client, interval=0)
+        errors = []
+
+        class Stop(threading.Event):
+            def wait(self, timeout=None):
+                errors.append(dict(monitor.errors))
+                return super().wait(timeout)
+
+        stop = Stop()
+
+        def callback(change):
+            if change.target.type != "server":
+                return
+            if change.status == "unhealthy":
+                raise ValueError("callback failed")
+            stop.set()
+
+        monitor.subscribe(callback)
+        request_mock.side_effect = [
+            requests.exceptions.ConnectionError(),
+            {"load_balancers": [make_load_balancer(1, {10: "unhealthy"})]},
+            {"load_balancers": [make_load_balancer(1, {10: "healthy"})]},
+        ]
+        monitor.run(stop)
+
+        assert request_mock.call_count == 3
+        assert [list(o) for o in errors] == [[None], [None], []]
+        assert isinstance(errors[0][None], requests.exceptions.ConnectionError)
+        assert isinstance(errors[1][None], ValueError)
+        assert monitor.statuses[(1, ("server", 10), 80)] == "healthy"
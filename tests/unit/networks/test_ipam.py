@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import pytest
+
+from hcloud.load_balancers import LoadBalancer, PrivateNet as LoadBalancerPrivateNet
+from hcloud.networks import Network, NetworkIPAM, NetworkSubnet
+from hcloud.servers import PrivateNet, Server
+
+
+@pytest.fixture()
+def network():
+    return Network(
+        id=1,
+        ip_range="10.0.0.0/16",
+        subnets=[
+            NetworkSubnet(ip_range="10.0.0.0/29", type="cloud", gateway="10.0.0.1"),
+            NetworkSubnet(ip_range="10.0.1.0/24", type="cloud", gateway="10.0.0.1"),
+            NetworkSubnet(ip_range="10.0.2.0/24", type="vswitch", gateway="10.0.0.1"),
+        ],
+    )
+
+
+@pytest.fixture()
+def ipam(network):
+    return NetworkIPAM(
+        [network],
+        servers=[
+            Server(
+                id=1,
+                private_net=[
+                    PrivateNet(
+                        network=Network(id=1),
+                        ip="10.0.0.2",
+                        alias_ips=["10.0.0.4"],
+                        mac_address="",
+                    ),
+                    PrivateNet(
+                        network=Network(id=2),
+                        ip="10.0.0.3",
+                        alias_ips=[],
+                        mac_address="",
+                    ),
+                ],
+            )
+        ],
+        load_balancers=[
+            LoadBalancer(
+                id=1,
+                private_net=[
+                    LoadBalancerPrivateNet(network=Network(id=1), ip="10.0.0.5")
+                ],
+            )
+        ],
+    )
+
+
+class TestNetworkIPAM:
+    def test_allocate_ip(self, ipam: NetworkIPAM, network):
+        assert ipam.allocate_ip(network) == "10.0.0.3"
+        assert ipam.allocate_ip(network) == "10.0.0.6"
+        # The subnet is full
+        assert ipam.allocate_ip(network) == "10.0.1.2"
+        assert ipam.allocate_ip(network, subnet="10.0.1.0/24") == "10.0.1.3"
+
+    def test_allocate_ips(self, ipam: NetworkIPAM, network):
+        assert ipam.allocate_ips(network, 3) == ["10.0.0.3", "10.0.0.6", "10.0.1.2"]
+
+        with pytest.raises(ValueError):
+            ipam.allocate_ips(network, 1000)
+
+        # Nothing was allocated by the failed allocation
+        assert ipam.allocate_ip(network) == "10.0.1.3"
+
+    def test_allocate_ip_unknown(self, ipam: NetworkIPAM, network):
+        with pytest.raises(ValueError):
+            ipam.allocate_ip(Network(id=2))
+        with pytest.raises(ValueError):
+            ipam.allocate_ip(network, subnet="10.0.2.0/24")
+
+    def test_reserve_and_release_ip(self, ipam: NetworkIPAM, network):
+        assert ipam.is_free(network, "10.0.1.10")
+        ipam.reserve_ip(network, "10.0.1.10")
+        assert not ipam.is_free(network, "10.0.1.10")
+
+        with pytest.raises(ValueError):
+            ipam.reserve_ip(network, "10.0.1.10")
+        with pytest.raises(ValueError):
+            ipam.reserve_ip(network, "10.0.0.2")
+        with pytest.raises(ValueError):
+            ipam.reserve_ip(network, "10.0.2.10")
+
+        ipam.release_ip(network, "10.0.1.10")
+        assert ipam.is_free(network, "10.0.1.10")
+
+        # Reserved IPs are never released
+        ipam.release_ip(network, "10.0.1.1")
+        assert not ipam.is_free(network, "10.0.1.1")
+
+    def test_release_ip_merges(self, ipam: NetworkIPAM, network):
+        ips = ipam.allocate_ips(network, 10, subnet="10.0.1.0/24")
+        for ip in reversed(ips):
+            ipam.release_ip(network, ip)
+
+        assert ipam.allocate_ips(network, 10, subnet="10.0.1.0/24") == ips
+
+    def test_allocate_subnet(self, ipam: NetworkIPAM, network):
+        assert ipam.allocate_subnet(network, 29) == "10.0.0.8/29"
+        assert ipam.allocate_subnet(network, 24) == "10.0.3.0/24"
+        assert ipam.allocate_subnet(network, 28) == "10.0.0.16/28"
+
+        assert ipam.allocate_ip(network, subnet="10.0.3.0/24") == "10.0.3.2"
+
+        with pytest.raises(ValueError):
+            ipam.allocate_subnet(network, 8)
+        with pytest.raises(ValueError):
+            ipam.allocate_subnet(network, 16)
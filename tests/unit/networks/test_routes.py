@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import pytest
+
+from hcloud.networks import (
+    Network,
+    NetworkRoute,
+    NetworkRouteConflict,
+    NetworkRouteTable,
+)
+
+
+@pytest.fixture()
+def network():
+    return Network(
+        id=1,
+        routes=[
+            NetworkRoute(destination="0.0.0.0/0", gateway="10.0.0.1"),
+            NetworkRoute(destination="10.100.0.0/16", gateway="10.0.0.2"),
+            NetworkRoute(destination="10.100.1.0/24", gateway="10.0.0.3"),
+            NetworkRoute(destination="10.100.1.1/32", gateway="10.0.0.4"),
+        ],
+    )
+
+
+@pytest.fixture()
+def table(network):
+    return NetworkRouteTable(
+        [
+            network,
+            Network(
+                id=2,
+                routes=[NetworkRoute(destination="10.100.0.0/16", gateway="10.1.0.2")],
+            ),
+        ]
+    )
+
+
+class TestNetworkRouteTable:
+    def test_routes(self, table: NetworkRouteTable, network):
+        assert table.routes(network) == network.routes
+
+    def test_lookup(self, table: NetworkRouteTable, network):
+        assert table.lookup(network, "8.8.8.8").gateway == "10.0.0.1"
+        assert table.lookup(network, "10.100.2.1").gateway == "10.0.0.2"
+        assert table.lookup(network, "10.100.1.2").gateway == "10.0.0.3"
+        assert table.lookup(network, "10.100.1.1").gateway == "10.0.0.4"
+
+        assert table.lookup(Network(id=2), "10.100.1.1").gateway == "10.1.0.2"
+        assert table.lookup(Network(id=2), "8.8.8.8") is None
+
+        with pytest.raises(ValueError):
+            table.lookup(Network(id=3), "8.8.8.8")
+
+    def test_lookup_many(self, table: NetworkRouteTable, network):
+        result = table.lookup_many(network, ["8.8.8.8", "10.100.1.2", "10.100.1.1"])
+
+        assert [o.gateway for o in result] == ["10.0.0.1", "10.0.0.3", "10.0.0.4"]
+
+    def test_add_and_delete_route(self, table: NetworkRouteTable, network):
+        route = NetworkRoute(destination="10.100.2.0/24", gateway="10.0.0.5")
+        table.add_route(network, route)
+        assert table.lookup(network, "10.100.2.1") is route
+
+        table.delete_route(network, route)
+        assert table.lookup(network, "10.100.2.1").gateway == "10.0.0.2"
+
+    @pytest.mark.parametrize(
+        ("route", "expected"),
+        [
+            (NetworkRoute("10.200.0.0/16", "10.0.0.1"), []),
+            (
+                NetworkRoute("10.100.0.0/16", "10.0.0.2"),
+                [("10.100.0.0/16", "duplicate")],
+            ),
+            (
+                NetworkRoute("10.100.0.0/16", "10.0.0.9"),
+                [("10.100.0.0/16", "conflict")],
+            ),
+            (
+                NetworkRoute("10.100.2.0/24", "10.0.0.9"),
+                [("10.100.0.0/16", "shadows")],
+            ),
+            (
+                # Same gateway as the enclosing route
+                NetworkRoute("10.100.1.0/31", "10.0.0.3"),
+                [],
+            ),
+        ],
+    )
+    def test_check_route(self, table: NetworkRouteTable, network, route, expected):
+        conflicts = table.check_route(network, route)
+
+        assert [(o.existing.destination, o.type) for o in conflicts] == expected
+        assert all(o.route is route for o in conflicts)
+
+    def test_check_route_shadowed(self):
+        network = Network(
+            id=1,
+            routes=[
+                NetworkRoute(destination="10.0.0.0/25", gateway="10.0.0.2"),
+                NetworkRoute(destination="10.0.0.128/26", gateway="10.0.0.3"),
+                NetworkRoute(destination="10.0.0.192/26", gateway="10.0.0.4"),
+            ],
+        )
+        table = NetworkRouteTable([network])
+
+        conflicts = table.check_route(
+            network, NetworkRoute(destination="10.0.0.0/24", gateway="10.0.0.5")
+        )
+
+        assert [(o.existing.destination, o.type) for o in conflicts] == [
+            ("10.0.0.0/25", NetworkRouteConflict.TYPE_SHADOWED),
+            ("10.0.0.128/26", NetworkRouteConflict.TYPE_SHADOWED),
+            ("10.0.0.192/26", NetworkRouteConflict.TYPE_SHADOWED),
+        ]
+
+        conflicts = table.check_route(
+            network, NetworkRoute(destination="10.0.1.0/24", gateway="10.0.0.5")
+        )
+        assert conflicts == []
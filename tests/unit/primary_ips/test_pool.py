@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from hcloud import APIException, Client
+from hcloud.primary_ips import PrimaryIP, PrimaryIPPool, PrimaryIPsClient
+
+
+def make_primary_ip(id: int, type: str = "ipv4", assignee_id: int | None = None):
+    return {
+        "id": id,
+        "name": f"pool-{type}-{id}",
+        "type": type,
+        "ip": f"131.232.99.{id}",
+        "assignee_id": assignee_id,
+        "assignee_type": "server",
+        "location": {"id": 1, "name": "fsn1"},
+        "labels": {"primary-ip-pool": "pool"},
+    }
+
+
+def make_action(id: int):
+    return {"id": id, "command": "create_primary_ip", "status": "success"}
+
+
+def create_responses(id: int, type: str = "ipv4"):
+    return [
+        {"primary_ip": make_primary_ip(id, type), "action": make_action(id)},
+        {"action": make_action(id)},
+    ]
+
+
+def create_call(type: str = "ipv4"):
+    return mock.call(
+        method="POST",
+        url="/primary_ips",
+        json={
+            "name": mock.ANY,
+            "type": type,
+            "auto_delete": False,
+            "labels": {"primary-ip-pool": "pool"},
+            "location": "fsn1",
+        },
+    )
+
+
+def action_call(id: int):
+    return mock.call(method="GET", url=f"/actions/{id}")
+
+
+class TestPrimaryIPPool:
+    @pytest.fixture()
+    def resource_client(self, client: Client):
+        return client.primary_ips
+
+    def test_refill(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: PrimaryIPsClient,
+    ):
+        request_mock.side_effect = [
+            *create_responses(1, "ipv4"),
+            *create_responses(2, "ipv4"),
+            *create_responses(3, "ipv6"),
+            *create_responses(4, "ipv6"),
+        ]
+        pool = PrimaryIPPool(resource_client, "pool", ["fsn1"], size=2, concurrency=1)
+
+        created = pool.refill()
+
+        assert [o.id for o in created] == [1, 2, 3, 4]
+        assert request_mock.call_args_list == [
+            create_call("ipv4"),
+            action_call(1),
+            create_call("ipv4"),
+            action_call(2),
+            create_call("ipv6"),
+            action_call(3),
+            create_call("ipv6"),
+            action_call(4),
+        ]
+        names = [o.kwargs["json"]["name"] for o in request_mock.call_args_list[::2]]
+        assert [o[: len("pool-ipv4-")] for o in names] == [
+            "pool-ipv4-",
+            "pool-ipv4-",
+            "pool-ipv6-",
+            "pool-ipv6-",
+        ]
+        assert pool.available("fsn1", "ipv4") == 2
+        assert pool.available("fsn1", "ipv6") == 2
+
+        assert pool.refill() == []
+        assert request_mock.call_count == 8
+
+    def test_refill_concurrent(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: PrimaryIPsClient,
+    ):
+        def side_effect(method, url, **kwargs):
+            if method == "POST":
+                # Let a concurrent refill run while the creation is in progress
+                time.sleep(0.05)
+                return create_responses(1)[0]
+            return {"action": make_action(1)}
+
+        request_mock.side_effect = side_effect
+        pool = PrimaryIPPool(resource_client, "pool", ["fsn1"], types=["ipv4"], size=1)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(lambda _: pool.refill(), range(2)))
+
+        assert sorted(len(o) for o in results) == [0, 1]
+        assert request_mock.call_args_list == [create_call(), action_call(1)]
+        assert pool.available("fsn1", "ipv4") == 1
+
+    def test_refill_errors(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: PrimaryIPsClient,
+    ):
+        request_mock.side_effect = [
+            APIException(code="limit", message="Limit", details=None),
+            *create_responses(1),
+            *create_responses(2),
+        ]
+        pool = PrimaryIPPool(
+            resource_client, "pool", ["fsn1"], types=["ipv4"], size=3, concurrency=1
+        )
+
+        assert [o.id for o in pool.refill()] == [1, 2]
+        assert [o.code for o in pool.errors] == ["limit"]
+        assert pool.available("fsn1", "ipv4") == 2
+
+        request_mock.side_effect = create_responses(3)
+        assert [o.id for o in pool.refill()] == [3]
+        assert pool.errors == []
+
+    def test_load(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: PrimaryIPsClient,
+    ):
+        request_mock.return_value = {
+            "primary_ips": [
+                make_primary_ip(1),
+                make_primary_ip(2, assignee_id=17),
+                make_primary_ip(3, "ipv6"),
+            ]
+        }
+        pool = PrimaryIPPool(resource_client, "pool", ["fsn1"])
+
+        pool.load()
+
+        request_mock.assert_called_with(
+            method="GET",
+            url="/primary_ips",
+            params={
+                "label_selector": "primary-ip-pool=pool",
+                "page": 1,
+                "per_page": 50,
+            },
+        )
+        assert pool.available("fsn1", "ipv4") == 1
+        assert pool.available("fsn1", "ipv6") == 1
+
+    def test_acquire(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: PrimaryIPsClient,
+    ):
+        request_mock.side_effect = [
+            *create_responses(1, "ipv4"),
+            *create_responses(2, "ipv6"),
+        ]
+        pool = PrimaryIPPool(resource_client, "pool", ["fsn1"], size=1, concurrency=1)
+        pool.refill()
+
+        public_net = pool.acquire_public_net("fsn1")
+
+        assert public_net.ipv4.id == 1
+        assert public_net.ipv6.id == 2
+        assert pool.available("fsn1", "ipv4") == 0
+        assert pool.available("fsn1", "ipv6") == 0
+        assert request_mock.call_count == 4
+
+        # An empty pool creates the Primary IP right away
+        request_mock.side_effect = create_responses(3)
+        primary_ip = pool.acquire("fsn1", "ipv4")
+        assert primary_ip.id == 3
+        assert request_mock.call_args_list[4:] == [create_call(), action_call(3)]
+
+    def test_acquire_unknown(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: PrimaryIPsClient,
+    ):
+        pool = PrimaryIPPool(resource_client, "pool", ["fsn1"], types=["ipv4"])
+
+        with pytest.raises(ValueError, match="location 'nbg1' and type 'ipv4'"):
+            pool.acquire("nbg1", "ipv4")
+        with pytest.raises(ValueError, match="location 'fsn1' and type 'ipv6'"):
+            pool.available("fsn1", "ipv6")
+        request_mock.assert_not_called()
+
+    def test_release(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: PrimaryIPsClient,
+    ):
+        request_mock.side_effect = [
+            {"primary_ip": make_primary_ip(1, assignee_id=17)},
+            {"action": make_action(1)},
+            {"action": make_action(1)},
+        ]
+        pool = PrimaryIPPool(resource_client, "pool", ["fsn1"], types=["ipv4"])
+
+        pool.release(PrimaryIP(id=1))
+
+        assert request_mock.call_args_list == [
+            mock.call(method="GET", url="/primary_ips/1"),
+            mock.call(method="POST", url="/primary_ips/1/actions/unassign"),
+            mock.call(method="GET", url="/actions/1"),
+        ]
+        assert pool.available("fsn1", "ipv4") == 1
+
+        primary_ip = pool.acquire("fsn1", "ipv4")
+        assert primary_ip.id == 1
+        assert primary_ip.assignee_id is None
+
+    def test_start(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: PrimaryIPsClient,
+    ):
+        request_mock.side_effect = create_responses(1)
+        pool = PrimaryIPPool(resource_client, "pool", ["fsn1"], types=["ipv4"], size=1)
+
+        pool.start(interval=0.01)
+        try:
+            for _ in range(100):
+                if pool.available("fsn1", "ipv4"):
+                    break
+                pool._wake.wait(0.01)
+        finally:
+            pool.stop()
+
+        assert pool.available("fsn1", "ipv4") == 1
+        assert pool._thread is None
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+import requests
+
+from hcloud import APIException, Client
+from hcloud.actions import ActionFailedException
+from hcloud.floating_ips import FloatingIP
+from hcloud.load_balancers import BoundLoadBalancer
+from hcloud.primary_ips import PrimaryIP
+from hcloud.rdns import change_dns_ptrs
+from hcloud.servers import BoundServer
+
+
+def test_change_dns_ptrs(request_mock: mock.MagicMock, client: Client):
+    request_mock.side_effect = [
+        {
+            "primary_ip": {
+                "id": 2,
+                "type": "ipv6",
+                "dns_ptr": [{"ip": "2001:db8::1", "dns_ptr": "ip.example.com"}],
+            }
+        },
+        APIException(code="not_found", message="Not found", details=None),
+        {"action": {"id": 1, "status": "running"}},
+        {"action": {"id": 2, "status": "running"}},
+        {"action": {"id": 3, "status": "running"}},
+        APIException(code="invalid_input", message="", details=None),
+        {
+            "actions": [
+                {"id": 1, "status": "success"},
+                {"id": 2, "status": "error"},
+                {"id": 3, "status": "success"},
+            ]
+        },
+    ]
+
+    server = BoundServer(
+        client.servers,
+        data={
+            "id": 1,
+            "public_net": {
+                "ipv4": {
+                    "id": 11,
+                    "ip": "1.2.3.4",
+                    "blocked": False,
+                    "dns_ptr": "server.example.com",
+                },
+                "ipv6": {
+                    "id": 12,
+                    "ip": "2001:db8:1::/64",
+                    "blocked": False,
+                    "dns_ptr": [
+                        {"ip": "2001:db8:1::1", "dns_ptr": "server.example.com"}
+                    ],
+                },
+                "floating_ips": [],
+            },
+        },
+    )
+    load_balancer = BoundLoadBalancer(
+        client.load_balancers,
+        data={
+            "id": 4,
+            "public_net": {
+                "enabled": True,
+                "ipv4": {"ip": "5.6.7.8", "dns_ptr": "lb.example.com"},
+                "ipv6": {"ip": "2001:db8:4::1", "dns_ptr": "lb.example.com"},
+            },
+        },
+    )
+
+    results = change_dns_ptrs(
+        client,
+        [
+            # Unchanged
+            (server, "1.2.3.4", "server.example.com"),
+            (server, "2001:db8:1:0::1", "server.example.com"),
+            (server, "2001:db8:1::2", None),
+            (PrimaryIP(id=2), "2001:db8::1", "ip.example.com"),
+            (load_balancer, "2001:db8:4::1", "lb.example.com"),
+            # Changed
+            (server, "1.2.3.4", None),
+            (server, "2001:db8:1::2", "other.example.com"),
+            (PrimaryIP(id=2), "2001:db8::2", "other.example.com"),
+            (load_balancer, "5.6.7.8", "other.example.com"),
+            # Failed to fetch
+            (FloatingIP(id=3), "9.9.9.9", "other.example.com"),
+        ],
+        concurrency=1,
+    )
+
+    assert [(o.resource.id, o.ip, o.dns_ptr) for o in results] == [
+        (1, "1.2.3.4", None),
+        (1, "2001:db8:1::2", "other.example.com"),
+        (2, "2001:db8::2", "other.example.com"),
+        (4, "5.6.7.8", "other.example.com"),
+        (3, "9.9.9.9", "other.example.com"),
+    ]
+    assert request_mock.call_args_list == [
+        mock.call(method="GET", url="/primary_ips/2"),
+        mock.call(method="GET", url="/floating_ips/3"),
+        mock.call(
+            method="POST",
+            url="/servers/1/actions/change_dns_ptr",
+            json={"ip": "1.2.3.4", "dns_ptr": None},
+        ),
+        mock.call(
+            method="POST",
+            url="/servers/1/actions/change_dns_ptr",
+            json={"ip": "2001:db8:1::2", "dns_ptr": "other.example.com"},
+        ),
+        mock.call(
+            method="POST",
+            url="/primary_ips/2/actions/change_dns_ptr",
+            json={"ip": "2001:db8::2", "dns_ptr": "other.example.com"},
+        ),
+        mock.call(
+            method="POST",
+            url="/load_balancers/4/actions/change_dns_ptr",
+            json={"ip": "5.6.7.8", "dns_ptr": "other.example.com"},
+        ),
+        # The Actions are polled together
+        mock.call(
+            method="GET",
+            url="/actions",
+            params={"id": [1, 2, 3], "per_page": 3},
+        ),
+    ]
+
+    assert results[0].action.status == "success"
+    assert results[0].error is None
+    assert isinstance(results[1].error, ActionFailedException)
+    assert results[2].action.status == "success"
+    assert results[3].action is None
+    assert results[3].error.code == "invalid_input"
+    assert results[4].action is None
+    assert results[4].error.code == "not_found"
+
+
+def test_change_dns_ptrs_request_error(request_mock: mock.MagicMock, client: Client):
+    request_mock.side_effect = [
+        requests.exceptions.ConnectionError(),
+        {"primary_ip": {"id": 2, "type": "ipv4", "ip": "1.2.3.4", "dns_ptr": []}},
+        requests.exceptions.Timeout(),
+    ]
+
+    results = change_dns_ptrs(
+        client,
+        [
+            (FloatingIP(id=1), "5.6.7.8", "ip.example.com"),
+            (PrimaryIP(id=2), "1.2.3.4", "ip.example.com"),
+        ],
+        concurrency=1,
+    )
+
+    assert [(o.resource.id, o.action) for o in results] == [(1, None), (2, None)]
+    assert isinstance(results[0].error, requests.exceptions.ConnectionError)
+    assert isinstance(results[1].error, requests.exceptions.Timeout)
+
+
+def test_change_dns_ptrs_invalid_ip(request_mock: mock.MagicMock, client: Client):
+    with pytest.raises(ValueError, match="invalid IP 'not-an-ip'"):
+        change_dns_ptrs(
+            client,
+            [
+                (FloatingIP(id=1), "5.6.7.8", "ip.example.com"),
+                (PrimaryIP(id=2), "not-an-ip", "ip.example.com"),
+            ],
+        )
+
+    request_mock.assert_not_called()
@@ -0,0 +1,410 @@
+from __future__ import annotations
+
+import itertools
+from unittest import mock
+
+import pytest
+import requests
+
+from hcloud import APIException, Client
+from hcloud.actions import ActionFailedException
+from hcloud.firewalls import BoundFirewall, FirewallRule
+from hcloud.images import Image
+from hcloud.inventory import Inventory, InventoryCollection
+from hcloud.load_balancer_types import LoadBalancerType
+from hcloud.locations import Location
+from hcloud.networks import BoundNetwork
+from hcloud.reconcile import (
+    OWNER_LABEL,
+    FirewallSpec,
+    LoadBalancerSpec,
+    NetworkSpec,
+    ServerSpec,
+    VolumeSpec,
+    create_plan,
+)
+from hcloud.server_types import ServerType
+from hcloud.servers import BoundServer
+from hcloud.volumes import BoundVolume
+
+from ..conftest import RequestRouter
+
+OWNED = {OWNER_LABEL: "app"}
+
+SPECS = [
+    NetworkSpec("private", "10.0.0.0/16"),
+    ServerSpec(
+        "web-1",
+        ServerType(name="cx22"),
+        Image(name="debian-12"),
+        Location(name="fsn1"),
+        networks=["private"],
+    ),
+    VolumeSpec("data", 10, Location(name="fsn1"), server="web-1"),
+    FirewallSpec("web", servers=["web-1"]),
+    LoadBalancerSpec(
+        "web",
+        LoadBalancerType(name="lb11"),
+        Location(name="fsn1"),
+        network="private",
+        servers=["web-1"],
+    ),
+]
+
+
+# IDs of the resources created when applying the plan
+CREATED_IDS = {
+    "networks": 1,
+    "servers": 2,
+    "volumes": 3,
+    "firewalls": 4,
+    "load_balancers": 5,
+}
+
+
+def make_inventory(**collections) -> Inventory:
+    return Inventory(
+        **{
+            name: InventoryCollection(collections.get(name, []))
+            for name in Inventory._fields
+        }
+    )
+
+
+def add_routes(request_router: RequestRouter, **overrides):
+    """
+    Adds the requests applying the plan of the specs, every action succeeding on its
+    first poll. The overrides replace the response of a request, by request name,
+    e.g. ``post_networks``.
+    """
+    ids = itertools.count(100)
+
+    def action(*statuses: str) -> dict:
+        return request_router.add_action(
+            next(ids), *(statuses or ("running", "success"))
+        )
+
+    def data(name: str, collection: str) -> dict:
+        return {"id": CREATED_IDS[collection], "name": name, "labels": {}}
+
+    responses = {
+        "POST /networks": lambda: {"network": data("private", "networks")},
+        "POST /servers": lambda: {
+            "server": data("web-1", "servers"),
+            "action": action(),
+            "next_actions": [action()],
+            "root_password": None,
+        },
+        "POST /volumes": lambda: {
+            "volume": data("data", "volumes"),
+            "action": action(),
+            "next_actions": [],
+        },
+        "POST /firewalls": lambda: {
+            "firewall": data("web", "firewalls"),
+            "actions": [],
+        },
+        "POST /load_balancers": lambda: {
+            "load_balancer": data("web", "load_balancers"),
+            "action": action(),
+        },
+        "POST /servers/2/actions/attach_to_network": lambda: {"action": action()},
+        "POST /volumes/3/actions/attach": lambda: {"action": action()},
+        "POST /firewalls/4/actions/apply_to_resources": lambda: {"actions": [action()]},
+        "POST /load_balancers/5/actions/attach_to_network": lambda: {
+            "action": action()
+        },
+        "POST /load_balancers/5/actions/add_target": lambda: {"action": action()},
+    }
+    for request, response in responses.items():
+        method, url = request.split(" ")
+        override = overrides.get(request)
+        request_router.add(
+            method,
+            url,
+            override(action) if callable(override) else override or response(),
+        )
+
+
+def requests_sent(request_mock: mock.MagicMock) -> list[str]:
+    return [
+        f"{o.kwargs['method']} {o.kwargs['url']}"
+        for o in request_mock.call_args_list
+        if o.kwargs["url"] != "/actions"
+    ]
+
+
+def polls_sent(request_mock: mock.MagicMock) -> list[list[int]]:
+    return [
+        sorted(o.kwargs["params"]["id"])
+        for o in request_mock.call_args_list
+        if o.kwargs["url"] == "/actions"
+    ]
+
+
+def test_create_plan(client: Client):
+    plan = create_plan(client, SPECS, owner="app", inventory=make_inventory())
+
+    assert {o.id: o.depends_on for o in plan} == {
+        "create network private": [],
+        "create server web-1": [],
+        "attach server web-1 network private": [
+            "create server web-1",
+            "create network private",
+        ],
+        "create volume data": [],
+        "attach volume data server web-1": [
+            "create volume data",
+            "create server web-1",
+        ],
+        "create firewall web": [],
+        "attach firewall web server web-1": [
+            "create firewall web",
+            "create server web-1",
+        ],
+        "create load_balancer web": [],
+        "attach load_balancer web network private": [
+            "create load_balancer web",
+            "create network private",
+        ],
+        "attach load_balancer web server web-1": [
+            "create load_balancer web",
+            "create server web-1",
+        ],
+    }
+
+
+def test_create_plan_existing(client: Client):
+    network = BoundNetwork(client.networks, {"id": 1, "name": "private", "labels": {}})
+    server = BoundServer(
+        client.servers,
+        {
+            "id": 2,
+            "name": "web-1",
+            "labels": OWNED,
+            "volumes": [3],
+            "private_net": [
+                {"network": 1, "ip": "10.0.0.2", "alias_ips": [], "mac_address": ""}
+            ],
+        },
+    )
+    volume = BoundVolume(
+        client.volumes,
+        {"id": 3, "name": "data", "labels": OWNED, "size": 20, "server": 2},
+    )
+
+    plan = create_plan(
+        client,
+        [
+            NetworkSpec("private", "10.0.0.0/16"),
+            SPECS[1],
+            VolumeSpec("data", 30, Location(name="fsn1")),
+        ],
+        owner="app",
+        inventory=make_inventory(
+            networks=[network], servers=[server], volumes=[volume]
+        ),
+    )
+
+    # The existing network is adopted, the volume is grown and detached
+    assert {o.id: o.depends_on for o in plan} == {
+        "update network private": [],
+        "update volume data size 30": [],
+        "detach volume data": [],
+    }
+
+
+def test_create_plan_deletes(client: Client):
+    network = BoundNetwork(client.networks, {"id": 1, "name": "old", "labels": OWNED})
+    private_net = [{"network": 1, "ip": "10.0.0.2", "alias_ips": [], "mac_address": ""}]
+    servers = [
+        BoundServer(
+            client.servers,
+            {
+                "id": 2,
+                "name": "old",
+                "labels": OWNED,
+                "volumes": [4],
+                "private_net": private_net,
+            },
+        ),
+        BoundServer(
+            client.servers,
+            {"id": 3, "name": "other", "labels": {}, "private_net": private_net},
+        ),
+    ]
+    volume = BoundVolume(
+        client.volumes, {"id": 4, "name": "old", "labels": OWNED, "server": 2}
+    )
+    firewall = BoundFirewall(
+        client.firewalls,
+        {
+            "id": 5,
+            "name": "old",
+            "labels": OWNED,
+            "applied_to": [{"type": "server", "server": {"id": 3}}],
+        },
+    )
+
+    plan = create_plan(
+        client,
+        [],
+        owner="app",
+        inventory=make_inventory(
+            networks=[network],
+            servers=servers,
+            volumes=[volume],
+            firewalls=[firewall],
+        ),
+    )
+
+    assert {o.id: o.depends_on for o in plan} == {
+        "detach volume old": [],
+        "delete server old": ["detach volume old"],
+        "delete volume old": ["detach volume old"],
+        "detach firewall old": [],
+        "delete firewall old": ["detach firewall old"],
+        "detach server other network old": [],
+        "delete network old": ["delete server old", "detach server other network old"],
+    }
+
+
+def test_create_plan_invalid(client: Client):
+    other = BoundNetwork(client.networks, {"id": 1, "name": "other", "labels": OWNED})
+
+    with pytest.raises(ValueError, match="neither desired nor existing"):
+        create_plan(client, SPECS[1:2], owner="app", inventory=make_inventory())
+    with pytest.raises(ValueError, match="would be deleted"):
+        create_plan(
+            client,
+            [
+                ServerSpec(
+                    "web-1",
+                    ServerType(name="cx22"),
+                    Image(name="debian-12"),
+                    None,
+                    ["other"],
+                )
+            ],
+            owner="app",
+            inventory=make_inventory(networks=[other]),
+        )
+    with pytest.raises(ValueError, match="duplicate"):
+        create_plan(client, SPECS[:1] * 2, owner="app", inventory=make_inventory())
+
+
+def test_apply(
+    request_mock: mock.MagicMock,
+    request_router: RequestRouter,
+    client: Client,
+):
+    add_routes(request_router)
+    plan = create_plan(client, SPECS, owner="app", inventory=make_inventory())
+
+    results = plan.apply(concurrency=len(plan))
+
+    assert [(o.operation.id, o.status) for o in results] == [
+        (o.id, "success") for o in plan
+    ]
+    requests = requests_sent(request_mock)
+    for request in (
+        "POST /servers/2/actions/attach_to_network",
+        "POST /volumes/3/actions/attach",
+        "POST /firewalls/4/actions/apply_to_resources",
+        "POST /load_balancers/5/actions/add_target",
+    ):
+        # The server is used once created and started
+        assert requests.index(request) > requests.index("POST /servers")
+    assert requests.index(
+        "POST /load_balancers/5/actions/attach_to_network"
+    ) > requests.index("POST /networks")
+
+    create_requests = [o for o in requests if o.count("/") == 1]
+    assert sorted(create_requests[:5]) == [
+        "POST /firewalls",
+        "POST /load_balancers",
+        "POST /networks",
+        "POST /servers",
+        "POST /volumes",
+    ]
+    # The running actions are polled together
+    assert any(len(o) > 1 for o in polls_sent(request_mock))
+
+    for result in results:
+        if result.operation.type == "create":
+            assert all(o.status == "success" for o in result.actions)
+
+
+def test_apply_failed(request_router: RequestRouter, client: Client):
+    add_routes(
+        request_router,
+        **{
+            "POST /networks": APIException(
+                code="invalid_input", message="", details=None
+            ),
+            "POST /volumes/3/actions/attach": lambda action: {
+                "action": action("running", "error")
+            },
+            "POST /load_balancers": requests.exceptions.ConnectionError(),
+        },
+    )
+    plan = create_plan(client, SPECS, owner="app", inventory=make_inventory())
+
+    results = {o.operation.id: o for o in plan.apply()}
+
+    assert {id: o.status for id, o in results.items()} == {
+        "create network private": "error",
+        "create server web-1": "success",
+        "attach server web-1 network private": "skipped",
+        "create volume data": "success",
+        "attach volume data server web-1": "error",
+        "create firewall web": "success",
+        "attach firewall web server web-1": "success",
+        "create load_balancer web": "error",
+        "attach load_balancer web network private": "skipped",
+        "attach load_balancer web server web-1": "skipped",
+    }
+    assert isinstance(results["create network private"].error, APIException)
+    assert (
+        results["attach server web-1 network private"].error
+        is results["create network private"].error
+    )
+    assert isinstance(
+        results["attach volume data server web-1"].error, ActionFailedException
+    )
+    # Any exception raised by an operation fails it
+    assert isinstance(
+        results["create load_balancer web"].error,
+        requests.exceptions.ConnectionError,
+    )
+
+
+def test_apply_failed_next_action(
+    request_mock: mock.MagicMock,
+    request_router: RequestRouter,
+    client: Client,
+):
+    # The server is created, but fails to start
+    add_routes(
+        request_router,
+        **{
+            "POST /servers": lambda action: {
+                "server": {"id": 2, "name": "web-1", "labels": {}},
+                "action": action("running", "success"),
+                "next_actions": [action("error")],
+                "root_password": None,
+            },
+        },
+    )
+    plan = create_plan(client, SPECS[:2], owner="app", inventory=make_inventory())
+
+    results = {o.operation.id: o for o in plan.apply()}
+
+    assert {id: o.status for id, o in results.items()} == {
+        "create network private": "success",
+        "create server web-1": "error",
+        "attach server web-1 network private": "skipped",
+    }
+    assert isinstance(results["create server web-1"].error, ActionFailedException)
+    # The running action of the failed operation is not polled
+    assert all(100 not in o for o in polls_sent(request_mock))
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+from http import HTTPStatus
 from unittest import mock
 
 import pytest
+import requests
 
-from hcloud import Client
-from hcloud.actions import BoundAction
+from hcloud import APIException, Client, constant_backoff_function
+from hcloud.actions import (
+    ActionFailedException,
+    ActionTimeoutException,
+    BoundAction,
+)
 from hcloud.firewalls import BoundFirewall, Firewall
 from hcloud.floating_ips import BoundFloatingIP
 from hcloud.images import BoundImage, Image
@@ -22,11 +28,15 @@ from hcloud.servers import (
     PublicNetwork,
     PublicNetworkFirewall,
     Server,
+    ServerHealthCheckException,
+    ServerNotStartedException,
     ServersClient,
+    ServerStatusTimeoutException,
 )
 from hcloud.volumes import BoundVolume, Volume
 
-from ..conftest import BoundModelTestCase
+from ..conftest import BoundModelTestCase, RequestRouter
+from ..test_client import make_response
 
 
 class TestBoundServer(BoundModelTestCase):
@@ -1180,3 +1190,740 @@ class TestServersClient:
         assert "cpu" in response.metrics.time_series
         assert "disk.0.iops.read" in response.metrics.time_series
         assert len(response.metrics.time_series["disk.0.iops.read"]["values"]) == 3
+
+    def test_create_many(
+        self,
+        request_mock: mock.MagicMock,
+        request_router: RequestRouter,
+        servers_client: ServersClient,
+    ):
+        servers_client._client._retry_interval_func = constant_backoff_function(0.0)
+
+        def server(id, name, status="initializing"):
+            return {"id": id, "name": name, "status": status}
+
+        request_router.add(
+            "POST",
+            "/servers",
+            # Polled twice, along with the other actions
+            {
+                "server": server(11, "a"),
+                "action": request_router.add_action(1, "running", "success"),
+                "next_actions": [
+                    request_router.add_action(2, "running", "running", "success")
+                ],
+                "root_password": None,
+            },
+            # Retried, the server was not created
+            APIException(code="timeout", message="", details=None),
+            {
+                "server": server(12, "b"),
+                "action": request_router.add_action(3, "success"),
+                "next_actions": [],
+                "root_password": None,
+            },
+            # Not retried
+            APIException(code="invalid_input", message="", details=None),
+            # Not retried, the server was created
+            APIException(code="service_error", message="", details=None),
+        )
+        request_router.add(
+            "GET",
+            "/servers",
+            lambda params, **_: {
+                "servers": [server(4, "d", "running")] if params["name"] == "d" else []
+            },
+        )
+        request_router.add("GET", "/servers/4/actions", {"actions": []})
+        for id, name in ((4, "d"), (11, "a"), (12, "b")):
+            request_router.add(
+                "GET", f"/servers/{id}", {"server": server(id, name, "running")}
+            )
+
+        results = list(
+            servers_client.create_many(
+                [
+                    {
+                        "name": name,
+                        "server_type": ServerType(name="cx22"),
+                        "image": Image(name="debian-12"),
+                    }
+                    for name in "abcd"
+                ],
+                concurrency=1,
+            )
+        )
+
+        assert sorted(o.spec["name"] for o in results) == ["a", "b", "c", "d"]
+        results_by_name = {o.spec["name"]: o for o in results}
+
+        assert [
+            o.kwargs["json"]["name"]
+            for o in request_mock.call_args_list
+            if o.kwargs["method"] == "POST"
+        ] == ["a", "b", "b", "c", "d"]
+        assert results_by_name["c"].server is None
+        assert results_by_name["c"].error.code == "invalid_input"
+        for name in "abd":
+            result = results_by_name[name]
+            assert result.error is None
+            assert result.server.name == name
+            assert result.server.status == "running"
+            assert all(o.status == "success" for o in result.actions)
+        assert len(results_by_name["a"].actions) == 2
+
+        # The actions of all the servers are polled together
+        assert [
+            o.kwargs["params"]["id"]
+            for o in request_mock.call_args_list
+            if o.kwargs["url"] == "/actions"
+        ] == [[1, 2], [2]]
+
+    def test_create_many_retried_uniqueness_error(self):
+        client = Client(token="TOKEN", poll_interval=0.0, poll_max_retries=3)
+        client._client._retry_interval_func = constant_backoff_function(0.0)
+        client._client._session = mock.MagicMock()
+        server = {"id": 11, "name": "a", "status": "running"}
+        client._client._session.request.side_effect = [
+            # The client retries the timed out creation, that did create the server
+            requests.exceptions.Timeout(),
+            make_response(
+                HTTPStatus.CONFLICT,
+                json={"error": {"code": "uniqueness_error", "message": ""}},
+            ),
+            make_response(HTTPStatus.OK, json={"servers": [server]}),
+            make_response(HTTPStatus.OK, json={"actions": []}),
+            make_response(HTTPStatus.OK, json={"server": server}),
+        ]
+
+        results = list(
+            client.servers.create_many(
+                [
+                    {
+                        "name": "a",
+                        "server_type": ServerType(name="cx22"),
+                        "image": Image(name="debian-12"),
+                    }
+                ]
+            )
+        )
+
+        assert [(o.server.id, o.error) for o in results] == [(11, None)]
+        assert [
+            (o.kwargs["method"], o.kwargs["url"], o.kwargs.get("params"))
+            for o in client._client._session.request.call_args_list
+        ] == [
+            ("POST", "https://api.hetzner.cloud/v1/servers", None),
+            ("POST", "https://api.hetzner.cloud/v1/servers", None),
+            ("GET", "https://api.hetzner.cloud/v1/servers", {"name": "a"}),
+            (
+                "GET",
+                "https://api.hetzner.cloud/v1/servers/11/actions",
+                {"status": ["running"], "page": 1, "per_page": 50},
+            ),
+            ("GET", "https://api.hetzner.cloud/v1/servers/11", None),
+        ]
+
+    def test_create_many_reload_failed(
+        self,
+        request_router: RequestRouter,
+        servers_client: ServersClient,
+    ):
+        for id, name in ((11, "a"), (12, "b")):
+            request_router.add(
+                "POST",
+                "/servers",
+                {
+                    "server": {"id": id, "name": name, "status": "initializing"},
+                    "action": request_router.add_action(id, "success"),
+                    "next_actions": [],
+                    "root_password": None,
+                },
+            )
+        request_router.add("GET", "/servers/11", requests.exceptions.ConnectionError())
+        request_router.add(
+            "GET",
+            "/servers/12",
+            {"server": {"id": 12, "name": "b", "status": "running"}},
+        )
+
+        results = list(
+            servers_client.create_many(
+                [
+                    {
+                        "name": name,
+                        "server_type": ServerType(name="cx22"),
+                        "image": Image(name="debian-12"),
+                    }
+                    for name in "ab"
+                ],
+                concurrency=1,
+            )
+        )
+
+        results_by_name = {o.spec["name"]: o for o in results}
+        # The server returned on creation is kept
+        assert results_by_name["a"].server.status == "initializing"
+        assert isinstance(
+            results_by_name["a"].error, requests.exceptions.ConnectionError
+        )
+        assert results_by_name["b"].server.status == "running"
+        assert results_by_name["b"].error is None
+
+    def test_create_many_failed(
+        self,
+        request_router: RequestRouter,
+        servers_client: ServersClient,
+    ):
+        request_router.add(
+            "POST",
+            "/servers",
+            {
+                "server": {"id": 11, "name": "a", "status": "initializing"},
+                "action": request_router.add_action(1, "running", "error"),
+                "next_actions": [],
+                "root_password": None,
+            },
+            {
+                "server": {"id": 12, "name": "b", "status": "initializing"},
+                "action": request_router.add_action(2, "running"),
+                "next_actions": [],
+                "root_password": None,
+            },
+        )
+
+        results = list(
+            servers_client.create_many(
+                [
+                    {
+                        "name": name,
+                        "server_type": ServerType(name="cx22"),
+                        "image": Image(name="debian-12"),
+                    }
+                    for name in "ab"
+                ],
+                concurrency=1,
+            )
+        )
+
+        assert [(o.spec["name"], type(o.error)) for o in results] == [
+            ("a", ActionFailedException),
+            ("b", ActionTimeoutException),
+        ]
+        assert results[0].server.status == "initializing"
+
+    @staticmethod
+    def web_servers(status="running", ids=(1, 2, 3, 4)):
+        return {
+            "servers": [{"id": id, "name": f"web-{id}", "status": status} for id in ids]
+        }
+
+    @staticmethod
+    def calls(request_mock, method, url=None):
+        return [
+            o.kwargs
+            for o in request_mock.call_args_list
+            if o.kwargs["method"] == method and url in (None, o.kwargs["url"])
+        ]
+
+    def test_reboot_many(
+        self,
+        request_mock: mock.MagicMock,
+        request_router: RequestRouter,
+        servers_client: ServersClient,
+    ):
+        request_router.add("GET", "/servers", self.web_servers())
+        for id in range(1, 5):
+            request_router.add(
+                "POST",
+                f"/servers/{id}/actions/reboot",
+                {"action": request_router.add_action(id, "running", "success")},
+            )
+        batches = []
+
+        def health_check(servers):
+            batches.append([o.id for o in servers])
+            return True
+
+        results = servers_client.reboot_many(
+            label_selector="role=web",
+            max_unavailable=3,
+            health_check=health_check,
+        )
+
+        assert [(o.server.id, o.action.id, o.error) for o in results] == [
+            (1, 1, None),
+            (2, 2, None),
+            (3, 3, None),
+            (4, 4, None),
+        ]
+        posts = [o["url"] for o in self.calls(request_mock, "POST")]
+        assert sorted(posts[:3]) == [
+            "/servers/1/actions/reboot",
+            "/servers/2/actions/reboot",
+            "/servers/3/actions/reboot",
+        ]
+        assert posts[3:] == ["/servers/4/actions/reboot"]
+        assert batches == [[1, 2, 3], [4]]
+        # The actions of a batch are polled together
+        assert [
+            o["params"]["id"] for o in self.calls(request_mock, "GET", "/actions")
+        ] == [
+            [1, 2, 3],
+            [4],
+        ]
+        # The servers are already running, their status is not checked
+        assert [o["params"] for o in self.calls(request_mock, "GET", "/servers")] == [
+            {"label_selector": "role=web", "page": 1, "per_page": 50},
+        ]
+
+    def test_shutdown_many(
+        self,
+        request_mock: mock.MagicMock,
+        request_router: RequestRouter,
+        servers_client: ServersClient,
+    ):
+        request_router.add("GET", "/servers", self.web_servers("off", (1, 5)))
+        for id in (1, 5):
+            request_router.add(
+                "POST",
+                f"/servers/{id}/actions/shutdown",
+                {"action": request_router.add_action(id, "success")},
+            )
+
+        results = servers_client.shutdown_many([Server(id=1), Server(id=5)])
+
+        assert [(o.server.id, o.server.status, o.error) for o in results] == [
+            (1, "off", None),
+            (5, "off", None),
+        ]
+        assert [o["params"] for o in self.calls(request_mock, "GET", "/servers")] == [
+            {"status": ["off"], "page": 1, "per_page": 50},
+        ]
+
+    def test_power_off_many_failed(
+        self,
+        request_mock: mock.MagicMock,
+        request_router: RequestRouter,
+        servers_client: ServersClient,
+    ):
+        request_router.add(
+            "GET", "/servers", self.web_servers(), self.web_servers("off", (1,))
+        )
+        for id, status in ((1, "success"), (2, "error")):
+            request_router.add(
+                "POST",
+                f"/servers/{id}/actions/poweroff",
+                {"action": request_router.add_action(id, "running", status)},
+            )
+
+        results = servers_client.power_off_many(
+            label_selector="role=web",
+            max_unavailable=2,
+        )
+
+        # The rollout stops after the failed batch
+        assert [(o.server.id, type(o.error)) for o in results] == [
+            (1, type(None)),
+            (2, ActionFailedException),
+            (3, ServerNotStartedException),
+            (4, ServerNotStartedException),
+        ]
+        assert results[2].action is None
+        assert sorted(o["url"] for o in self.calls(request_mock, "POST")) == [
+            "/servers/1/actions/poweroff",
+            "/servers/2/actions/poweroff",
+        ]
+
+    def test_power_on_many_status_timeout(
+        self,
+        request_router: RequestRouter,
+        servers_client: ServersClient,
+    ):
+        request_router.add(
+            "GET",
+            "/servers",
+            self.web_servers("off"),
+            # Server 1 never reaches the running status
+            self.web_servers(ids=(2, 3, 4)),
+        )
+        for id in range(1, 5):
+            request_router.add(
+                "POST",
+                f"/servers/{id}/actions/poweron",
+                {"action": request_router.add_action(id, "success")},
+            )
+
+        results = servers_client.power_on_many(label_selector="role=web")
+
+        assert [o.server.id for o in results] == [1, 2, 3, 4]
+        assert isinstance(results[0].error, ServerStatusTimeoutException)
+        assert [(o.server.status, o.error) for o in results[1:]] == [
+            ("running", None)
+        ] * 3
+
+    def test_reset_many_health_check(
+        self,
+        request_mock: mock.MagicMock,
+        request_router: RequestRouter,
+        servers_client: ServersClient,
+    ):
+        request_router.add("GET", "/servers", self.web_servers())
+        request_router.add(
+            "POST",
+            "/servers/1/actions/reset",
+            {"action": request_router.add_action(1, "success")},
+        )
+
+        results = servers_client.reset_many(
+            label_selector="role=web",
+            max_unavailable=1,
+            health_check=lambda servers: False,
+        )
+
+        assert [(o.server.id, type(o.error)) for o in results] == [
+            (1, ServerHealthCheckException),
+            (2, ServerNotStartedException),
+            (3, ServerNotStartedException),
+            (4, ServerNotStartedException),
+        ]
+        assert results[0].error.servers == [results[0].server]
+        assert [o["url"] for o in self.calls(request_mock, "POST")] == [
+            "/servers/1/actions/reset"
+        ]
+        assert len(self.calls(request_mock, "GET", "/servers")) == 1
+
+    def test_action_many_without_servers(self, servers_client: ServersClient):
+        with pytest.raises(ValueError):
+            servers_client.reboot_many()
+
+    def test_action_many_max_unavailable(
+        self,
+        request_mock: mock.MagicMock,
+        servers_client: ServersClient,
+    ):
+        with pytest.raises(ValueError, match="max_unavailable"):
+            servers_client.reboot_many(label_selector="role=web", max_unavailable=0)
+        request_mock.assert_not_called()
+
+    _COMMANDS = ("poweroff", "shutdown", "rebuild", "change_type", "poweron")
+
+    @staticmethod
+    def server(id, status="running", placement_group=None):
+        return {
+            "server": {
+                "id": id,
+                "name": f"web-{id}",
+                "status": status,
+                "placement_group": placement_group and {"id": placement_group},
+            }
+        }
+
+    @classmethod
+    def add_command(cls, request_router, id, command, *statuses, **response):
+        """
+        Adds a server action, its ID being derived from the server ID and the command.
+        """
+        action = request_router.add_action(
+            id * 10 + cls._COMMANDS.index(command),
+            *(statuses or ("running", "success")),
+            command=command,
+        )
+        request_router.add(
+            "POST",
+            f"/servers/{id}/actions/{command}",
+            {"action": action, **response},
+        )
+
+    def test_rebuild_many(
+        self,
+        request_mock: mock.MagicMock,
+        request_router: RequestRouter,
+        servers_client: ServersClient,
+    ):
+        request_router.add("GET", "/servers/1", self.server(1, placement_group=7))
+        request_router.add("GET", "/servers/2", self.server(2, placement_group=7))
+        request_router.add("GET", "/servers/3", self.server(3, placement_group=8))
+        request_router.add("GET", "/servers/4", self.server(4, "off"))
+        for id in (1, 2, 3):
+            self.add_command(request_router, id, "poweroff")
+            self.add_command(request_router, id, "poweron")
+        for id in (1, 2, 3, 4):
+            self.add_command(request_router, id, "rebuild", root_password="password")
+
+        results = servers_client.rebuild_many(
+            Image(name="debian-12"),
+            [Server(id=1), Server(id=2), Server(id=3), Server(id=4)],
+            parallelism=3,
+        )
+
+        assert [(o.server.id, o.error) for o in results] == [
+            (1, None),
+            (2, None),
+            (3, None),
+            (4, None),
+        ]
+        assert [o.command for o in results[0].actions] == [
+            "poweroff",
+            "rebuild",
+            "poweron",
+        ]
+        assert [o.command for o in results[3].actions] == ["rebuild"]
+        assert all(o.status == "success" for r in results for o in r.actions)
+        assert results[0].root_password == "password"
+
+        posts = [o["url"] for o in self.calls(request_mock, "POST")]
+        # Servers of the same placement group are not rebuilt at the same time
+        assert posts[:3] == [
+            "/servers/1/actions/poweroff",
+            "/servers/3/actions/poweroff",
+            "/servers/4/actions/rebuild",
+        ]
+        assert posts.index("/servers/2/actions/poweroff") > posts.index(
+            "/servers/1/actions/poweron"
+        )
+        # The actions of all the servers in progress are polled together
+        polls = self.calls(request_mock, "GET", "/actions")
+        assert polls[0]["params"]["id"] == [10, 30, 42]
+
+    def test_change_type_many_failed(
+        self,
+        request_mock: mock.MagicMock,
+        request_router: RequestRouter,
+        servers_client: ServersClient,
+    ):
+        request_router.add(
+            "GET", "/servers", self.web_servers(), self.web_servers("off", (1,))
+        )
+        self.add_command(request_router, 1, "shutdown")
+        self.add_command(request_router, 1, "change_type", "running", "error")
+
+        results = servers_client.change_type_many(
+            ServerType(name="cx32"),
+            False,
+            label_selector="role=web",
+            parallelism=1,
+        )
+
+        assert [o.server.id for o in results] == [1, 2, 3, 4]
+        assert isinstance(results[0].error, ActionFailedException)
+        # The remaining servers are not started once a server failed
+        assert all(isinstance(o.error, ServerNotStartedException) for o in results[1:])
+        assert [o["url"] for o in self.calls(request_mock, "POST")] == [
+            "/servers/1/actions/shutdown",
+            "/servers/1/actions/change_type",
+        ]
+
+    def test_change_type_many_max_failures(
+        self,
+        request_router: RequestRouter,
+        servers_client: ServersClient,
+    ):
+        request_router.add(
+            "GET", "/servers", self.web_servers(), self.web_servers("off")
+        )
+        for id in (1, 2, 3, 4):
+            self.add_command(request_router, id, "shutdown")
+            self.add_command(request_router, id, "poweron")
+        self.add_command(request_router, 1, "change_type", "running", "error")
+        for id in (2, 3, 4):
+            self.add_command(request_router, id, "change_type")
+
+        results = servers_client.change_type_many(
+            ServerType(name="cx32"),
+            True,
+            label_selector="role=web",
+            parallelism=1,
+            max_failures=1,
+        )
+
+        assert [(o.server.id, o.error is None) for o in results] == [
+            (1, False),
+            (2, True),
+            (3, True),
+            (4, True),
+        ]
+
+    @pytest.mark.parametrize(
+        ("off", "shutdown_timeout", "commands"),
+        [
+            ([(), (1,)], 300.0, ["shutdown", "change_type", "poweron"]),
+            (
+                [()],
+                0.0,
+                ["shutdown", "poweroff", "change_type", "poweron"],
+            ),
+        ],
+    )
+    def test_change_type_many_shutdown(
+        self,
+        request_mock: mock.MagicMock,
+        request_router: RequestRouter,
+        servers_client: ServersClient,
+        off,
+        shutdown_timeout,
+        commands,
+    ):
+        request_router.add(
+            "GET",
+            "/servers",
+            self.web_servers(ids=(1,)),
+            *(self.web_servers("off", o) for o in off),
+        )
+        for command in self._COMMANDS:
+            self.add_command(request_router, 1, command)
+
+        results = servers_client.change_type_many(
+            ServerType(name="cx32"),
+            False,
+            label_selector="role=web",
+            shutdown_timeout=shutdown_timeout,
+        )
+
+        assert results[0].error is None
+        assert [o.command for o in results[0].actions] == commands
+        assert [o["url"] for o in self.calls(request_mock, "POST")] == [
+            f"/servers/1/actions/{o}" for o in commands
+        ]
+        # The servers waiting to be off are checked with a list request
+        checks = self.calls(request_mock, "GET", "/servers")[1:]
+        assert len(checks) == len(off)
+        assert checks[0]["params"] == {
+            "label_selector": "role=web",
+            "status": ["off"],
+            "page": 1,
+            "per_page": 50,
+        }
+
+    def test_change_type_many_errors(
+        self,
+        request_router: RequestRouter,
+        servers_client: ServersClient,
+    ):
+        request_router.add(
+            "GET",
+            "/servers",
+            self.web_servers(ids=(1, 2, 3)),
+            # The failed check is retried on the next poll
+            requests.exceptions.ConnectionError(),
+            self.web_servers("off", (1,)),
+        )
+        request_router.add(
+            "POST", "/servers/2/actions/shutdown", requests.exceptions.Timeout()
+        )
+        for command in self._COMMANDS:
+            self.add_command(request_router, 1, command)
+        # The first poll of the actions fails, the actions are polled again
+        actions = request_router._routes[("GET", "/actions")]
+        actions.insert(0, requests.exceptions.ConnectionError())
+
+        results = servers_client.change_type_many(
+            ServerType(name="cx32"),
+            False,
+            label_selector="role=web",
+        )
+
+        assert [(o.server.id, type(o.error)) for o in results] == [
+            (1, type(None)),
+            (2, requests.exceptions.Timeout),
+            (3, ServerNotStartedException),
+        ]
+        assert [o.command for o in results[0].actions] == [
+            "shutdown",
+            "change_type",
+            "poweron",
+        ]
+
+    def test_change_type_many_check_failed(
+        self,
+        request_router: RequestRouter,
+        servers_client: ServersClient,
+    ):
+        request_router.add(
+            "GET",
+            "/servers",
+            self.web_servers(ids=(1,)),
+            requests.exceptions.ConnectionError(),
+        )
+        self.add_command(request_router, 1, "shutdown")
+
+        results = servers_client.change_type_many(
+            ServerType(name="cx32"),
+            False,
+            label_selector="role=web",
+            shutdown_timeout=0.0,
+        )
+
+        # The server is not powered off without knowing its status
+        assert isinstance(results[0].error, requests.exceptions.ConnectionError)
+        assert [o.command for o in results[0].actions] == ["shutdown"]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"parallelism": 0},
+            {"max_unavailable_per_placement_group": 0},
+        ],
+    )
+    def test_rollout_invalid(
+        self,
+        request_mock: mock.MagicMock,
+        servers_client: ServersClient,
+        kwargs,
+    ):
+        with pytest.raises(ValueError):
+            servers_client.rebuild_many(
+                Image(name="debian-12"), label_selector="role=web", **kwargs
+            )
+        request_mock.assert_not_called()
+
+    def test_wait_for_status(
+        self,
+        request_mock: mock.MagicMock,
+        request_router: RequestRouter,
+        servers_client: ServersClient,
+    ):
+        # Server 2 starts after the first poll, server 3 never starts
+        request_router.add(
+            "GET",
+            "/servers",
+            self.web_servers(ids=(1, 4)),
+            self.web_servers(ids=(1, 2, 4)),
+        )
+
+        results = servers_client.wait_for_status(
+            [Server(id=1), Server(id=2), Server(id=3)],
+            ["running"],
+            label_selector="role=web",
+        )
+
+        assert [(o.server.id, o.server.status) for o in results] == [
+            (1, "running"),
+            (2, "running"),
+            (3, None),
+        ]
+        assert [o.error for o in results[:2]] == [None, None]
+        assert isinstance(results[2].error, ServerStatusTimeoutException)
+        assert results[2].error.status == ["running"]
+        # A list request per poll, filtered by status and label selector
+        assert [o["params"] for o in self.calls(request_mock, "GET")] == [
+            {
+                "label_selector": "role=web",
+                "status": ["running"],
+                "page": 1,
+                "per_page": 50,
+            }
+        ] * 3
+
+    def test_wait_for_status_timeout(
+        self,
+        request_router: RequestRouter,
+        servers_client: ServersClient,
+    ):
+        request_router.add("GET", "/servers", {"servers": []})
+
+        results = servers_client.wait_for_status(
+            [Server(id=1)], ["running"], timeout=0.0
+        )
+
+        assert isinstance(results[0].error, ServerStatusTimeoutException)
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from hcloud import Client
+from hcloud.images import Image
+from hcloud.locations import Location
+from hcloud.server_types import ServerType
+from hcloud.servers import ServerPool, ServersClient
+
+from ..conftest import RequestRouter
+
+TEMPLATE = (ServerType(name="cx22"), Image(name="debian-12"), Location(name="fsn1"))
+LABELS = {"server-pool": "pool", "server-pool-template": "cx22.debian-12.fsn1"}
+
+
+def make_server(id: int, name: str, status: str = "off", labels=None):
+    return {"id": id, "name": name, "status": status, "labels": labels or {}}
+
+
+class TestServerPool:
+    @pytest.fixture()
+    def resource_client(self, client: Client):
+        return client.servers
+
+    def test_refill(
+        self,
+        request_mock: mock.MagicMock,
+        request_router: RequestRouter,
+        resource_client: ServersClient,
+    ):
+        for id in (1, 2):
+            request_router.add(
+                "POST",
+                "/servers",
+                {
+                    "server": make_server(id, f"pool-{id}", "initializing", LABELS),
+                    "action": request_router.add_action(id, "running", "success"),
+                    "next_actions": [],
+                    "root_password": None,
+                },
+            )
+            request_router.add(
+                "GET",
+                f"/servers/{id}",
+                {"server": make_server(id, f"pool-{id}", "off", LABELS)},
+            )
+        pool = ServerPool(
+            resource_client,
+            "pool",
+            [TEMPLATE],
+            size=2,
+            create_options={"user_data": "#cloud-config"},
+        )
+
+        created = pool.refill()
+
+        assert sorted(o.id for o in created) == [1, 2]
+        assert [o.status for o in created] == ["off", "off"]
+        assert pool.available(*TEMPLATE) == 2
+        creations = [
+            o.kwargs["json"]
+            for o in request_mock.call_args_list
+            if o.kwargs["method"] == "POST"
+        ]
+        assert len(creations) == 2
+        for data in creations:
+            assert data["name"].startswith("pool-")
+            assert data["server_type"] == "cx22"
+            assert data["image"] == "debian-12"
+            assert data["location"] == "fsn1"
+            assert data["labels"] == LABELS
+            assert data["start_after_create"] is False
+            assert data["user_data"] == "#cloud-config"
+
+        call_count = request_mock.call_count
+        assert pool.refill() == []
+        assert request_mock.call_count == call_count
+
+    def test_load(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: ServersClient,
+    ):
+        request_mock.return_value = {
+            "servers": [
+                make_server(1, "pool-1", "off", LABELS),
+                make_server(2, "pool-2", "off", {"server-pool": "pool"}),
+            ]
+        }
+        pool = ServerPool(resource_client, "pool", [TEMPLATE])
+
+        pool.load()
+
+        request_mock.assert_called_once_with(
+            method="GET",
+            url="/servers",
+            params={
+                "label_selector": "server-pool=pool",
+                "status": ["off"],
+                "page": 1,
+                "per_page": 50,
+            },
+        )
+        assert pool.available(*TEMPLATE) == 1
+        assert pool.refill() == []
+
+    def test_acquire(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: ServersClient,
+    ):
+        request_mock.side_effect = [
+            {"servers": [make_server(1, "pool-1", "off", LABELS)]},
+            {"server": make_server(1, "web-1", "off", {"role": "web"})},
+            {"action": {"id": 1, "status": "running"}},
+            {"action": {"id": 1, "status": "success"}},
+            {"server": make_server(1, "web-1", "running", {"role": "web"})},
+        ]
+        pool = ServerPool(resource_client, "pool", [TEMPLATE])
+        pool.load()
+
+        server = pool.acquire(*TEMPLATE, name="web-1", labels={"role": "web"})
+
+        assert request_mock.call_args_list[1:] == [
+            mock.call(
+                method="PUT",
+                url="/servers/1",
+                json={"name": "web-1", "labels": {"role": "web"}},
+            ),
+            mock.call(method="POST", url="/servers/1/actions/poweron"),
+            mock.call(method="GET", url="/actions/1"),
+            mock.call(method="GET", url="/servers/1"),
+        ]
+        assert server.id == 1
+        assert server.name == "web-1"
+        assert server.labels == {"role": "web"}
+        assert server.status == "running"
+        assert pool.available(*TEMPLATE) == 0
+
+        # An empty pool creates the server right away
+        request_mock.reset_mock()
+        request_mock.side_effect = [
+            {
+                "server": make_server(2, "web-2", "initializing"),
+                "action": {"id": 2, "status": "running"},
+                "next_actions": [],
+                "root_password": None,
+            },
+            {"actions": [{"id": 2, "status": "success"}]},
+            {"server": make_server(2, "web-2", "running")},
+        ]
+
+        server = pool.acquire(*TEMPLATE, name="web-2")
+
+        assert request_mock.call_args_list[0].kwargs["json"]["name"] == "web-2"
+        assert request_mock.call_args_list[0].kwargs["json"]["labels"] == {}
+        assert request_mock.call_args_list[0].kwargs["json"]["start_after_create"]
+        assert server.name == "web-2"
+        assert server.status == "running"
+
+    def test_acquire_unknown(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: ServersClient,
+    ):
+        pool = ServerPool(resource_client, "pool", [TEMPLATE])
+
+        with pytest.raises(ValueError, match="template 'cx32.debian-12.fsn1'"):
+            pool.acquire(ServerType(name="cx32"), *TEMPLATE[1:])
+        request_mock.assert_not_called()
+
+    def test_start(
+        self,
+        request_router: RequestRouter,
+        resource_client: ServersClient,
+    ):
+        request_router.add(
+            "POST",
+            "/servers",
+            {
+                "server": make_server(1, "pool-1", "initializing", LABELS),
+                "action": request_router.add_action(1, "success"),
+                "next_actions": [],
+                "root_password": None,
+            },
+        )
+        request_router.add(
+            "GET", "/servers/1", {"server": make_server(1, "pool-1", "off", LABELS)}
+        )
+        pool = ServerPool(resource_client, "pool", [TEMPLATE])
+
+        pool.start(interval=0.01)
+        try:
+            for _ in range(100):
+                if pool.available(*TEMPLATE):
+                    break
+                pool._wake.wait(0.01)
+        finally:
+            pool.stop()
+
+        assert pool.available(*TEMPLATE) == 1
+        assert pool._thread is None
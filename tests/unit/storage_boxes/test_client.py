@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from copy import deepcopy
 from unittest import mock
 
 import pytest
 from dateutil.parser import isoparse
 
-from hcloud import Client
+from hcloud import APIException, Client
+from hcloud.actions import ActionFailedException
 from hcloud.locations import Location
 from hcloud.storage_box_types import StorageBoxType
 from hcloud.storage_boxes import (
@@ -19,8 +21,11 @@ from hcloud.storage_boxes import (
     StorageBoxesClient,
     StorageBoxSnapshot,
     StorageBoxSnapshotPlan,
+    StorageBoxSnapshotRetentionPlan,
+    StorageBoxSnapshotRetentionPolicy,
     StorageBoxSubaccount,
     StorageBoxSubaccountAccessSettings,
+    StorageBoxSubaccountSpec,
 )
 
 from ..conftest import BoundModelTestCase, assert_bound_action1
@@ -61,6 +66,8 @@ class TestBoundStorageBox(BoundModelTestCase):
         BoundStorageBox.update,
         BoundStorageBox.delete,
         BoundStorageBox.get_folders,
+        BoundStorageBox.walk_folders,
+        BoundStorageBox.get_folder_tree,
         BoundStorageBox.change_protection,
         BoundStorageBox.change_type,
         BoundStorageBox.disable_snapshot_plan,
@@ -81,6 +88,7 @@ class TestBoundStorageBox(BoundModelTestCase):
         BoundStorageBox.get_subaccount_by_name,
         BoundStorageBox.get_subaccount_by_username,
         BoundStorageBox.get_subaccount_list,
+        BoundStorageBox.provision_subaccounts,
     ]
 
     @pytest.fixture()
@@ -498,6 +506,89 @@ class TestStorageBoxClient:
 
         assert result.folders == ["dir1", "dir2"]
 
+    @pytest.fixture()
+    def folders_request_mock(self, request_mock: mock.MagicMock) -> mock.MagicMock:
+        folders = {
+            None: ["dir1", "dir2"],
+            "dir1": ["sub1", "sub2"],
+            "dir1/sub1": ["deep"],
+            "dir1/sub1/deep": [],
+            "dir1/sub2": [],
+            "dir2": [],
+        }
+
+        def side_effect(method, url, params):
+            return {"folders": folders[params.get("path")]}
+
+        request_mock.side_effect = side_effect
+        return request_mock
+
+    def test_walk_folders(
+        self,
+        folders_request_mock: mock.MagicMock,
+        resource_client: StorageBoxesClient,
+    ):
+        result = list(resource_client.walk_folders(StorageBox(id=42), concurrency=2))
+
+        assert folders_request_mock.call_count == 6
+        assert sorted((o.path, o.depth) for o in result) == [
+            ("", 0),
+            ("dir1", 1),
+            ("dir1/sub1", 2),
+            ("dir1/sub1/deep", 3),
+            ("dir1/sub2", 2),
+            ("dir2", 1),
+        ]
+        assert all(o.error is None for o in result)
+
+    def test_walk_folders_max_depth(
+        self,
+        folders_request_mock: mock.MagicMock,
+        resource_client: StorageBoxesClient,
+    ):
+        result = list(
+            resource_client.walk_folders(StorageBox(id=42), path="dir1", max_depth=1)
+        )
+
+        assert sorted(o.path for o in result) == ["dir1", "dir1/sub1", "dir1/sub2"]
+
+    def test_walk_folders_error(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: StorageBoxesClient,
+    ):
+        error = APIException(code="not_found", message="Not found", details=None)
+        request_mock.side_effect = [
+            {"folders": ["dir1", "dir2"]},
+            error,
+            {"folders": []},
+        ]
+
+        tree = resource_client.get_folder_tree(StorageBox(id=42), concurrency=1)
+
+        assert len(tree) == 3
+        assert [o.path for o in tree.errors] == ["dir1"]
+        assert tree.errors[0].error is error
+        assert tree.get_subfolders("") == ["dir1", "dir2"]
+        assert request_mock.call_count == 3
+
+    def test_get_folder_tree(
+        self,
+        folders_request_mock: mock.MagicMock,
+        resource_client: StorageBoxesClient,
+    ):
+        tree = resource_client.get_folder_tree(StorageBox(id=42))
+
+        assert len(tree) == 6
+        assert "dir1/sub1/deep" in tree
+        assert tree.get("dir1").folders == ["sub1", "sub2"]
+        assert sorted(tree.get_subfolders("dir1")) == [
+            "dir1/sub1",
+            "dir1/sub1/deep",
+            "dir1/sub2",
+        ]
+        assert tree.errors == []
+
     def test_change_protection(
         self,
         request_mock: mock.MagicMock,
@@ -880,6 +971,93 @@ class TestStorageBoxClient:
 
         assert_bound_action1(result.action, resource_client._parent.actions)
 
+    def test_plan_snapshot_retention(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: StorageBoxesClient,
+        storage_box_snapshot1,
+        storage_box_snapshot2,
+    ):
+        request_mock.side_effect = lambda **kwargs: {
+            "snapshots": [dict(storage_box_snapshot1), dict(storage_box_snapshot2)],
+        }
+        policy = StorageBoxSnapshotRetentionPolicy(
+            keep_last=1,
+            label_selector="key=value",
+        )
+
+        plans = resource_client.plan_snapshot_retention(
+            [StorageBox(id=42), StorageBox(id=43)], policy
+        )
+
+        request_mock.assert_any_call(
+            method="GET",
+            url="/storage_boxes/43/snapshots",
+            params={"label_selector": "key=value"},
+        )
+        assert request_mock.call_count == 2
+        assert [o.storage_box.id for o in plans] == [42, 43]
+        assert [o.id for o in plans[0].keep] == [35]
+        assert [o.id for o in plans[0].delete] == [34]
+
+    def test_apply_snapshot_retention(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: StorageBoxesClient,
+        storage_box_snapshot1,
+        storage_box_snapshot2,
+        action1_running,
+        action1_success,
+    ):
+        snapshot1 = BoundStorageBoxSnapshot(resource_client, storage_box_snapshot1)
+        snapshot2 = BoundStorageBoxSnapshot(resource_client, storage_box_snapshot2)
+        plans = [
+            StorageBoxSnapshotRetentionPlan(
+                StorageBox(id=42), keep=[], delete=[snapshot1, snapshot2]
+            )
+        ]
+        request_mock.side_effect = [
+            {"action": action1_running},
+            APIException(code="locked", message="Locked", details=None),
+            {"actions": [action1_success]},
+        ]
+
+        results = resource_client.apply_snapshot_retention(plans, concurrency=1)
+
+        assert request_mock.call_args_list == [
+            mock.call(method="DELETE", url="/storage_boxes/42/snapshots/34"),
+            mock.call(method="DELETE", url="/storage_boxes/42/snapshots/35"),
+            mock.call(
+                method="GET",
+                url="/storage_boxes/actions",
+                params={"id": [1], "per_page": 1},
+            ),
+        ]
+        assert [o.snapshot for o in results] == [snapshot1, snapshot2]
+        assert results[0].action.status == "success"
+        assert results[0].error is None
+        assert results[1].action is None
+        assert results[1].error.code == "locked"
+
+    def test_apply_snapshot_retention_dry_run(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: StorageBoxesClient,
+        storage_box_snapshot1,
+    ):
+        snapshot1 = BoundStorageBoxSnapshot(resource_client, storage_box_snapshot1)
+        plans = [
+            StorageBoxSnapshotRetentionPlan(
+                StorageBox(id=42), keep=[], delete=[snapshot1]
+            )
+        ]
+
+        results = resource_client.apply_snapshot_retention(plans, dry_run=True)
+
+        request_mock.assert_not_called()
+        assert [o.snapshot for o in results] == [snapshot1]
+        assert results[0].action is None
+
     # Subaccounts
     ###########################################################################
 
@@ -1207,3 +1385,148 @@ class TestStorageBoxClient:
         )
 
         assert_bound_action1(action, resource_client._parent.actions)
+
+    def test_provision_subaccounts(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: StorageBoxesClient,
+        storage_box_subaccount1,
+        action1_running,
+        action2_running,
+        action1_success,
+        action2_error,
+    ):
+        specs = [
+            # Exists, but the home directory differs
+            StorageBoxSubaccountSpec(
+                username="u42-sub1",
+                home_directory="backup/",
+                password="secret",
+                access_settings=StorageBoxSubaccountAccessSettings(ssh_enabled=True),
+            ),
+            # Does not exist
+            StorageBoxSubaccountSpec(
+                name="subaccount2",
+                home_directory="tmp/",
+                password="secret",
+            ),
+            # Lookup fails
+            StorageBoxSubaccountSpec(
+                name="subaccount3",
+                home_directory="tmp/",
+                password="secret",
+            ),
+            # Username not found, and no name to create it with
+            StorageBoxSubaccountSpec(
+                username="u42-sub4",
+                home_directory="tmp/",
+                password="secret",
+            ),
+            # Username not found, but found by name
+            StorageBoxSubaccountSpec(
+                username="u42-sub5",
+                name="subaccount1",
+                home_directory="tmp/",
+                password="secret",
+            ),
+        ]
+        request_mock.side_effect = [
+            {"subaccounts": [deepcopy(storage_box_subaccount1)]},
+            {"action": action1_running},
+            {"subaccounts": []},
+            {"subaccount": {"id": 46, "storage_box": 42}, "action": action2_running},
+            APIException(code="server_error", message="Error", details=None),
+            {"subaccounts": []},
+            {"subaccounts": []},
+            {"subaccounts": [deepcopy(storage_box_subaccount1)]},
+            {"actions": [action1_success, action2_error]},
+        ]
+
+        results = resource_client.provision_subaccounts(
+            StorageBox(42), specs, concurrency=1
+        )
+
+        assert request_mock.call_args_list == [
+            mock.call(
+                method="GET",
+                url="/storage_boxes/42/subaccounts",
+                params={"username": "u42-sub1"},
+            ),
+            mock.call(
+                method="POST",
+                url="/storage_boxes/42/subaccounts/45/actions/change_home_directory",
+                json={"home_directory": "backup/"},
+            ),
+            mock.call(
+                method="GET",
+                url="/storage_boxes/42/subaccounts",
+                params={"name": "subaccount2"},
+            ),
+            mock.call(
+                method="POST",
+                url="/storage_boxes/42/subaccounts",
+                json={
+                    "name": "subaccount2",
+                    "home_directory": "tmp/",
+                    "password": "secret",
+                },
+            ),
+            mock.call(
+                method="GET",
+                url="/storage_boxes/42/subaccounts",
+                params={"name": "subaccount3"},
+            ),
+            mock.call(
+                method="GET",
+                url="/storage_boxes/42/subaccounts",
+                params={"username": "u42-sub4"},
+            ),
+            mock.call(
+                method="GET",
+                url="/storage_boxes/42/subaccounts",
+                params={"username": "u42-sub5"},
+            ),
+            mock.call(
+                method="GET",
+                url="/storage_boxes/42/subaccounts",
+                params={"name": "subaccount1"},
+            ),
+            mock.call(
+                method="GET",
+                url="/storage_boxes/actions",
+                params={"id": [1, 2], "per_page": 2},
+            ),
+        ]
+
+        assert results[0].subaccount.id == 45
+        assert results[0].created is False
+        assert [o.id for o in results[0].actions] == [1]
+        assert results[0].error is None
+
+        assert results[1].subaccount.id == 46
+        assert results[1].created is True
+        assert [o.id for o in results[1].actions] == [2]
+        assert isinstance(results[1].error, ActionFailedException)
+
+        assert results[2].subaccount is None
+        assert results[2].error.code == "server_error"
+
+        assert results[3].subaccount is None
+        assert results[3].created is False
+        assert isinstance(results[3].error, ValueError)
+
+        assert results[4].subaccount.id == 45
+        assert results[4].created is False
+        assert results[4].error is None
+
+    def test_provision_subaccounts_without_name_and_username(
+        self,
+        request_mock: mock.MagicMock,
+        resource_client: StorageBoxesClient,
+    ):
+        with pytest.raises(ValueError):
+            resource_client.provision_subaccounts(
+                StorageBox(42),
+                [StorageBoxSubaccountSpec(home_directory="tmp/", password="secret")],
+            )
+        request_mock.assert_not_called()
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
+
 import pytest
 
-from hcloud.storage_boxes import StorageBox
+from hcloud.storage_boxes import (
+    StorageBox,
+    StorageBoxSnapshot,
+    StorageBoxSnapshotRetentionPolicy,
+)
 
 
 @pytest.mark.parametrize(
@@ -13,3 +19,48 @@ from hcloud.storage_boxes import StorageBox
 )
 def test_eq(value):
     assert value.__eq__(value)
+
+
+class TestStorageBoxSnapshotRetentionPolicy:
+    @pytest.fixture()
+    def snapshots(self) -> list[StorageBoxSnapshot]:
+        # Two snapshots a day, from 2025-01-01 to 2025-03-31
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        return [
+            StorageBoxSnapshot(
+                id=i,
+                created=(start + timedelta(hours=12 * i)).isoformat(),
+            )
+            for i in range(180)
+        ]
+
+    def test_requires_a_rule(self):
+        with pytest.raises(ValueError):
+            StorageBoxSnapshotRetentionPolicy(label_selector="key=value")
+
+    @pytest.mark.parametrize(
+        ("policy", "expected"),
+        [
+            (StorageBoxSnapshotRetentionPolicy(keep_last=3), [179, 178, 177]),
+            (StorageBoxSnapshotRetentionPolicy(keep_daily=2), [179, 177]),
+            (StorageBoxSnapshotRetentionPolicy(keep_weekly=3), [179, 177, 163]),
+            (StorageBoxSnapshotRetentionPolicy(keep_monthly=4), [179, 117, 61]),
+            (
+                StorageBoxSnapshotRetentionPolicy(keep_last=2, keep_monthly=2),
+                [179, 178, 117],
+            ),
+        ],
+    )
+    def test_select(self, snapshots, policy, expected):
+        keep, delete = policy.select(snapshots)
+
+        assert [o.id for o in keep] == expected
+        assert len(keep) + len(delete) == len(snapshots)
+        assert delete[0].id not in expected
+
+    def test_select_undated(self):
+        policy = StorageBoxSnapshotRetentionPolicy(keep_last=1)
+        keep, delete = policy.select([StorageBoxSnapshot(id=1)])
+
+        assert [o.id for o in keep] == [1]
+        assert delete == []